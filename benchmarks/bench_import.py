@@ -0,0 +1,70 @@
+"""Measure the import time of the provider with `python -X importtime`.
+
+Every run imports the provider in a fresh interpreter. The host time is the
+import of the openbb_core provider classes, which the platform pays with or
+without this extension; the extension time is the cumulative time of the
+module imported afterwards.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 5] [--module openbb_tushare.provider]
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Imported by the platform before any provider extension
+HOST_MODULES = ["openbb_core.provider.abstract.provider", "openbb_core.provider.abstract.fetcher"]
+
+# Modules that should only be imported once a fetcher runs
+HEAVY_MODULES = ["pandas", "numpy", "tushare", "requests", "openbb_tushare.utils"]
+
+LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def import_times(module: str) -> Tuple[int, int, List[str]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        Tuple[int, int, List[str]]: The host and the extension import time in µs,
+            and the heavy modules loaded.
+    """
+    check = (f"import {', '.join(HOST_MODULES)}; import sys, {module}; "
+             f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True, text=True, check=True,
+    )
+    # top level imports are the least indented, their cumulative time includes the nested imports
+    matches = [match for match in map(LINE_RE.match, completed.stderr.splitlines()) if match]
+    top_level = min(len(match.group(3)) for match in matches)
+    cumulative: Dict[str, int] = {
+        match.group(4): int(match.group(2)) for match in matches if len(match.group(3)) == top_level
+    }
+    package = module.split(".")[0]
+    host = sum(t for name, t in cumulative.items() if name.split(".")[0] == "openbb_core")
+    extension = sum(t for name, t in cumulative.items() if name.split(".")[0] == package)
+    loaded = [m for m in completed.stdout.strip().split(",") if m]
+    return host, extension, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="openbb_tushare.provider")
+    args = parser.parse_args()
+
+    hosts, extensions = [], []
+    for _ in range(args.runs):
+        host, extension, loaded = import_times(args.module)
+        hosts.append(host)
+        extensions.append(extension)
+
+    print(f"{args.module}, median of {args.runs} runs")
+    print(f"  openbb_core: {statistics.median(hosts) / 1000:8.1f} ms")
+    print(f"  extension:   {statistics.median(extensions) / 1000:8.1f} ms")
+    print(f"  heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+if __name__ == "__main__":
+    main()
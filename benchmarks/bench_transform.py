@@ -0,0 +1,51 @@
+"""Compare the validated and the fast transform path of the historical price fetcher.
+
+Usage:
+    python benchmarks/bench_transform.py [--symbols 100] [--years 20]
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from openbb_tushare.models.equity_historical import TushareEquityHistoricalData
+from openbb_tushare.utils.fast_transform import construct_models
+
+def make_bars(symbols: int, years: int) -> pd.DataFrame:
+    """Daily bars for `symbols` symbols over `years` years of trading days."""
+    dates = pd.bdate_range(end="2024-12-31", periods=years * 244)
+    rng = np.random.default_rng(0)
+    rows = len(dates) * symbols
+    close = rng.uniform(5, 50, rows)
+    return pd.DataFrame({
+        "date": np.tile(dates, symbols),
+        "open": close * 0.99,
+        "high": close * 1.01,
+        "low": close * 0.98,
+        "close": close,
+        "volume": rng.uniform(1e4, 1e6, rows),
+        "amount": rng.uniform(1e5, 1e7, rows),
+        "change": rng.normal(0, 0.5, rows),
+        "change_percent": rng.normal(0, 0.01, rows),
+    })
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--years", type=int, default=20)
+    args = parser.parse_args()
+
+    bars = make_bars(args.symbols, args.years)
+    print(f"{len(bars):,} rows of TushareEquityHistoricalData")
+
+    validated = timed(lambda: [TushareEquityHistoricalData.model_validate(d) for d in bars.to_dict(orient="records")])
+    fast = timed(lambda: construct_models(TushareEquityHistoricalData, bars))
+    print(f"model_validate per row: {validated:8.2f}s")
+    print(f"fast transform:         {fast:8.2f}s  ({validated / fast:.1f}x)")
+
+if __name__ == "__main__":
+    main()
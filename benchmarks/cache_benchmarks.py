@@ -0,0 +1,81 @@
+"""Benchmarks of the caches and the symbol helpers."""
+import os
+from unittest.mock import patch
+import pandas as pd
+from harness import benchmark
+
+HISTORY_SCHEMA = {"date": "TEXT PRIMARY KEY", "open": "REAL", "high": "REAL", "low": "REAL",
+                  "close": "REAL", "volume": "REAL", "amount": "REAL"}
+
+def history(rows: int = 5000) -> pd.DataFrame:
+    """About 20 years of daily bars of one symbol, in the cached format."""
+    from openbb_tushare.utils.mock_server import MockData
+    data = MockData().daily({"ts_code": "600036.SH", "start_date": "20050101", "end_date": "20241231"}).head(rows)
+    return data.rename(columns={"trade_date": "date", "vol": "volume"})[list(HISTORY_SCHEMA)]
+
+def history_cache():
+    from openbb_tushare.utils.table_cache import TableCache
+    return TableCache(HISTORY_SCHEMA, table_name="SH600036", primary_key="date", cache_name="equity_history")
+
+@benchmark("table_cache.write", items=5000)
+def table_cache_write():
+    cache, data = history_cache(), history()
+    return lambda: cache.write_dataframe(data)
+
+@benchmark("table_cache.read_date_range", items=5000)
+def table_cache_read():
+    cache = history_cache()
+    cache.write_dataframe(history())
+    return lambda: cache.fetch_date_range("19000101", "99991231")
+
+@benchmark("table_cache.read_date_range.memory", items=5000)
+def table_cache_read_memory():
+    cache = history_cache()
+    cache.write_dataframe(history())
+    cache.fetch_date_range("19000101", "99991231")
+    return lambda: cache.fetch_date_range("19000101", "99991231")
+
+@benchmark("table_cache.upsert", items=500)
+def table_cache_upsert():
+    cache, data = history_cache(), history()
+    cache.write_dataframe(data)
+    return lambda: cache.update_or_insert(data.head(500))
+
+def statement_cache():
+    from openbb_tushare.utils.blob_cache import BlobCache
+    cache = BlobCache(table_name="balance_sheet")
+    data = pd.DataFrame({f"item_{i}": range(80) for i in range(150)}, dtype=float)
+    return cache, data
+
+def blob_cache_reads(memory_mb: str):
+    cache, data = statement_cache()
+    symbols = [f"{600000 + i:06d}.SH" for i in range(100)]
+    for symbol in symbols:
+        cache.write_cached(symbol, "quarter", data)
+
+    def run():
+        with patch.dict(os.environ, {"TUSHARE_MEMORY_CACHE_MB": memory_mb}):
+            return [cache.read_cached(symbol, "quarter") for symbol in symbols]
+    return run
+
+@benchmark("blob_cache.hit", items=100)
+def blob_cache_hit():
+    # Hits of the SQLite tier
+    return blob_cache_reads("0")
+
+@benchmark("blob_cache.hit.memory", items=100)
+def blob_cache_hit_memory():
+    return blob_cache_reads("128")
+
+@benchmark("blob_cache.miss", items=100)
+def blob_cache_miss():
+    cache, _ = statement_cache()
+    symbols = [f"{600000 + i:06d}.SH" for i in range(100)]
+    return lambda: [cache.read_cached(symbol, "quarter") for symbol in symbols]
+
+@benchmark("normalize_symbol", items=100_000)
+def normalize_symbol():
+    from openbb_tushare.utils.tools import normalize_symbol as normalize
+    symbols = [f"{600000 + i % 1000:06d}" if i % 3 == 0 else f"{i % 1000:06d}.SZ" if i % 3 == 1 else f"{i % 1000:05d}.HK"
+               for i in range(100_000)]
+    return lambda: [normalize(symbol) for symbol in symbols]
@@ -0,0 +1,36 @@
+"""Benchmarks of decoding Tushare responses."""
+import json
+import pandas as pd
+from harness import benchmark
+
+ROWS = 100_000
+
+def response_body() -> bytes:
+    """A `daily` response of about 100,000 bars, as sent by Tushare."""
+    from openbb_tushare.utils.mock_server import MockData
+    mock = MockData()
+    codes = [f"{600000 + i:06d}.SH" for i in range(ROWS // 5000 + 1)]
+    data = pd.concat([mock.daily({"ts_code": code, "start_date": "20050101", "end_date": "20241231"})
+                      for code in codes])
+    data = data.head(ROWS)
+    return json.dumps({"code": 0, "msg": "", "data": {"fields": list(data.columns),
+                                                     "items": data.values.tolist()}}).encode()
+
+@benchmark("decode.daily.rows", repeat=5, items=ROWS)
+def decode_rows():
+    body = response_body()
+
+    def run():
+        # What tushare.pro.client.DataApi and the historical download did
+        data = json.loads(body)["data"]
+        frame = pd.DataFrame(data["items"], columns=data["fields"])
+        frame = frame.rename(columns={'trade_date': 'date', 'vol': 'volume', 'pct_chg': 'change_percent'})
+        return frame.drop(columns=['ts_code'])
+    return run
+
+@benchmark("decode.daily.columnar", repeat=5, items=ROWS)
+def decode_columnar():
+    from openbb_tushare.utils.ts_decode import decode, loads
+    from openbb_tushare.utils.ts_equity_historical import HISTORY_COLUMNS
+    body = response_body()
+    return lambda: decode(loads(body)["data"], rename=HISTORY_COLUMNS, drop=['ts_code'])
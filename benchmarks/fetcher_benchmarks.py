@@ -0,0 +1,84 @@
+"""Benchmarks of get_from_cache and of the fetcher transforms."""
+import os
+import pandas as pd
+from datetime import date
+from unittest.mock import patch
+from harness import benchmark
+
+START, END = date(2024, 1, 1), date(2024, 12, 31)
+TRANSFORM_SYMBOLS = 200
+TRANSFORM_ROWS = TRANSFORM_SYMBOLS * len(pd.bdate_range(START, END))
+
+def symbols(count: int):
+    return [f"{600000 + i:06d}.SH" for i in range(count)]
+
+def load_history(codes):
+    from openbb_tushare.utils.ts_equity_historical import get_from_cache
+    return [get_from_cache(code, START, END, api_key="bench") for code in codes]
+
+for count, repeat in ((1, 5), (100, 3), (1000, 1)):
+    tags = ["slow"] if count >= 1000 else []
+
+    @benchmark(f"get_from_cache.cold.{count}", repeat=repeat, items=count, tags=tags)
+    def get_from_cache_cold(count=count):
+        codes = symbols(count)
+        return lambda: load_history(codes)
+
+    @benchmark(f"get_from_cache.warm.{count}", repeat=repeat, items=count, tags=tags)
+    def get_from_cache_warm(count=count):
+        codes = symbols(count)
+        load_history(codes)
+        return lambda: load_history(codes)
+
+# Warm reads of each tier, without the memory tier in front
+WARM_TIERS = {
+    "sqlite": {"TUSHARE_MEMORY_CACHE_MB": "0"},
+    "price_store": {"TUSHARE_MEMORY_CACHE_MB": "0", "TUSHARE_PRICE_STORE": "1"},
+}
+
+for count, repeat in ((1, 5), (100, 3)):
+    for tier, env in WARM_TIERS.items():
+        @benchmark(f"get_from_cache.warm.{count}.{tier}", repeat=repeat, items=count)
+        def get_from_cache_warm_tier(count=count, env=env):
+            codes = symbols(count)
+            with patch.dict(os.environ, env):
+                # The first reads fill the price store
+                load_history(codes)
+                load_history(codes)
+
+            def run():
+                with patch.dict(os.environ, env):
+                    return load_history(codes)
+            return run
+
+def historical_bars():
+    """A year of daily bars of TRANSFORM_SYMBOLS symbols in the extracted format."""
+    from openbb_tushare.utils.mock_server import MockData
+    mock = MockData()
+    frames = [mock.daily({"ts_code": code, "start_date": "20240101", "end_date": "20241231"})
+              for code in symbols(TRANSFORM_SYMBOLS)]
+    data = pd.concat(frames, ignore_index=True)
+    data = data.rename(columns={"trade_date": "date", "vol": "volume", "pct_chg": "change_percent"})
+    data["date"] = pd.to_datetime(data["date"])
+    return data.drop(columns=["pre_close"])
+
+def transform(env: dict):
+    from openbb_tushare.models.equity_historical import TushareEquityHistoricalFetcher
+    data = historical_bars()
+
+    def run():
+        with patch.dict(os.environ, env):
+            return TushareEquityHistoricalFetcher.transform_data(None, data)
+    return run
+
+@benchmark("transform.historical.validated", repeat=3, items=TRANSFORM_ROWS)
+def transform_validated():
+    return transform({})
+
+@benchmark("transform.historical.fast", repeat=3, items=TRANSFORM_ROWS)
+def transform_fast():
+    return transform({"TUSHARE_FAST_TRANSFORM": "1"})
+
+@benchmark("transform.historical.columnar", repeat=3, items=TRANSFORM_ROWS)
+def transform_columnar():
+    return transform({"TUSHARE_COLUMNAR_RESULTS": "1"})
@@ -0,0 +1,142 @@
+"""Registry, timing and result files of the benchmark suite."""
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+@dataclass
+class Benchmark:
+    """A benchmark, `setup` prepares a fresh workspace and returns the function to time."""
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    repeat: int = 5
+    items: int = 0
+    tags: List[str] = field(default_factory=list)
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+def benchmark(name: str, repeat: int = 5, items: int = 0, tags: Optional[List[str]] = None):
+    """
+    Register a benchmark.
+
+    The decorated function runs before every repeat inside a fresh workspace,
+    an empty cache database and the fake Tushare API, and returns the function
+    whose run time is measured.
+
+    Args:
+        name (str): Unique name, e.g. "table_cache.read".
+        repeat (int): Number of timed runs.
+        items (int): Items processed per run, to report the throughput.
+        tags (List[str]): Tags to select benchmarks with, e.g. ["slow"].
+    """
+    def register(setup: Callable[[], Callable[[], Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark '{name}'.")
+        BENCHMARKS[name] = Benchmark(name, setup, repeat, items, tags or [])
+        return setup
+    return register
+
+class MockPro:
+    """The Tushare pro API answered in process by `mock_server.MockData`, without HTTP."""
+
+    def __init__(self):
+        from openbb_tushare.utils.mock_server import MockData
+        self._data = MockData()
+
+    def query(self, api_name: str, fields: str = "", **params) -> Any:
+        return self._data.query(api_name, params)
+
+    def __getattr__(self, api_name: str) -> Callable:
+        return lambda fields="", **params: self.query(api_name, fields, **params)
+
+@contextmanager
+def workspace() -> Iterator[str]:
+    """An empty cache database and the fake Tushare API, yields the database path."""
+    import openbb_tushare.utils as tushare_utils
+    import openbb_tushare.utils.ts_client as ts_client
+
+    with ExitStack() as stack:
+        directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="tushare-bench-"))
+        db_path = f"{directory}/equity.db"
+        pro = MockPro()
+        stack.enter_context(patch.object(tushare_utils, "get_cache_path", lambda: db_path))
+        stack.enter_context(patch.object(ts_client.ts, "pro_api", lambda token="": pro))
+        yield db_path
+
+def run_benchmark(bench: Benchmark) -> Dict[str, Any]:
+    """Time a benchmark, returns its statistics in seconds."""
+    times = []
+    for _ in range(bench.repeat):
+        with workspace():
+            func = bench.setup()
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    result = {
+        "repeat": bench.repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+    if bench.items:
+        result["items"] = bench.items
+        result["items_per_second"] = bench.items / result["median"]
+    return result
+
+def environment() -> Dict[str, str]:
+    """Versions and commit the results were measured with."""
+    import numpy
+    import pandas
+    import pydantic
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "pydantic": pydantic.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def save_results(path: str, results: Dict[str, Dict[str, Any]]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "benchmarks": results}, f, indent=2)
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["benchmarks"]
+
+def compare(
+        results: Dict[str, Dict[str, Any]],
+        baseline: Dict[str, Dict[str, Any]],
+        threshold: float = 0.1
+    ) -> List[Dict[str, Any]]:
+    """
+    Compare the median times with a baseline.
+
+    Returns:
+        List[Dict]: name, baseline, current, ratio and status (slower, faster or same)
+            for the benchmarks present in both.
+    """
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["median"] / baseline[name]["median"]
+        status = "slower" if ratio > 1 + threshold else "faster" if ratio < 1 - threshold else "same"
+        rows.append({"name": name, "baseline": baseline[name]["median"], "current": result["median"],
+                     "ratio": ratio, "status": status})
+    return rows
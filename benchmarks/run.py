@@ -0,0 +1,62 @@
+"""Run the benchmark suite and compare the results with a baseline.
+
+Usage:
+    python benchmarks/run.py                                  # all but the slow benchmarks
+    python benchmarks/run.py --all --output benchmarks/results/baseline.json
+    python benchmarks/run.py -k table_cache --compare benchmarks/results/baseline.json
+
+Every benchmark runs on an empty cache database with a local stand-in for the
+Tushare API, so results only depend on the code and the machine. Compare
+results measured on the same machine.
+"""
+import argparse
+import fnmatch
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# The per-request logs of the fetchers would bury the results.
+os.environ.setdefault("TUSHARE_LOG_LEVEL", "WARNING")
+
+from harness import BENCHMARKS, compare, load_results, run_benchmark, save_results  # noqa: E402
+import cache_benchmarks  # noqa: E402,F401  pylint: disable=unused-import
+import decode_benchmarks  # noqa: E402,F401  pylint: disable=unused-import
+import fetcher_benchmarks  # noqa: E402,F401  pylint: disable=unused-import
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="*", help="Glob of the benchmark names, e.g. 'blob_cache.*'.")
+    parser.add_argument("--all", action="store_true", help="Include the benchmarks tagged slow.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare the results with.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change reported as slower or faster.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with 1 if a benchmark is slower.")
+    args = parser.parse_args()
+
+    pattern = args.filter if any(c in args.filter for c in "*?[") else f"*{args.filter}*"
+    selected = [b for name, b in BENCHMARKS.items()
+                if fnmatch.fnmatch(name, pattern) and (args.all or "slow" not in b.tags)]
+
+    results = {}
+    for bench in selected:
+        result = run_benchmark(bench)
+        results[bench.name] = result
+        throughput = f"{result['items_per_second']:14,.0f} items/s" if "items_per_second" in result else ""
+        print(f"{bench.name:36} {result['median'] * 1000:10.2f} ms {throughput}", flush=True)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        save_results(args.output, results)
+
+    if args.compare:
+        rows = compare(results, load_results(args.compare), args.threshold)
+        print(f"\n{'benchmark':36} {'baseline':>10} {'current':>10} {'ratio':>7}")
+        for row in rows:
+            print(f"{row['name']:36} {row['baseline'] * 1000:8.2f}ms {row['current'] * 1000:8.2f}ms "
+                  f"{row['ratio']:6.2f}x {row['status']}")
+        if args.fail_on_regression and any(row["status"] == "slower" for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,22 @@
 """Tushare Balance Sheet Model."""
 
 # pylint: disable=unused-argument
-import pandas as pd
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.balance_sheet import (
     BalanceSheetData,
     BalanceSheetQueryParams,
 )
-from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_core.provider.utils.descriptions import (
+    DATA_DESCRIPTIONS,
+    QUERY_DESCRIPTIONS,
+)
 from pydantic import Field, field_validator
 
-from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class TushareBalanceSheetQueryParams(BalanceSheetQueryParams):
@@ -23,6 +26,8 @@ class TushareBalanceSheetQueryParams(BalanceSheetQueryParams):
     """
 
     __json_schema_extra__ = {
+        "symbol": {"multiple_items_allowed": True},
+        "fields": {"multiple_items_allowed": True},
         "period": {
             "choices": ["annual", "quarter"],
         }
@@ -35,7 +40,11 @@ class TushareBalanceSheetQueryParams(BalanceSheetQueryParams):
     limit: Optional[int] = Field(
         default=5,
         description=QUERY_DESCRIPTIONS.get("limit", ""),
-        le=5,
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        description="Fields to return, using the OpenBB names of the report items."
+        + " All available fields are returned by default.",
     )
     use_cache: bool = Field(
         default=True,
@@ -45,6 +54,8 @@ class TushareBalanceSheetQueryParams(BalanceSheetQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
@@ -53,6 +64,11 @@ class TushareBalanceSheetQueryParams(BalanceSheetQueryParams):
 class TushareBalanceSheetData(BalanceSheetData):
     """Tushare Balance Sheet Data."""
 
+    symbol: Optional[str] = Field(
+        default=None,
+        description=DATA_DESCRIPTIONS.get("symbol", ""),
+    )
+
     @field_validator("period_ending", mode="before", check_fields=False)
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
@@ -80,22 +96,26 @@ class TushareBalanceSheetFetcher(
         query: TushareBalanceSheetQueryParams,
         credentials: Optional[dict[str, str]],
         **kwargs: Any,
-    ) -> list[dict]:
+    ) -> "pd.DataFrame":
         """Extract the data from the Tushare endpoints."""
         # pylint: disable=import-outside-toplevel
         from openbb_tushare.utils.ts_balance_sheet import get_balance_sheet
         api_key = credentials.get("tushare_api_key") if credentials else ""
 
-        balance_sheet = get_balance_sheet(query.symbol, query.period, query.limit, query.use_cache, api_key=api_key)
+        fields = query.fields.split(",") if query.fields else None
+
+        balance_sheet = get_balance_sheet(query.symbol, query.period, query.limit, query.use_cache, api_key=api_key, fields=fields)
 
-        return balance_sheet.to_dict(orient="records")
+        return balance_sheet
 
     @staticmethod
     def transform_data(
         query: TushareBalanceSheetQueryParams,
-        data: list[dict],
+        data: "pd.DataFrame",
         **kwargs: Any,
-    ) -> list[TushareBalanceSheetData]:
+    ) -> Union[list[TushareBalanceSheetData], "pd.DataFrame"]:
         """Transform the data."""
-        return [TushareBalanceSheetData.model_validate(d) for d in data]
+        from openbb_tushare.utils.fast_transform import transform_frame
+
+        return transform_frame(TushareBalanceSheetData, data)
 
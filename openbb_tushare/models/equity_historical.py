@@ -3,7 +3,7 @@
 # pylint: disable=unused-argument
 
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 from warnings import warn
 
 from dateutil.relativedelta import relativedelta
@@ -19,10 +19,8 @@ from openbb_core.provider.utils.descriptions import (
 from openbb_core.provider.utils.errors import EmptyDataError
 from pydantic import Field, ValidationInfo, field_validator
 
-from openbb_tushare.utils.tools import (
-    normalize_tushare_symbol_list,
-    validate_iso_yyyy_mm_dd,
-)
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class TushareEquityHistoricalQueryParams(EquityHistoricalQueryParams):
@@ -48,6 +46,8 @@ class TushareEquityHistoricalQueryParams(EquityHistoricalQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
@@ -55,6 +55,8 @@ class TushareEquityHistoricalQueryParams(EquityHistoricalQueryParams):
     @field_validator("start_date", "end_date", mode="before", check_fields=False)
     @classmethod
     def _validate_dates(cls, v: object, info: ValidationInfo) -> object:
+        from openbb_tushare.utils.tools import validate_iso_yyyy_mm_dd
+
         return validate_iso_yyyy_mm_dd(v, info.field_name)
 
 class TushareEquityHistoricalData(EquityHistoricalData):
@@ -102,7 +104,7 @@ class TushareEquityHistoricalFetcher(
         query: TushareEquityHistoricalQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
-    ) -> List[Dict]:
+    ) -> "pd.DataFrame":
         """Return the raw data from the Tushare endpoint."""
         from openbb_tushare.utils.ts_equity_historical import get_from_cache
 
@@ -113,16 +115,14 @@ class TushareEquityHistoricalFetcher(
         if data.empty:
             raise EmptyDataError()
 
-        return data.to_dict(orient="records")
+        return data
 
 
     @staticmethod
     def transform_data(
-        query: TushareEquityHistoricalQueryParams, data: List[Dict], **kwargs: Any
-    ) -> List[TushareEquityHistoricalData]:
+        query: TushareEquityHistoricalQueryParams, data: "pd.DataFrame", **kwargs: Any
+    ) -> Union[List[TushareEquityHistoricalData], "pd.DataFrame"]:
         """Return the transformed data."""
+        from openbb_tushare.utils.fast_transform import transform_frame
 
-        return [
-            TushareEquityHistoricalData.model_validate(d)
-            for d in data
-        ]
+        return transform_frame(TushareEquityHistoricalData, data)
@@ -11,9 +11,7 @@ from openbb_core.provider.standard_models.equity_info import (
     EquityInfoQueryParams,
 )
 from pydantic import Field, ValidationInfo, field_validator
-import pandas as pd
 
-from openbb_tushare.utils.tools import normalize_tushare_symbol_list
 
 
 class TushareEquityProfileQueryParams(EquityInfoQueryParams):
@@ -29,6 +27,8 @@ class TushareEquityProfileQueryParams(EquityInfoQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
@@ -53,6 +53,8 @@ class TushareEquityProfileData(EquityInfoData):
     @classmethod
     def validate_employees(cls, v: Optional[int]) -> Optional[int]:
         """Return 0 if it is nan."""
+        import pandas as pd
+
         if v is None or v == "" or pd.isna(v):
             return 0
         else:
@@ -89,11 +91,12 @@ class TushareEquityProfileFetcher(
         messages: list = []
 
         async def get_one(symbol, api_key: str, use_cache: bool = True) -> None:
-            from openbb_tushare.utils.ts_equity_profile import get_equity_profile
+            from openbb_tushare.utils.ts_equity_profile import aget_equity_profile
             """Get the data for one ticker symbol."""
             try:
                 result: dict = {}
-                result = get_equity_profile(symbol, api_key=api_key, use_cache=use_cache).to_dict(orient="records")[0]
+                data = await aget_equity_profile(symbol, api_key=api_key, use_cache=use_cache)
+                result = data.to_dict(orient="records")[0]
                 if result:
                     results.append(result)
             except Exception as e:
@@ -12,9 +12,7 @@ from openbb_core.provider.standard_models.equity_quote import (
 )
 from pydantic import Field, field_validator
 import logging
-from openbb_tushare.utils.tools import setup_logger, normalize_tushare_symbol_list
 
-setup_logger()
 logger = logging.getLogger(__name__)
 
 class TushareEquityQuoteQueryParams(EquityQuoteQueryParams):
@@ -30,6 +28,8 @@ class TushareEquityQuoteQueryParams(EquityQuoteQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
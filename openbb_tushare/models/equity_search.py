@@ -55,15 +55,17 @@ class TushareEquitySearchFetcher(
     ) -> List[Dict]:
         """Return the raw data from the Tushare endpoint."""
 
-        from openbb_tushare.utils.ts_equity_search import get_symbols
+        from openbb_tushare.utils.ts_equity_search import aget_symbols
         api_key = credentials.get("tushare_api_key") if credentials else ""
 
-        return get_symbols(query.use_cache, api_key=api_key).to_dict(orient="records")
+        data = await aget_symbols(query.use_cache, api_key=api_key)
+        return data.to_dict(orient="records")
 
     @staticmethod
     def transform_data(
         query: TushareEquitySearchQueryParams, data: Dict, **kwargs: Any
     ) -> List[TushareEquitySearchData]:
         """Transform the data to the standard format."""
+        from openbb_tushare.utils.fast_transform import transform_records
 
-        return [TushareEquitySearchData.model_validate(d) for d in data]
+        return transform_records(TushareEquitySearchData, data)
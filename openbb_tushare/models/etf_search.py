@@ -2,7 +2,6 @@
 
 from typing import Any, Dict, List, Optional
 
-import pandas as pd
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.etf_search import (
     EtfSearchData,
@@ -57,19 +56,24 @@ class TushareEtfSearchFetcher(
     ) -> List[Dict]:
         """Return the raw data from the Tushare endpoint."""
         # pylint: disable=import-outside-toplevel
-        from openbb_tushare.utils.ts_equity_search import get_symbols
-        import tushare as ts
+        import asyncio
+        from openbb_tushare.utils.ts_client import get_pro_api
+        from openbb_tushare.utils.ts_async import async_client_available, get_async_client
         from openbb_tushare.utils.helpers import get_api_key
 
         api_key = credentials.get("tushare_api_key") if credentials else ""
         tushare_api_key = get_api_key(api_key)
         
         try:
-            pro = ts.pro_api(tushare_api_key)
+            fields = 'ts_code,name,market,ftype,fund_type'
             # Try to get ETF list using fund_basic API
             # Tushare has a fund_basic API for funds which includes ETFs
             try:
-                df_etf = pro.fund_basic(market='E', fields='ts_code,name,market,ftype,fund_type')
+                if async_client_available():
+                    df_etf = await get_async_client(tushare_api_key).fund_basic(market='E', fields=fields)
+                else:
+                    pro = get_pro_api(tushare_api_key)
+                    df_etf = await asyncio.to_thread(pro.fund_basic, market='E', fields=fields)
                 # Filter for ETFs (ftype typically includes ETF types)
                 # Rename columns to match standard format
                 df_etf = df_etf.rename(columns={'ts_code': 'symbol', 'name': 'name'})
@@ -101,7 +105,9 @@ class TushareEtfSearchFetcher(
         **kwargs: Any,
     ) -> List[TushareEtfSearchData]:
         """Transform the data."""
+        from openbb_tushare.utils.fast_transform import transform_records
+
         if not data:
             return []
-        return [TushareEtfSearchData.model_validate(d) for d in data]
+        return transform_records(TushareEtfSearchData, data)
 
@@ -14,16 +14,16 @@ from openbb_core.provider.standard_models.historical_dividends import (
     HistoricalDividendsData,
     HistoricalDividendsQueryParams,
 )
-
-from openbb_tushare.utils.tools import normalize_tushare_symbol_list, validate_iso_yyyy_mm_dd
+from openbb_core.provider.utils.descriptions import DATA_DESCRIPTIONS
 
 import logging
-from openbb_tushare.utils.tools import setup_logger
-setup_logger()
 logger = logging.getLogger(__name__)
 
 class TushareHistoricalDividendsQueryParams(HistoricalDividendsQueryParams):
     """Tushare Historical Dividends Query."""
+
+    __json_schema_extra__ = {"symbol": {"multiple_items_allowed": True}}
+
     use_cache: bool = Field(
         default=True,
         description="Whether to use a cached request. The quote is cached for one hour.",
@@ -32,6 +32,8 @@ class TushareHistoricalDividendsQueryParams(HistoricalDividendsQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
@@ -39,13 +41,24 @@ class TushareHistoricalDividendsQueryParams(HistoricalDividendsQueryParams):
     @field_validator("start_date", "end_date", mode="before", check_fields=False)
     @classmethod
     def _validate_input_dates(cls, v: object, info):  # pylint: disable=unused-argument
+        from openbb_tushare.utils.tools import validate_iso_yyyy_mm_dd
+
         field_name = getattr(info, "field_name", "date")
         return validate_iso_yyyy_mm_dd(v, field_name)
 
 
 class TushareHistoricalDividendsData(HistoricalDividendsData):
     """Tushare Historical Dividends Data. All data is split-adjusted."""
-    
+
+    __alias_dict__ = {
+        "symbol": "ts_code",
+    }
+
+    symbol: Optional[str] = Field(
+        default=None,
+        description=DATA_DESCRIPTIONS.get("symbol", ""),
+    )
+
     @field_validator(
         "ex_dividend_date",
         mode="before",
@@ -84,7 +97,7 @@ class TushareHistoricalDividendsFetcher(
         from openbb_tushare.utils.ts_historical_dividends import get_dividends
         api_key = credentials.get("tushare_api_key") if credentials else ""
 
-        logger.info(f"Historical Dividends Fetcher start_date:{query.start_date}, end_date:{query.end_date}...")
+        logger.debug(f"Historical Dividends Fetcher start_date:{query.start_date}, end_date:{query.end_date}...")
         return get_dividends(query.symbol, query.start_date, query.end_date, query.use_cache, api_key).to_dict(orient="records")
 
     @staticmethod
@@ -94,11 +107,10 @@ class TushareHistoricalDividendsFetcher(
         **kwargs: Any,
     ) -> List[TushareHistoricalDividendsData]:
         """Transform the data."""
-        #return [TushareHistoricalDividendsData.model_validate(d) for d in data]
-        result: List[TushareHistoricalDividendsData] = []
-        for d in data:
-            result.append(TushareHistoricalDividendsData(**d))
-        logger.info(
+        from openbb_tushare.utils.fast_transform import transform_records
+
+        result = transform_records(TushareHistoricalDividendsData, data)
+        logger.debug(
             "Transformed historical dividends completed.\n"
         )        
         return result
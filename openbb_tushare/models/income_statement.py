@@ -1,22 +1,25 @@
 """Tushare Income Statement Model."""
 
 # pylint: disable=unused-argument
-import pandas as pd
 from datetime import (
     date as dateType,
     datetime,
 )
-from typing import Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.income_statement import (
     IncomeStatementData,
     IncomeStatementQueryParams,
 )
-from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_core.provider.utils.descriptions import (
+    DATA_DESCRIPTIONS,
+    QUERY_DESCRIPTIONS,
+)
 from pydantic import Field, field_validator
 
-from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class TushareIncomeStatementQueryParams(IncomeStatementQueryParams):
@@ -26,6 +29,8 @@ class TushareIncomeStatementQueryParams(IncomeStatementQueryParams):
     """
 
     __json_schema_extra__ = {
+        "symbol": {"multiple_items_allowed": True},
+        "fields": {"multiple_items_allowed": True},
         "period": {
             "choices": ["annual", "quarter"],
         }
@@ -35,6 +40,11 @@ class TushareIncomeStatementQueryParams(IncomeStatementQueryParams):
         default="annual",
         description=QUERY_DESCRIPTIONS.get("period", ""),
     )
+    fields: Optional[str] = Field(
+        default=None,
+        description="Fields to return, using the OpenBB names of the report items."
+        + " All available fields are returned by default.",
+    )
     use_cache: bool = Field(
         default=True,
         description="Whether to use a cached request. The quote is cached for one hour.",
@@ -43,6 +53,8 @@ class TushareIncomeStatementQueryParams(IncomeStatementQueryParams):
     @field_validator("symbol", mode="before", check_fields=False)
     @classmethod
     def _normalize_symbol(cls, v: object) -> object:
+        from openbb_tushare.utils.tools import normalize_tushare_symbol_list
+
         if v is None:
             return v
         return normalize_tushare_symbol_list(str(v))
@@ -51,6 +63,11 @@ class TushareIncomeStatementQueryParams(IncomeStatementQueryParams):
 class TushareIncomeStatementData(IncomeStatementData):
     """Tushare Income Statement Data."""
 
+    symbol: Optional[str] = Field(
+        default=None,
+        description=DATA_DESCRIPTIONS.get("symbol", ""),
+    )
+
     @field_validator("period_ending", mode="before", check_fields=False)
     @classmethod
     def date_validate(cls, v):
@@ -78,20 +95,21 @@ class TushareIncomeStatementFetcher(
         query: TushareIncomeStatementQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
-    ) -> List[Dict]:
+    ) -> "pd.DataFrame":
         """Return the raw data from the Tushare endpoint."""
         from openbb_tushare.utils.ts_income_statement import get_income_statement
         api_key = credentials.get("tushare_api_key") if credentials else ""
 
-        income_statement = get_income_statement(query.symbol, query.period, query.limit, query.use_cache, api_key=api_key)
+        fields = query.fields.split(",") if query.fields else None
+
+        income_statement = get_income_statement(query.symbol, query.period, query.limit, query.use_cache, api_key=api_key, fields=fields)
 
-        return income_statement.to_dict(orient="records")
+        return income_statement
     @staticmethod
     def transform_data(
-        query: TushareIncomeStatementQueryParams, data: List[Dict], **kwargs: Any
-    ) -> List[TushareIncomeStatementData]:
+        query: TushareIncomeStatementQueryParams, data: "pd.DataFrame", **kwargs: Any
+    ) -> Union[List[TushareIncomeStatementData], "pd.DataFrame"]:
         """Return the transformed data."""
-        for result in data:
-            result.pop("symbol", None)
-            result.pop("cik", None)
-        return [TushareIncomeStatementData.model_validate(d) for d in data]
\ No newline at end of file
+        from openbb_tushare.utils.fast_transform import transform_frame
+
+        return transform_frame(TushareIncomeStatementData, data.drop(columns=["cik"], errors="ignore"))
\ No newline at end of file
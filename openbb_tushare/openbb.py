@@ -1,14 +1,11 @@
 """openbb_tushare OpenBB Platform extension."""
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from openbb_core.app.static.app_factory import BaseApp as _BaseApp
-from openbb_core.app.static.app_factory import create_app as _create_app
-from openbb_core.app.static.package_builder import \
-    PackageBuilder as _PackageBuilder
+if TYPE_CHECKING:
+    from openbb_core.app.static.app_factory import BaseApp as _BaseApp
 
 _this_dir = Path(__file__).parent.resolve()
-_PackageBuilder(_this_dir).auto_build()
 
 
 def build(
@@ -29,15 +26,34 @@ def build(
     verbose : bool, optional
         Enable/disable verbose mode
     """
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.app.static.package_builder import \
+        PackageBuilder as _PackageBuilder
+
     _PackageBuilder(_this_dir, lint, verbose).build(modules)
 
 
-try:
+def _create_obb() -> "_BaseApp":
+    """Build the static package if needed and create the app."""
     # pylint: disable=import-outside-toplevel
-    from openbb_tushare.package.__extensions__ import Extensions as _Extensions
-
-    obb: Union[_BaseApp, _Extensions] = _create_app(_Extensions)  # type: ignore
-    sdk = obb
-except (ImportError, ModuleNotFoundError):
-    print("Failed to import extensions.")
-    obb = sdk = _create_app()  # type: ignore
+    from openbb_core.app.static.app_factory import create_app as _create_app
+    from openbb_core.app.static.package_builder import \
+        PackageBuilder as _PackageBuilder
+
+    _PackageBuilder(_this_dir).auto_build()
+    try:
+        from openbb_tushare.package.__extensions__ import Extensions as _Extensions
+
+        return _create_app(_Extensions)  # type: ignore
+    except (ImportError, ModuleNotFoundError):
+        print("Failed to import extensions.")
+        return _create_app()  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    """Create `obb` (alias `sdk`) on first access, so importing this module stays cheap."""
+    if name in ("obb", "sdk"):
+        app = _create_obb()
+        globals().update(obb=app, sdk=app)
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
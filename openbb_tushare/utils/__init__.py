@@ -28,5 +28,8 @@ def get_cache_path() -> str:
     db_path = f"{db_dir}/equity.db"
 
     os.makedirs(db_dir, exist_ok=True)
+    if not os.path.exists(db_path):
+        from openbb_tushare.utils.cache_budget import create_database
+        create_database(db_path)
 
     return db_path
\ No newline at end of file
@@ -2,15 +2,16 @@ import os
 import sqlite3
 import pandas as pd
 import time
-import pickle
-import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils import blob_codec
+from openbb_tushare.utils.cache_budget import touch
+from openbb_tushare.utils.memory_cache import get_memory_cache
+from openbb_tushare.utils.metrics import record_cache_read, record_cache_write
 
 CACHE_TTL = 60*60  # 60 seconds
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 # Constant TTL strategy
 def constant_ttl(now: datetime, ttl_seconds: int) -> datetime:
@@ -42,12 +43,39 @@ def calculate_cache_ttl(ttl_strategy_func, *args, now=None):
     now = now or datetime.now()
     return ttl_strategy_func(now, *args)
 
+def is_fresh(report_type: str, timestamp: float, now: float) -> bool:
+    """Check whether an entry of `report_type` stored at `timestamp` is still valid."""
+    stored_date = datetime.fromtimestamp(timestamp)
+    if report_type == "annual":
+        expired_date = calculate_cache_ttl(get_next_year_start, now=stored_date)
+        return now < expired_date.timestamp()
+    elif report_type == "quarter":
+        expired_date = calculate_cache_ttl(get_next_quarter_start, now=stored_date)
+        return now < expired_date.timestamp()
+    return now - timestamp < CACHE_TTL
+
+def is_fresh_key(key: str, timestamp: float, now: float) -> bool:
+    """`is_fresh` for a cache key, which ends with the report type."""
+    report_type = next((t for t in ("annual", "quarter") if key.endswith(t)), "")
+    return is_fresh(report_type, timestamp, now)
+
 class BlobCache:
-    def __init__(self, table_name: Optional[str] = None, db_path: Optional[str] = None):
+    def __init__(self, table_name: Optional[str] = None, db_path: Optional[str] = None, codec: str = ""):
+        """
+        Cache of pickled DataFrames in a table of the cache database.
+
+        Args:
+            table_name (str): Table of the cache.
+            db_path (str): Directory of the cache database, `get_cache_path()` by default.
+            codec (str): Compression of the blobs written, "zstd", "lz4", "zlib"
+                or "none". TUSHARE_BLOB_CODEC or the fastest installed by default,
+                see `blob_codec`.
+        """
         if table_name is None:
             raise ValueError("Table name must be provided")
 
         self.table_name = table_name
+        self.codec = blob_codec.resolve_codec(codec)
         self.conn = None
         if db_path is None:
             from openbb_tushare.utils import get_cache_path
@@ -71,47 +99,109 @@ class BlobCache:
             ''')
             conn.commit()
 
-    def load_cached_data(self, symbol:str, report_type, use_cache, get_data, api_key : str = "", *args, **kwargs):
-        """Load cached data from SQLite cache or generate new data."""
+    @property
+    def _namespace(self):
+        """Namespace of the entries in the memory tier, see `memory_cache`."""
+        return (self.db_path, self.table_name, self.table_name)
+
+    def _cache_key(self, symbol: str, report_type: str) -> str:
         from openbb_tushare.utils.tools import normalize_symbol
         symbol_b, symbol_f, market = normalize_symbol(symbol)
-        key = f"{market}{symbol_b}{report_type}"
-        now = time.time()
+        return f"{market}{symbol_b}{report_type}"
+
+    def _is_fresh(self, report_type: str, timestamp: float, now: float) -> bool:
+        """Check whether an entry stored at `timestamp` is still valid."""
+        return is_fresh(report_type, timestamp, now)
+
+    def read_cached(self, symbol: str, report_type: str, record_metrics: bool = True) -> Optional[pd.DataFrame]:
+        """Return the cached data for a symbol, or None if missing or expired."""
+        key = self._cache_key(symbol, report_type)
+        memory = get_memory_cache()
+        entry = memory.get(self._namespace, key) if memory is not None else None
+        if entry is not None:
+            data, timestamp = entry
+            if self._is_fresh(report_type, timestamp, time.time()):
+                touch(self.db_path, self.table_name, key)
+                if record_metrics:
+                    record_cache_read(self.table_name, "hit", rows=len(data))
+                return data
+            memory.invalidate(self._namespace, key)
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            if use_cache:
-                cursor.execute(f'SELECT timestamp, data FROM {self.table_name} WHERE key=?', (key,))
-                row = cursor.fetchone()
-
-                if row:
-                    timestamp, data_blob = row
-                    stored_date = datetime.fromtimestamp(timestamp)
-                    if report_type == "annual":
-                        expired_date = calculate_cache_ttl(get_next_year_start, now=stored_date)
-                        if now < expired_date.timestamp():
-                            logger.info("Loading annual data from SQLite cache...")
-                            return pickle.loads(data_blob)
-                    elif report_type == "quarter":
-                        expired_date = calculate_cache_ttl(get_next_quarter_start, now=stored_date)
-                        if now < expired_date.timestamp():
-                            logger.info("Loading quarter data from SQLite cache...")
-                            return pickle.loads(data_blob)
-                    else:
-                        if now - timestamp < CACHE_TTL:
-                            logger.info("Loading data from SQLite cache...")
-                            return pickle.loads(data_blob)
-
-            logger.info(f"Generating new {report_type} data...")
-            df = get_data(symbol, report_type, api_key=api_key)
-
-            # 序列化 DataFrame
-            data_blob = pickle.dumps(df)
-
-            # 更新或插入缓存
-            cursor.execute(f'''
+            cursor.execute(f'SELECT timestamp, data FROM {self.table_name} WHERE key=?', (key,))
+            row = cursor.fetchone()
+
+        if row:
+            timestamp, data_blob = row
+            if self._is_fresh(report_type, timestamp, time.time()):
+                logger.debug(f"Loading {report_type} data from SQLite cache...")
+                try:
+                    data = blob_codec.decode(data_blob)
+                except blob_codec.UnsupportedBlobError as e:
+                    logger.warning(f"Ignoring the cached {report_type} data of {symbol}: {e}")
+                    if record_metrics:
+                        record_cache_read(self.table_name, "miss")
+                    return None
+                if memory is not None and isinstance(data, pd.DataFrame):
+                    memory.put(self._namespace, key, data, timestamp)
+                touch(self.db_path, self.table_name, key)
+                if record_metrics:
+                    record_cache_read(self.table_name, "hit", rows=len(data), nbytes=len(data_blob))
+                return data
+            if record_metrics:
+                record_cache_read(self.table_name, "expired")
+            return None
+        if record_metrics:
+            record_cache_read(self.table_name, "miss")
+        return None
+
+    def write_cached(self, symbol: str, report_type: str, df: pd.DataFrame):
+        """Serialize and store the data for a symbol."""
+        key = self._cache_key(symbol, report_type)
+        # 序列化并压缩 DataFrame
+        data_blob = blob_codec.encode(df, self.codec)
+
+        # 更新或插入缓存
+        timestamp = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f'''
                 INSERT OR REPLACE INTO {self.table_name} (key, timestamp, data)
                 VALUES (?, ?, ?)
-            ''', (key, now, data_blob))
-
+            ''', (key, timestamp, data_blob))
             conn.commit()
-            return df
+        touch(self.db_path, self.table_name, key)
+        memory = get_memory_cache()
+        if memory is not None and isinstance(df, pd.DataFrame):
+            memory.put(self._namespace, key, df, timestamp)
+        record_cache_write(self.table_name, rows=len(df), nbytes=len(data_blob))
+
+    def lock(self, symbol: str, report_type: str):
+        """Cross-process lock of the entry of a symbol, see `cache_lock.cache_lock`."""
+        from openbb_tushare.utils.cache_lock import cache_lock
+        return cache_lock(f"{self.table_name}:{self._cache_key(symbol, report_type)}", self.db_path)
+
+    def load_cached_data(self, symbol:str, report_type, use_cache, get_data, api_key : str = "", *args, **kwargs):
+        """
+        Load cached data from SQLite cache or generate new data.
+
+        On a miss one process downloads the data, the others sharing the cache
+        database wait for it and read the fresh entry.
+        """
+        if not use_cache:
+            return self._generate(symbol, report_type, get_data, api_key)
+
+        data = self.read_cached(symbol, report_type)
+        if data is not None:
+            return data
+        with self.lock(symbol, report_type):
+            data = self.read_cached(symbol, report_type, record_metrics=False)
+            if data is not None:
+                return data
+            return self._generate(symbol, report_type, get_data, api_key)
+
+    def _generate(self, symbol: str, report_type: str, get_data, api_key: str = "") -> pd.DataFrame:
+        logger.info(f"Generating new {report_type} data...")
+        df = get_data(symbol, report_type, api_key=api_key)
+        self.write_cached(symbol, report_type, df)
+        return df
@@ -0,0 +1,108 @@
+"""
+Format of the blobs of `BlobCache`.
+
+A blob is a header followed by the pickled object, compressed with the codec
+named in the header:
+
+    b"TSB" | format version (1 byte) | codec id (1 byte) | payload
+
+zstd (`zstandard`) and lz4 (`lz4`) are used when installed, zlib of the
+standard library otherwise. Blobs of older versions, plain pickles, are still
+read. Blobs of an unknown version or codec raise `UnsupportedBlobError`, the
+cache treats them as missing.
+"""
+import importlib.util
+import os
+import pickle
+import zlib
+from typing import Any, Callable, Dict, Tuple
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"TSB"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+NONE = "none"
+ZLIB = "zlib"
+ZSTD = "zstd"
+LZ4 = "lz4"
+CODEC_IDS = {NONE: 0, ZLIB: 1, ZSTD: 2, LZ4: 3}
+CODEC_NAMES = {codec_id: name for name, codec_id in CODEC_IDS.items()}
+
+BLOB_CODEC_ENV = "TUSHARE_BLOB_CODEC"
+# Preferred codecs, the first installed one is the default
+DEFAULT_CODECS = (ZSTD, LZ4, ZLIB)
+
+class UnsupportedBlobError(ValueError):
+    """A blob written in a format or with a codec this installation cannot read."""
+
+def codec_available(codec: str) -> bool:
+    if codec == ZSTD:
+        return importlib.util.find_spec("zstandard") is not None
+    if codec == LZ4:
+        return importlib.util.find_spec("lz4") is not None
+    return codec in (NONE, ZLIB)
+
+# Codecs requested but not installed, warned about once
+_warned = set()
+
+def resolve_codec(codec: str = "") -> str:
+    """
+    The codec to write with: `codec`, TUSHARE_BLOB_CODEC or the first
+    installed of zstd, lz4 and zlib. Falls back to zlib, with a warning, when
+    the codec is not installed.
+    """
+    codec = (codec or os.environ.get(BLOB_CODEC_ENV, "")).lower()
+    if not codec:
+        return next(c for c in DEFAULT_CODECS if codec_available(c))
+    if codec not in CODEC_IDS:
+        raise ValueError(f"Unknown blob codec '{codec}', expected one of {', '.join(CODEC_IDS)}.")
+    if not codec_available(codec):
+        if codec not in _warned:
+            _warned.add(codec)
+            logger.warning(f"The blob codec '{codec}' is not installed, compressing with zlib. "
+                           "Install openbb-tushare[compression] to use it.")
+        return ZLIB
+    return codec
+
+def _functions(codec: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """(compress, decompress) of a codec."""
+    if codec == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress
+    if codec == LZ4:
+        import lz4.frame
+
+        return lz4.frame.compress, lz4.frame.decompress
+    if codec == ZLIB:
+        # Level 1 compresses statements nearly as well as the default level at a fraction of the time
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    return bytes, bytes
+
+_codecs: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {}
+
+def _codec(codec: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    functions = _codecs.get(codec)
+    if functions is None:
+        functions = _codecs[codec] = _functions(codec)
+    return functions
+
+def encode(obj: Any, codec: str = ZLIB) -> bytes:
+    """Pickle and compress an object into a blob."""
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return MAGIC + bytes((FORMAT_VERSION, CODEC_IDS[codec])) + _codec(codec)[0](payload)
+
+def decode(blob: bytes) -> Any:
+    """Decompress and unpickle a blob, or a plain pickle of older versions."""
+    if not blob.startswith(MAGIC):
+        return pickle.loads(blob)
+    version, codec_id = blob[len(MAGIC)], blob[len(MAGIC) + 1]
+    if version > FORMAT_VERSION:
+        raise UnsupportedBlobError(f"Blob format version {version} is newer than {FORMAT_VERSION}.")
+    codec = CODEC_NAMES.get(codec_id)
+    if codec is None or not codec_available(codec):
+        raise UnsupportedBlobError(f"Blob codec {codec or codec_id} is not installed.")
+    return pickle.loads(_codec(codec)[1](memoryview(blob)[HEADER_SIZE:]))
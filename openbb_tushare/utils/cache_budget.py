@@ -0,0 +1,287 @@
+"""
+Disk budget of the cache directory.
+
+The per-symbol entries of the cache database, the price tables of
+`get_from_cache` with their `price_store` files and the rows of the blob
+caches, record when they were last read or written. `maintain_cache` evicts
+
+- blob entries past their TTL,
+- entries not accessed for TUSHARE_CACHE_MAX_IDLE_DAYS (90 by default),
+- the least recently accessed entries while the cache directory is larger
+  than TUSHARE_CACHE_MAX_MB (1024 by default),
+
+and returns the freed pages to the file system with an incremental vacuum.
+Reference tables like the symbol lists are never evicted. Databases created
+before incremental vacuum was set are rebuilt once with a full VACUUM, which
+needs free disk space of about twice the database, and skipped otherwise.
+
+Caches schedule the maintenance in a background thread, every
+TUSHARE_CACHE_MAINTENANCE_INTERVAL seconds (3600 by default, 0 disables it).
+"""
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+ACCESS_TABLE = "cache_access"
+MAX_MB_ENV = "TUSHARE_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 1024
+MAX_IDLE_DAYS_ENV = "TUSHARE_CACHE_MAX_IDLE_DAYS"
+DEFAULT_MAX_IDLE_DAYS = 90
+INTERVAL_ENV = "TUSHARE_CACHE_MAINTENANCE_INTERVAL"
+DEFAULT_INTERVAL = 3600
+
+# Seconds between two recorded accesses of an entry, reads would otherwise all write
+TOUCH_INTERVAL = 300
+# Entries accessed this recently are never evicted, they may be in use
+MIN_IDLE = 600
+# Eviction stops at this share of the budget, so the next writes do not evict again
+LOW_WATERMARK = 0.9
+EVICTION_BATCH = 32
+# Names of the per-symbol price tables, e.g. SH600000 or HK00700
+HISTORY_TABLE_PATTERN = re.compile(r"^(SH|SZ|BJ|HK)[0-9A-Z]+$")
+
+_touched: Dict[Tuple[str, str, str], float] = {}
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS {ACCESS_TABLE} (
+            table_name TEXT,
+            key TEXT,
+            accessed REAL,
+            PRIMARY KEY (table_name, key)
+        )
+    ''')
+    return conn
+
+def create_database(db_path: str) -> None:
+    """Create an empty cache database set up for incremental vacuum, unless it exists."""
+    if os.path.exists(db_path):
+        return
+    try:
+        conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+        try:
+            # Only takes effect before the first table is created
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Failed to create the cache database {db_path}: {e}")
+
+def touch(db_path: str, table_name: str, key: str = "") -> None:
+    """
+    Record an access of an evictable entry, a blob `key` or a whole table for "".
+
+    Accesses are written at most every TOUCH_INTERVAL seconds per entry and process.
+    """
+    now = time.time()
+    entry = (db_path, table_name, key)
+    if now - _touched.get(entry, 0.0) < TOUCH_INTERVAL:
+        return
+    _touched[entry] = now
+    try:
+        conn = _connect(db_path)
+        try:
+            conn.execute(f"INSERT OR REPLACE INTO {ACCESS_TABLE} (table_name, key, accessed) VALUES (?, ?, ?)",
+                         (table_name, key, now))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # Recording an access must never fail a read
+        logger.debug(f"Failed to record the access of {table_name} {key}: {e}")
+    schedule_maintenance(db_path)
+
+def directory_size(directory: str) -> int:
+    """Bytes of the files in a directory and its subdirectories."""
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+def used_bytes(conn: sqlite3.Connection) -> int:
+    """Bytes of the database pages in use, without the free pages."""
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return (page_count - free) * page_size
+
+def _tables(conn: sqlite3.Connection) -> Set[str]:
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+def _register_untracked(conn: sqlite3.Connection, tables: Set[str], now: float) -> None:
+    # Accesses of tables dropped elsewhere are forgotten
+    for (table_name,) in conn.execute(f"SELECT DISTINCT table_name FROM {ACCESS_TABLE}").fetchall():
+        if table_name not in tables:
+            conn.execute(f"DELETE FROM {ACCESS_TABLE} WHERE table_name=?", (table_name,))
+    # Price tables written before the access was recorded count as accessed now
+    tracked = {row[0] for row in conn.execute(f"SELECT table_name FROM {ACCESS_TABLE} WHERE key=''")}
+    conn.executemany(f"INSERT OR IGNORE INTO {ACCESS_TABLE} (table_name, key, accessed) VALUES (?, '', ?)",
+                     [(name, now) for name in tables if HISTORY_TABLE_PATTERN.match(name) and name not in tracked])
+
+def _candidates(conn: sqlite3.Connection, tables: Set[str], before: float, limit: int) -> List[Tuple[str, str, float]]:
+    """Least recently accessed entries, (table, key, accessed) with key "" for tables."""
+    rows = conn.execute(f'''
+        SELECT table_name, key, accessed FROM {ACCESS_TABLE}
+        WHERE accessed < ? ORDER BY accessed LIMIT ?
+    ''', (before, limit)).fetchall()
+    return [row for row in rows if row[0] in tables]
+
+def _evict(conn: sqlite3.Connection, db_path: str, table_name: str, key: str, reason: str) -> int:
+    """Evict an entry, returns the bytes freed outside the database."""
+    from openbb_tushare.utils.memory_cache import get_memory_cache
+    from openbb_tushare.utils.price_store import PriceStore
+
+    freed = 0
+    if key:
+        conn.execute(f"DELETE FROM {table_name} WHERE key=?", (key,))
+        cache = table_name
+    else:
+        conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        freed = PriceStore(db_path).remove(table_name)
+        cache = "equity_history"
+    conn.execute(f"DELETE FROM {ACCESS_TABLE} WHERE table_name=? AND key=?", (table_name, key))
+    memory = get_memory_cache()
+    if memory is not None:
+        memory.invalidate((db_path, table_name, cache), key or None)
+    metrics.inc("tushare_cache_evictions_total", cache=cache, reason=reason)
+    return freed
+
+def _purge_expired(conn: sqlite3.Connection, db_path: str, tables: Set[str], now: float) -> int:
+    """Delete the blob entries past their TTL, returns their number."""
+    from openbb_tushare.utils.blob_cache import is_fresh_key
+
+    blob_tables = [row[0] for row in conn.execute(f"SELECT DISTINCT table_name FROM {ACCESS_TABLE} WHERE key!=''")]
+    purged = 0
+    for table_name in blob_tables:
+        if table_name not in tables:
+            continue
+        expired = [
+            key for key, timestamp in conn.execute(f"SELECT key, timestamp FROM {table_name}")
+            if not is_fresh_key(key, timestamp, now)
+        ]
+        for key in expired:
+            _evict(conn, db_path, table_name, key, "expired")
+        purged += len(expired)
+    return purged
+
+def _compact(conn: sqlite3.Connection, db_path: str) -> None:
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        # Incremental vacuum needs the mode set and the database rebuilt once,
+        # VACUUM writes a copy of the database and a journal as large
+        size = os.path.getsize(db_path)
+        free = shutil.disk_usage(os.path.dirname(os.path.abspath(db_path))).free
+        if free < 2 * size:
+            logger.warning(f"Not compacting the cache database {db_path}, {free / 1024 / 1024:.0f} MB of free "
+                           f"disk space is less than twice its size. The freed pages are reused by later writes.")
+            return
+        logger.info("Converting the cache database to incremental vacuum...")
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+    else:
+        conn.execute("PRAGMA incremental_vacuum")
+
+def maintain_cache(
+        db_path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_idle: Optional[float] = None
+    ) -> Dict[str, int]:
+    """
+    Evict expired, idle and least recently used entries and compact the cache database.
+
+    Args:
+        db_path (str): Cache database, `get_cache_path()` by default. The budget
+            applies to the directory holding it.
+        max_bytes (int): Budget of the directory, TUSHARE_CACHE_MAX_MB by default, 0 for none.
+        max_idle (float): Seconds after which unused entries are evicted,
+            TUSHARE_CACHE_MAX_IDLE_DAYS by default, 0 to keep them.
+
+    Returns:
+        Dict[str, int]: Entries evicted per reason, "expired", "idle" and "budget".
+    """
+    from openbb_tushare.utils.cache_lock import cache_lock
+
+    if db_path is None:
+        from openbb_tushare.utils import get_cache_path
+        db_path = get_cache_path()
+    if max_bytes is None:
+        max_bytes = int(float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+    if max_idle is None:
+        max_idle = float(os.environ.get(MAX_IDLE_DAYS_ENV, DEFAULT_MAX_IDLE_DAYS)) * 86400
+
+    evicted = {"expired": 0, "idle": 0, "budget": 0}
+    with cache_lock(f"cache_maintenance:{db_path}", db_path, wait=0) as held:
+        if not held:
+            # Another process is at it
+            return evicted
+        now = time.time()
+        conn = _connect(db_path)
+        try:
+            tables = _tables(conn)
+            _register_untracked(conn, tables, now)
+            evicted["expired"] = _purge_expired(conn, db_path, tables, now)
+
+            if max_idle:
+                for table_name, key, _ in _candidates(conn, tables, now - max(max_idle, MIN_IDLE), -1):
+                    _evict(conn, db_path, table_name, key, "idle")
+                    evicted["idle"] += 1
+
+            if max_bytes:
+                # Other files of the directory, e.g. the log, count against the budget too
+                others = directory_size(os.path.dirname(os.path.abspath(db_path))) - os.path.getsize(db_path)
+                target = max_bytes * LOW_WATERMARK
+                while used_bytes(conn) + others > target:
+                    batch = _candidates(conn, _tables(conn), now - MIN_IDLE, EVICTION_BATCH)
+                    if not batch:
+                        logger.warning(f"The cache directory exceeds its budget of {max_bytes / 1024 / 1024:.0f} MB, "
+                                       "but no entry can be evicted.")
+                        break
+                    for table_name, key, _ in batch:
+                        others -= _evict(conn, db_path, table_name, key, "budget")
+                        evicted["budget"] += 1
+                        if used_bytes(conn) + others <= target:
+                            break
+            _compact(conn, db_path)
+        finally:
+            conn.close()
+    if any(evicted.values()):
+        logger.info(f"Evicted cache entries of {db_path}: {evicted}.")
+    return evicted
+
+_scheduled: Set[str] = set()
+_schedule_lock = threading.Lock()
+
+def _maintenance_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        for db_path in list(_scheduled):
+            if not os.path.exists(db_path):
+                _scheduled.discard(db_path)
+                continue
+            try:
+                maintain_cache(db_path)
+            except Exception as e:
+                logger.warning(f"Cache maintenance of {db_path} failed: {e}")
+
+def schedule_maintenance(db_path: str) -> None:
+    """Maintain a cache database in the background thread of the process, see `maintain_cache`."""
+    interval = float(os.environ.get(INTERVAL_ENV, DEFAULT_INTERVAL))
+    if interval <= 0 or db_path in _scheduled:
+        return
+    with _schedule_lock:
+        if not _scheduled:
+            threading.Thread(target=_maintenance_loop, args=(interval,), name="tushare-cache-maintenance",
+                             daemon=True).start()
+        _scheduled.add(db_path)
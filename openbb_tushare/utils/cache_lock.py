@@ -0,0 +1,141 @@
+"""
+Cross-process locks of cache entries.
+
+Workers sharing a cache database miss an expired entry at the same time. The
+first one to take the lock of the entry downloads it, the others wait for the
+lock and then read the fresh entry instead of calling Tushare again:
+
+    data = read()
+    if data is None:
+        with cache_lock(key):
+            # Another process may have downloaded it while this one waited
+            data = read()
+            if data is None:
+                data = download()
+                write(data)
+
+Locks are rows of a table in the cache database. The holder renews its lease
+from a heartbeat thread while it works, so long downloads keep the lock, and
+a crashed holder blocks the others for `lease` seconds at most. Waiters wait
+at least the lease before giving up, then re-read the entry and download it
+only if it is still missing.
+"""
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+LOCK_TABLE = "cache_locks"
+# Seconds to wait for the lock before downloading anyway, at least the lease.
+# Deep histories with retries and their backoff take minutes.
+LOCK_WAIT_ENV = "TUSHARE_CACHE_LOCK_WAIT"
+DEFAULT_LOCK_WAIT = 600.0
+# Seconds a lock outlives the last heartbeat of its holder
+DEFAULT_LEASE = 60.0
+# Heartbeats per lease, a few missed ones do not lose the lock
+HEARTBEATS_PER_LEASE = 3
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {LOCK_TABLE} (key TEXT PRIMARY KEY, owner TEXT, expires REAL)")
+    return conn
+
+def try_acquire(key: str, owner: str, db_path: str, lease: float = DEFAULT_LEASE) -> bool:
+    """Take the lock of `key` for `owner` unless another owner holds an unexpired one."""
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(f'''
+            INSERT INTO {LOCK_TABLE} (key, owner, expires) VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET owner=excluded.owner, expires=excluded.expires
+            WHERE {LOCK_TABLE}.expires < ?
+        ''', (key, owner, now + lease, now))
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+def renew(key: str, owner: str, db_path: str, lease: float = DEFAULT_LEASE) -> bool:
+    """Extend the lease of a lock held by `owner`, False when it lost the lock."""
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(f"UPDATE {LOCK_TABLE} SET expires=? WHERE key=? AND owner=?",
+                              (time.time() + lease, key, owner))
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+def _heartbeat(key: str, owner: str, db_path: str, lease: float, stopped: threading.Event) -> None:
+    while not stopped.wait(lease / HEARTBEATS_PER_LEASE):
+        try:
+            if not renew(key, owner, db_path, lease):
+                logger.warning(f"Lost the cache lock of {key}.")
+                return
+        except sqlite3.Error as e:
+            # The next heartbeat may get through before the lease runs out
+            logger.debug(f"Failed to renew the cache lock of {key}: {e}")
+
+def release(key: str, owner: str, db_path: str) -> None:
+    conn = _connect(db_path)
+    try:
+        conn.execute(f"DELETE FROM {LOCK_TABLE} WHERE key=? AND owner=?", (key, owner))
+    finally:
+        conn.close()
+
+@contextmanager
+def cache_lock(
+        key: str,
+        db_path: Optional[str] = None,
+        wait: Optional[float] = None,
+        lease: float = DEFAULT_LEASE
+    ) -> Iterator[bool]:
+    """
+    Hold the cross-process lock of a cache entry.
+
+    Args:
+        key (str): Key of the cache entry as "<cache>:<entry>", e.g. "equity_history:SH600000".
+        db_path (str): Cache database holding the locks, `get_cache_path()` by default.
+        wait (float): Seconds to wait for the lock, TUSHARE_CACHE_LOCK_WAIT or
+            600 by default, and never less than the lease by default.
+        lease (float): Seconds after which the lock expires unless its holder,
+            which renews it every third of the lease, releases or renews it.
+
+    Yields:
+        bool: Whether the lock is held, False when waiting for it timed out.
+    """
+    if db_path is None:
+        from openbb_tushare.utils import get_cache_path
+        db_path = get_cache_path()
+    if wait is None:
+        wait = max(float(os.environ.get(LOCK_WAIT_ENV, DEFAULT_LOCK_WAIT)), lease)
+
+    owner = uuid.uuid4().hex
+    cache = key.split(":")[0]
+    start = time.monotonic()
+    delay = 0.01
+    acquired = try_acquire(key, owner, db_path, lease)
+    if not acquired:
+        metrics.inc("tushare_cache_lock_waits_total", cache=cache)
+        while not acquired and time.monotonic() - start < wait:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+            acquired = try_acquire(key, owner, db_path, lease)
+        metrics.observe("tushare_cache_lock_wait_seconds", time.monotonic() - start, cache=cache)
+        if not acquired:
+            logger.warning(f"Timed out after {wait:.0f}s waiting for the cache lock of {key}, downloading anyway.")
+    stopped = threading.Event()
+    if acquired and lease > 0:
+        threading.Thread(target=_heartbeat, args=(key, owner, db_path, lease, stopped),
+                         name="tushare-cache-lock", daemon=True).start()
+    try:
+        yield acquired
+    finally:
+        stopped.set()
+        if acquired:
+            release(key, owner, db_path)
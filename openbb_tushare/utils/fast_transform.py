@@ -0,0 +1,284 @@
+import os
+import types
+from functools import lru_cache
+import pandas as pd
+from datetime import date as dateType, datetime
+from typing import Annotated, Any, Dict, FrozenSet, List, Tuple, Type, TypeVar, Union, get_args, get_origin
+from pydantic import BaseModel
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Set to 1/true/yes to build fetcher results without per-row validation
+FAST_TRANSFORM_ENV = "TUSHARE_FAST_TRANSFORM"
+
+# Set to 1/true/yes to return the validated DataFrame itself as the results of
+# the historical price and statement fetchers, `OBBject.to_df()` then hands it
+# back without building a model per row.
+COLUMNAR_RESULTS_ENV = "TUSHARE_COLUMNAR_RESULTS"
+
+# Python 3.10+ spells Optional[X] as X | None as well
+UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+class ColumnarResults(pd.DataFrame):
+    """
+    Fetcher results handed through as a DataFrame.
+
+    `OBBject.to_df()` returns DataFrame results as they are, but first tests
+    the truth value of the results, so unlike a DataFrame this is true when
+    it has rows. Operations on it return plain DataFrames.
+    """
+
+    def __bool__(self) -> bool:
+        return not self.empty
+
+def use_fast_transform() -> bool:
+    """Whether the fast transform path is enabled with TUSHARE_FAST_TRANSFORM."""
+    return os.environ.get(FAST_TRANSFORM_ENV, "").strip().lower() in ("1", "true", "yes")
+
+def use_columnar_results() -> bool:
+    """Whether the columnar result mode is enabled with TUSHARE_COLUMNAR_RESULTS."""
+    return os.environ.get(COLUMNAR_RESULTS_ENV, "").strip().lower() in ("1", "true", "yes")
+
+def field_kind(annotation: Any) -> Tuple[str, bool]:
+    """
+    Classify a field annotation for frame level validation.
+
+    Returns:
+        Tuple[str, bool]: One of "date", "datetime", "float", "int", "bool",
+            "number", "str" or "other", and whether None is allowed.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return field_kind(get_args(annotation)[0])
+    if origin in UNION_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(get_args(annotation))
+        if len(args) > 1:
+            # mirror the smart union mode of pydantic for the unions of the standard models
+            if set(args) <= {dateType, datetime}:
+                return "datetime", optional
+            if set(args) <= {int, float}:
+                return "number", optional
+            return "other", optional
+        kind, inner_optional = field_kind(args[0])
+        return kind, optional or inner_optional
+    # datetime is a subclass of date and bool a subclass of int, so test them first
+    for kind, kind_type in (("datetime", datetime), ("date", dateType), ("bool", bool),
+                            ("int", int), ("float", float), ("str", str)):
+        if annotation is kind_type:
+            return kind, False
+    return "other", False
+
+def _convert_column(values: pd.Series, kind: str) -> Tuple[pd.Series, pd.Series]:
+    """Convert a column to the dtype of its field kind, returns the values and the invalid mask."""
+    missing = values.isna()
+    if kind in ("float", "int", "number"):
+        converted = pd.to_numeric(values, errors="coerce")
+        invalid = converted.isna() & ~missing
+        if kind == "float":
+            converted = converted.astype(float)
+        elif kind == "int":
+            invalid |= converted.notna() & (converted % 1 != 0)
+            converted = converted.astype("Int64")
+        return converted, invalid
+    if kind in ("date", "datetime"):
+        converted = pd.to_datetime(values, errors="coerce")
+        return converted, converted.isna() & ~missing
+    if kind == "bool":
+        return values, ~missing & ~values.isin([True, False])
+    if kind == "str":
+        return values.astype(str).where(~missing, None), pd.Series(False, index=values.index)
+    return values, pd.Series(False, index=values.index)
+
+def _to_objects(values: pd.Series, kind: str) -> pd.Series:
+    """Convert a converted column to the Python objects of its field kind, missing values become None."""
+    missing = values.isna()
+    if kind == "date":
+        values = values.dt.date
+    elif kind == "datetime":
+        values = pd.Series(values.dt.to_pydatetime(), index=values.index)
+    return values.astype(object).where(~missing, None)
+
+def _function(func: Any) -> Any:
+    """The function of a validator, unwrapping the classmethod."""
+    return getattr(func, "__func__", func)
+
+@lru_cache(maxsize=None)
+def replicated_validators() -> FrozenSet[Any]:
+    """
+    The validator functions of the Data models the frame validation does the work of.
+
+    `Data._use_alias` maps the aliases, done by the renaming from `__alias_dict__`,
+    and the `date_validate` validators of the date fields parse date strings, done
+    by the conversion of the date columns. Validators are matched by function, a
+    model redefining one of them is validated per record like any other.
+    """
+    from openbb_core.provider.abstract.data import Data
+    from openbb_core.provider.standard_models.equity_historical import EquityHistoricalData
+    from openbb_tushare.models.balance_sheet import TushareBalanceSheetData
+    from openbb_tushare.models.cash_flow import TushareCashFlowStatementData
+    from openbb_tushare.models.historical_dividends import TushareHistoricalDividendsData
+    from openbb_tushare.models.income_statement import TushareIncomeStatementData
+
+    date_models = (EquityHistoricalData, TushareBalanceSheetData, TushareCashFlowStatementData,
+                   TushareHistoricalDividendsData, TushareIncomeStatementData)
+    return frozenset([_function(Data._use_alias)] + [_function(model.date_validate) for model in date_models])
+
+@lru_cache(maxsize=None)
+def unreplicated_validators(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of the validators of a model the frame validation would bypass."""
+    known = replicated_validators()
+    decorators = model.__pydantic_decorators__
+    names = [name for name, validator in decorators.model_validators.items()
+             if _function(validator.func) not in known]
+    names += list(decorators.validators) + list(decorators.root_validators)
+    for name, validator in decorators.field_validators.items():
+        replicated = (
+            _function(validator.func) in known
+            and validator.info.mode == "before"
+            and all(field in model.model_fields
+                    and field_kind(model.model_fields[field].annotation)[0] in ("date", "datetime")
+                    for field in validator.info.fields)
+        )
+        if not replicated:
+            names.append(name)
+    return tuple(names)
+
+def validate_frame(model: Type[BaseModel], data: pd.DataFrame, native: bool = False) -> pd.DataFrame:
+    """
+    Validate and convert the columns of a frame against the fields of a model once.
+
+    Columns are renamed from the provider names in `__alias_dict__` to the
+    field names and converted to the types of the fields. Columns that are
+    not fields are kept unchanged.
+
+    Args:
+        model: The Data model of the fetcher.
+        data (pd.DataFrame): The extracted data.
+        native (bool): Keep the pandas dtypes, e.g. datetime64 for dates, instead
+            of converting to Python objects with None for missing values.
+
+    Returns:
+        pd.DataFrame: The converted frame, ready for `model_construct` unless native.
+
+    Raises:
+        ValueError: The model defines validators the frame validation does not
+            replicate, see `replicated_validators`, a required field is
+            missing or a column has values of the wrong type.
+    """
+    bypassed = unreplicated_validators(model)
+    if bypassed:
+        raise ValueError(f"{model.__name__} defines validators the frame validation skips: {', '.join(bypassed)}.")
+    aliases = {alias: name for name, alias in getattr(model, "__alias_dict__", {}).items()}
+    frame = data.rename(columns=aliases)
+    columns: Dict[str, pd.Series] = {}
+    for name, field in model.model_fields.items():
+        if name not in frame.columns:
+            if field.is_required():
+                raise ValueError(f"Missing required field '{name}'.")
+            continue
+        kind, optional = field_kind(field.annotation)
+        values, invalid = _convert_column(frame[name], kind)
+        if invalid.any():
+            raise ValueError(f"Invalid value {frame[name][invalid].iloc[0]!r} in field '{name}'.")
+        if not optional and values.isna().any():
+            raise ValueError(f"Missing values in required field '{name}'.")
+        columns[name] = values if native else _to_objects(values, kind)
+    return frame.assign(**columns)
+
+def construct_models(model: Type[ModelType], data: pd.DataFrame) -> List[ModelType]:
+    """
+    Build the models from a validated frame without validating every row again.
+
+    The instances are assembled column-wise the way `model_construct` does,
+    which spares its per-row bookkeeping of aliases and defaults. No validator
+    of the model runs: `_use_alias` and the `date_validate` of the date fields
+    are replicated by `validate_frame`, which refuses models with any other.
+    """
+    frame = validate_frame(model, data)
+    if model.__private_attributes__:
+        return [model.model_construct(**record) for record in frame.to_dict(orient="records")]
+
+    fields = [name for name in model.model_fields if name in frame.columns]
+    allow_extra = model.model_config.get("extra") == "allow"
+    extras = [col for col in frame.columns if col not in model.model_fields] if allow_extra else []
+    defaults = {}
+    factories = {}
+    for name, field in model.model_fields.items():
+        if name in frame.columns:
+            continue
+        if field.default_factory is not None:
+            factories[name] = field.default_factory
+        else:
+            defaults[name] = field.get_default()
+
+    field_rows = zip(*(frame[name].tolist() for name in fields)) if fields else iter(lambda: (), None)
+    extra_rows = zip(*(frame[col].tolist() for col in extras)) if extras else iter(lambda: (), None)
+    new = object.__new__
+    set_attribute = object.__setattr__
+    results = []
+    for _, values, extra_values in zip(range(len(frame)), field_rows, extra_rows):
+        instance = new(model)
+        attributes = dict(defaults)
+        attributes.update(zip(fields, values))
+        for name, factory in factories.items():
+            attributes[name] = factory()
+        set_attribute(instance, "__dict__", attributes)
+        set_attribute(instance, "__pydantic_fields_set__", set(fields))
+        set_attribute(instance, "__pydantic_extra__", dict(zip(extras, extra_values)) if allow_extra else None)
+        set_attribute(instance, "__pydantic_private__", None)
+        results.append(instance)
+    return results
+
+def transform_records(model: Type[ModelType], data: Union[List[Dict], pd.DataFrame]) -> List[ModelType]:
+    """
+    Build the results of a fetcher.
+
+    By default every record is validated with `model_validate`. With
+    TUSHARE_FAST_TRANSFORM set, the column dtypes are validated once on the
+    frame and the models are built with `model_construct`, which skips the
+    validators of the model. Models with validators the frame validation
+    does not replicate, see `replicated_validators`, and frames that do
+    not pass it fall back to the validated path.
+
+    Args:
+        model: The Data model of the fetcher.
+        data: The extracted records or frame.
+
+    Returns:
+        List: The models.
+    """
+    if use_fast_transform():
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        try:
+            return construct_models(model, frame)
+        except ValueError as e:
+            logger.warning(f"Fast transform of {model.__name__} failed, validating every record: {e}")
+    records = data.to_dict(orient="records") if isinstance(data, pd.DataFrame) else data
+    return [model.model_validate(d) for d in records]
+
+def transform_frame(model: Type[ModelType], data: pd.DataFrame) -> Union[List[ModelType], ColumnarResults]:
+    """
+    Build the results of a fetcher that extracts a DataFrame.
+
+    With TUSHARE_COLUMNAR_RESULTS set, the frame is validated column-wise and
+    returned as is, keeping its pandas dtypes, so no record is ever built.
+    Otherwise, or when the frame does not pass the validation, the models are
+    built with `transform_records`.
+
+    Args:
+        model: The Data model of the fetcher.
+        data (pd.DataFrame): The extracted frame.
+
+    Returns:
+        The models, or the validated frame in the columnar result mode.
+    """
+    if use_columnar_results():
+        try:
+            return ColumnarResults(validate_frame(model, data, native=True))
+        except ValueError as e:
+            logger.warning(f"Columnar transform of {model.__name__} failed, validating every record: {e}")
+    return transform_records(model, data)
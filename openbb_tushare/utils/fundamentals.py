@@ -0,0 +1,207 @@
+import re
+import numpy as np
+import pandas as pd
+from datetime import date as dateType
+from typing import Dict, List, Optional, Union
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.pit_store import get_field_mapping, get_pit_store
+from openbb_tushare.utils.ts_statements import META_COLUMNS
+
+logger = get_logger(__name__)
+
+# Statements are searched in this order when a field exists in more than one,
+# e.g. net_income is reported by both the income and the cash flow statement.
+SNAPSHOT_STATEMENTS = ["income_statement", "balance_sheet", "cash_flow"]
+
+QUARTER_END = {"1": "0331", "2": "0630", "3": "0930", "4": "1231"}
+
+def parse_report_period(period: str) -> str:
+    """
+    Convert a report period to the Tushare end_date format.
+
+    Examples:
+        >>> parse_report_period("2024Q4")
+        "20241231"
+        >>> parse_report_period("2024")
+        "20241231"
+        >>> parse_report_period("20240630")
+        "20240630"
+    """
+    period = str(period).strip().upper()
+    match = re.fullmatch(r"(\d{4})(?:Q([1-4])|FY)?", period)
+    if match:
+        year, quarter = match.groups()
+        return f"{year}{QUARTER_END[quarter or '4']}"
+    if re.fullmatch(r"\d{4}(0331|0630|0930|1231)", period):
+        return period
+    raise ValueError(f"Invalid 'period': '{period}'. Expected YYYY, YYYYQn or a quarter end date YYYYMMDD.")
+
+def _select_columns(
+        stored: List[str],
+        mapping: Dict[str, str],
+        fields: Optional[List[str]],
+        found: List[str]
+    ) -> Dict[str, str]:
+    """Map the requested OpenBB names not yet in `found` to stored report columns."""
+    columns: Dict[str, str] = {}
+    for col in stored:
+        name = mapping.get(col, col)
+        if col in META_COLUMNS or col == "known_date" or name in found or name in columns:
+            continue
+        if fields is None or name in fields:
+            columns[name] = col
+    return columns
+
+def get_fundamentals_snapshot(
+        period: str,
+        fields: Optional[List[str]] = None,
+        symbols: Optional[str] = None,
+        as_of: Optional[Union[dateType, str]] = None
+    ) -> pd.DataFrame:
+    """
+    Get one row per company with the requested report items of one period.
+
+    The snapshot is read from the point-in-time statement tables with one
+    query per statement, and the statements are joined on the company code.
+    Companies are present once their statements have been downloaded, either
+    through the statement fetchers or with `pit_store.ingest_period`.
+
+    Args:
+        period (str): Report period, e.g. "2024Q4", "2024" or "20240630".
+        fields (List[str]): OpenBB names of the report items, e.g.
+            ["total_revenue", "net_income", "total_assets"]. All if None.
+        symbols (str): Comma-separated ts_codes, the whole stored universe if None.
+        as_of: Only use revisions announced on or before this date, the latest if None.
+
+    Returns:
+        pd.DataFrame: symbol, period_ending and one column per field.
+    """
+    end_date = parse_report_period(period)
+    as_of = as_of or "99991231"
+    ts_codes = [s.strip() for s in symbols.split(",") if s.strip()] if symbols else None
+
+    frames = []
+    found: List[str] = []
+    for statement in SNAPSHOT_STATEMENTS:
+        store = get_pit_store(statement)
+        columns = _select_columns(store.columns(), get_field_mapping(statement), fields, found)
+        if not columns:
+            continue
+
+        data = store.as_of(as_of, ts_codes=ts_codes, end_date=end_date, columns=list(columns.values()))
+        items = data.set_index("ts_code")[list(columns.values())]
+        items.columns = list(columns)
+        frames.append(items.apply(pd.to_numeric, errors="coerce"))
+        found.extend(columns)
+
+    if fields:
+        missing = [field for field in fields if field not in found]
+        if missing:
+            raise ValueError(f"Invalid 'fields': {', '.join(missing)} not found in the stored statements.")
+    if not frames:
+        return pd.DataFrame()
+
+    snapshot = pd.concat(frames, axis=1, join="outer")
+    snapshot = snapshot.rename_axis("symbol").reset_index()
+    snapshot.insert(1, "period_ending", pd.Timestamp(end_date).date())
+    if fields:
+        snapshot = snapshot[["symbol", "period_ending"] + list(fields)]
+    return snapshot.sort_values("symbol", ignore_index=True)
+
+# Income and cash flow items are reported cumulatively from the start of the fiscal year
+TTM_STATEMENTS = ["income_statement", "cash_flow"]
+
+def _shift_periods(frame: pd.DataFrame, offset) -> pd.DataFrame:
+    """Align every row of a (ts_code, period) indexed frame with the row `offset` quarters earlier."""
+    codes = frame.index.get_level_values(0)
+    periods = frame.index.get_level_values(1)
+    shifted = pd.MultiIndex.from_arrays([codes, periods - offset])
+    return frame.reindex(shifted).set_axis(frame.index)
+
+def _growth(value: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
+    """Relative change against the absolute base, so a smaller loss counts as growth."""
+    growth = (value - base) / base.abs()
+    return growth.mask(~pd.DataFrame(np.isfinite(growth.to_numpy(dtype=float)), index=growth.index, columns=growth.columns))
+
+def get_ttm_metrics(
+        fields: List[str],
+        symbols: Optional[str] = None,
+        as_of: Optional[Union[dateType, str]] = None,
+        start_period: Optional[str] = None
+    ) -> pd.DataFrame:
+    """
+    Derive quarterly, trailing-twelve-month and growth figures from cumulative reports.
+
+    Tushare income and cash flow figures are year-to-date. For every company
+    and quarter this returns, per field:
+        `{field}_quarter`: the single quarter value, YTD minus the previous YTD.
+        `{field}_ttm`: YTD + previous fiscal year - previous year's YTD.
+        `{field}_qoq`: quarterly value against the previous quarter.
+        `{field}_yoy`: quarterly value against the same quarter a year earlier.
+    All companies are computed at once by aligning the reports on their
+    period index, figures with a missing prior report are left empty.
+
+    Args:
+        fields (List[str]): OpenBB names of income or cash flow items, e.g.
+            ["total_revenue", "net_income", "net_cash_from_operating_activities"].
+        symbols (str): Comma-separated ts_codes, the whole stored universe if None.
+        as_of: Only use revisions announced on or before this date, the latest if None.
+        start_period (str): First report period to return, e.g. "2020Q1".
+
+    Returns:
+        pd.DataFrame: symbol, period_ending, fiscal_year, fiscal_period and the derived columns.
+    """
+    as_of = as_of or "99991231"
+    ts_codes = [s.strip() for s in symbols.split(",") if s.strip()] if symbols else None
+
+    frames = []
+    found: List[str] = []
+    for statement in TTM_STATEMENTS:
+        store = get_pit_store(statement)
+        columns = _select_columns(store.columns(), get_field_mapping(statement), fields, found)
+        if not columns:
+            continue
+        data = store.as_of(as_of, ts_codes=ts_codes, columns=list(columns.values()))
+        data = data[data["end_date"].str[4:].isin(QUARTER_END.values())]
+        year = data["end_date"].str[:4].astype(int)
+        quarter = data["end_date"].str[4:].map({v: int(k) for k, v in QUARTER_END.items()})
+        items = data[list(columns.values())].apply(pd.to_numeric, errors="coerce")
+        items.columns = list(columns)
+        items.index = pd.MultiIndex.from_arrays([data["ts_code"], year * 4 + quarter - 1], names=["symbol", "period"])
+        frames.append(items)
+        found.extend(columns)
+
+    missing = [field for field in fields if field not in found]
+    if missing:
+        raise ValueError(f"Invalid 'fields': {', '.join(missing)} not found in the stored income or cash flow statements.")
+
+    ytd = pd.concat(frames, axis=1, join="outer")[fields] if frames else pd.DataFrame()
+    if ytd.empty:
+        return pd.DataFrame()
+
+    periods = ytd.index.get_level_values(1).to_numpy()
+    quarter = pd.Series(periods % 4 + 1, index=ytd.index)
+    first_quarter = pd.DataFrame({field: quarter == 1 for field in fields})
+    fourth_quarter = pd.DataFrame({field: quarter == 4 for field in fields})
+
+    single = ytd.where(first_quarter, ytd - _shift_periods(ytd, 1))
+    ttm = ytd.where(fourth_quarter, ytd + _shift_periods(ytd, quarter.to_numpy()) - _shift_periods(ytd, 4))
+    qoq = _growth(single, _shift_periods(single, 1))
+    yoy = _growth(single, _shift_periods(single, 4))
+
+    result = pd.concat([
+        ytd.add_suffix("_ytd"), single.add_suffix("_quarter"), ttm.add_suffix("_ttm"),
+        qoq.add_suffix("_qoq"), yoy.add_suffix("_yoy"),
+    ], axis=1)
+    result = result[[f"{field}_{kind}" for field in fields for kind in ("ytd", "quarter", "ttm", "qoq", "yoy")]]
+    result = result.reset_index()
+
+    year = result["period"] // 4
+    fiscal_quarter = (result["period"] % 4 + 1).astype(str)
+    end_date = year.astype(str) + fiscal_quarter.map(QUARTER_END)
+    result.insert(1, "period_ending", pd.to_datetime(end_date, format="%Y%m%d").dt.date)
+    result.insert(2, "fiscal_year", year)
+    result.insert(3, "fiscal_period", ("Q" + fiscal_quarter).replace("Q4", "FY"))
+    if start_period:
+        result = result[end_date >= parse_report_period(start_period)]
+    return result.drop(columns=["period"]).sort_values(["symbol", "period_ending"], ignore_index=True)
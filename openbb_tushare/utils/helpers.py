@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 def get_api_key(api_key : Optional[str] = "") -> str:
     if api_key:
@@ -25,3 +25,51 @@ def get_fiscal_period(end_type:int) -> str:
         return "FY"
     else:
         return "Unknown"
+
+MAX_WORKERS = 8
+
+def map_concurrently(func: Callable[[Any], Any], items: List[Hashable], max_workers: int = MAX_WORKERS) -> Tuple[Dict[Any, Any], Dict[Any, Exception]]:
+    """
+    Run `func` for every item in a bounded thread pool.
+
+    Args:
+        func: Callable taking a single item.
+        items: Items to process, e.g. ts_codes or (start, end) date ranges.
+        max_workers: Upper bound on concurrently running calls.
+
+    Returns:
+        A tuple of (results, errors), both keyed by item.
+    """
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+
+    results: Dict[Any, Any] = {}
+    errors: Dict[Any, Exception] = {}
+    if not items:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        # Each call runs in a copy of the caller's context, e.g. its Tushare priority
+        futures = {item: pool.submit(contextvars.copy_context().run, func, item) for item in items}
+        for item, future in futures.items():
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                errors[item] = e
+    return results, errors
+
+def raise_or_warn(errors: Dict[str, Exception], has_results: bool) -> None:
+    """
+    Report per-symbol errors of a multi-symbol request.
+
+    Raises an OpenBBError when no symbol returned data, otherwise every
+    error is issued as a warning.
+    """
+    from warnings import warn
+    from openbb_core.app.model.abstract.error import OpenBBError
+
+    messages = [f"Error getting data for {symbol} -> {e.__class__.__name__}: {e}" for symbol, e in errors.items()]
+    if messages and not has_results:
+        raise OpenBBError("\n".join(messages))
+    for message in messages:
+        warn(message)
@@ -0,0 +1,117 @@
+"""Logging of the openbb_tushare package."""
+import os
+import atexit
+import logging
+import threading
+from queue import SimpleQueue
+from typing import Dict, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+PACKAGE_LOGGER = "openbb_tushare"
+
+# Level of the package, e.g. DEBUG, INFO (default) or WARNING
+LOG_LEVEL_ENV = "TUSHARE_LOG_LEVEL"
+# Levels per subsystem, e.g. "utils.blob_cache=DEBUG,utils.ts_equity_historical=WARNING".
+# A subsystem is a module or package below openbb_tushare.
+LOG_LEVELS_ENV = "TUSHARE_LOG_LEVELS"
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_configured = False
+
+def parse_levels(value: str) -> Dict[str, int]:
+    """
+    Parse subsystem levels.
+
+    Examples:
+        >>> parse_levels("utils.blob_cache=DEBUG, models=warning")
+        {"openbb_tushare.utils.blob_cache": 10, "openbb_tushare.models": 30}
+    """
+    levels: Dict[str, int] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, level = item.partition("=")
+        levels[subsystem_logger_name(name.strip())] = _to_level(level)
+    return levels
+
+def subsystem_logger_name(subsystem: str) -> str:
+    """Logger name of a subsystem, e.g. utils.blob_cache -> openbb_tushare.utils.blob_cache."""
+    if subsystem == PACKAGE_LOGGER or subsystem.startswith(PACKAGE_LOGGER + "."):
+        return subsystem
+    return f"{PACKAGE_LOGGER}.{subsystem}"
+
+def _to_level(level: str) -> int:
+    value = logging.getLevelName(level.strip().upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Invalid log level: '{level}'.")
+    return value
+
+def setup_logging() -> None:
+    """
+    Configure the package logging, once.
+
+    Records of the package are put on a queue by the logging call and written
+    to the console and the rotating log file by a background thread, so file
+    I/O does not block the caller. When the application has configured the
+    root logger already, the records propagate to its handlers instead.
+
+    Levels are read from TUSHARE_LOG_LEVEL and TUSHARE_LOG_LEVELS.
+    """
+    global _configured, _listener
+    if _configured:
+        return
+    with _lock:
+        if _configured:
+            return
+        package_logger = logging.getLogger(PACKAGE_LOGGER)
+        package_logger.setLevel(_to_level(os.environ.get(LOG_LEVEL_ENV, "INFO")))
+        for name, level in parse_levels(os.environ.get(LOG_LEVELS_ENV, "")).items():
+            logging.getLogger(name).setLevel(level)
+
+        if not logging.getLogger().handlers:
+            from openbb_tushare.utils import get_log_path
+
+            formatter = logging.Formatter(LOG_FORMAT)
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            file_handler = RotatingFileHandler(
+                get_log_path(),
+                maxBytes=1024 * 1024,  # 1MB per file
+                backupCount=5,          # Keep 5 backups
+            )
+            file_handler.setFormatter(formatter)
+
+            queue: SimpleQueue = SimpleQueue()
+            _listener = QueueListener(queue, console_handler, file_handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+            package_logger.addHandler(QueueHandler(queue))
+            package_logger.propagate = False
+        _configured = True
+
+def shutdown_logging() -> None:
+    """Write the queued records, stop the background thread and undo `setup_logging`."""
+    global _configured, _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+            package_logger = logging.getLogger(PACKAGE_LOGGER)
+            for handler in [h for h in package_logger.handlers if isinstance(h, QueueHandler)]:
+                package_logger.removeHandler(handler)
+            package_logger.propagate = True
+        _configured = False
+
+def set_log_level(subsystem: str, level: str) -> None:
+    """Set the level of a subsystem, e.g. set_log_level("utils.blob_cache", "DEBUG")."""
+    logging.getLogger(subsystem_logger_name(subsystem)).setLevel(_to_level(level))
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the logger of a module, configuring the package logging on first use."""
+    setup_logging()
+    return logging.getLogger(name)
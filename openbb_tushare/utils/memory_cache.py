@@ -0,0 +1,133 @@
+"""
+Process-local LRU of DataFrames in front of the SQLite caches.
+
+Repeated reads of the same entry, e.g. the history of an index heavyweight,
+are served from memory without a SQLite query or unpickling. The memory tier
+is bounded by the bytes of the cached DataFrames, TUSHARE_MEMORY_CACHE_MB
+(128 by default, 0 disables it), and the least recently used entries are
+evicted first.
+
+Entries are grouped in namespaces, one per cache table. Writes through
+`TableCache` invalidate the entries of their table and writes through
+`BlobCache` replace their entry. Writes of other processes are seen once an
+entry is evicted or, for the blob cache, expires.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+import pandas as pd
+from openbb_tushare.utils import metrics
+
+MEMORY_CACHE_ENV = "TUSHARE_MEMORY_CACHE_MB"
+DEFAULT_MEMORY_CACHE_MB = 128
+
+# (database path, table, cache name in the metrics)
+Namespace = Tuple[str, str, str]
+
+def frame_size(data: pd.DataFrame) -> int:
+    """Bytes of memory held by a DataFrame, including the objects of its object columns."""
+    return int(data.memory_usage(index=True, deep=True).sum())
+
+class MemoryCache:
+    """
+    LRU of DataFrames bounded by their size in bytes.
+
+    Args:
+        max_bytes (int): Bytes of the cached DataFrames at most, 0 to cache nothing.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (namespace, key) -> (data, bytes, stored timestamp)
+        self._entries: "OrderedDict[Tuple[Namespace, Hashable], Tuple[pd.DataFrame, int, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: Namespace, key: Hashable) -> Optional[Tuple[pd.DataFrame, Optional[float]]]:
+        """
+        Return a copy of the cached data and the timestamp it was stored with, or None.
+
+        Callers get copies, changing them leaves the cached DataFrame alone.
+        """
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end((namespace, key))
+        cache = namespace[2]
+        if entry is None:
+            metrics.inc("tushare_memory_cache_requests_total", cache=cache, result="miss")
+            return None
+        metrics.inc("tushare_memory_cache_requests_total", cache=cache, result="hit")
+        return entry[0].copy(), entry[2]
+
+    def put(self, namespace: Namespace, key: Hashable, data: pd.DataFrame, timestamp: Optional[float] = None) -> None:
+        """Cache a copy of `data`, unless it is larger than the whole cache."""
+        nbytes = frame_size(data)
+        if nbytes > self.max_bytes:
+            return
+        data = data.copy()
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop((namespace, key), None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[(namespace, key)] = (data, nbytes, timestamp)
+            self.size += nbytes
+            while self.size > self.max_bytes:
+                _, (_, size, _) = self._entries.popitem(last=False)
+                self.size -= size
+                evicted += 1
+            self.evictions += evicted
+        if evicted:
+            metrics.inc("tushare_memory_cache_evictions_total", evicted, cache=namespace[2])
+
+    def invalidate(self, namespace: Namespace, key: Optional[Hashable] = None) -> None:
+        """Drop the entry `key` of a namespace, or all its entries."""
+        with self._lock:
+            keys = [(namespace, key)] if key is not None else [k for k in self._entries if k[0] == namespace]
+            for k in keys:
+                entry = self._entries.pop(k, None)
+                if entry is not None:
+                    self.size -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hits, misses, evictions, entries, bytes and hit rate of the cache."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self.hits / requests if requests else 0.0,
+            }
+
+_memory_cache: Optional[MemoryCache] = None
+_memory_cache_lock = threading.Lock()
+
+def get_memory_cache() -> Optional[MemoryCache]:
+    """Return the memory tier of the process, None when disabled by TUSHARE_MEMORY_CACHE_MB=0."""
+    global _memory_cache
+    max_bytes = int(float(os.environ.get(MEMORY_CACHE_ENV, DEFAULT_MEMORY_CACHE_MB)) * 1024 * 1024)
+    if max_bytes <= 0:
+        return None
+    with _memory_cache_lock:
+        if _memory_cache is None:
+            _memory_cache = MemoryCache(max_bytes)
+        else:
+            _memory_cache.max_bytes = max_bytes
+        return _memory_cache
@@ -0,0 +1,210 @@
+"""
+Counters and latency histograms of the caches and the Tushare API.
+
+Metrics:
+    tushare_cache_requests_total{cache, result}: Cache reads, result is hit, miss or expired.
+    tushare_cache_rows_read_total{cache}, tushare_cache_rows_written_total{cache}
+    tushare_cache_bytes_read_total{cache}, tushare_cache_bytes_written_total{cache}
+    tushare_api_requests_total{endpoint, status}: Tushare calls, status is ok or error.
+    tushare_api_rows_total{endpoint}: Rows returned by Tushare.
+    tushare_api_latency_seconds{endpoint}: Histogram of the Tushare call latency.
+
+Examples:
+    >>> from openbb_tushare.utils import metrics
+    >>> metrics.snapshot()["counters"]["tushare_cache_requests_total"]
+    [{"labels": {"cache": "equity_history", "result": "hit"}, "value": 12.0}, ...]
+    >>> print(metrics.prometheus_text())
+    >>> metrics.start_metrics_server(9464)
+"""
+import json
+import math
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Upper bounds of the latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+class Histogram:
+    """Bucketed observations with their count and sum."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations at or below it) per bucket, ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms identified by a name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """Add `value` to a counter."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record an observation in a histogram."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Return the current values as plain data."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [{
+                    "labels": dict(key),
+                    "count": h.count,
+                    "sum": h.sum,
+                    "buckets": {_format_bound(bound): count for bound, count in h.cumulative()},
+                } for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+        data = self.snapshot()
+        for name, series in sorted(data["counters"].items()):
+            lines.append(f"# TYPE {name} counter")
+            for item in series:
+                lines.append(f"{name}{_format_labels(item['labels'])} {item['value']}")
+        for name, series in sorted(data["histograms"].items()):
+            lines.append(f"# TYPE {name} histogram")
+            for item in series:
+                for bound, count in item["buckets"].items():
+                    labels = _format_labels({**item["labels"], "le": bound})
+                    lines.append(f"{name}_bucket{labels} {count}")
+                lines.append(f"{name}_sum{_format_labels(item['labels'])} {item['sum']}")
+                lines.append(f"{name}_count{_format_labels(item['labels'])} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Remove all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+REGISTRY = MetricsRegistry()
+
+def inc(name: str, value: float = 1.0, **labels):
+    """Add `value` to a counter of the package registry."""
+    REGISTRY.inc(name, value, **labels)
+
+def observe(name: str, value: float, **labels):
+    """Record an observation in a histogram of the package registry."""
+    REGISTRY.observe(name, value, **labels)
+
+def snapshot() -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Return the current values of the package registry."""
+    return REGISTRY.snapshot()
+
+def prometheus_text() -> str:
+    """Return the package registry in the Prometheus text format."""
+    return REGISTRY.to_prometheus()
+
+def dump_snapshot(path: str):
+    """Write a JSON snapshot of the package registry with its timestamp to `path`."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"timestamp": time.time(), **snapshot()}, f, indent=2)
+
+def reset():
+    """Remove all metrics of the package registry."""
+    REGISTRY.reset()
+
+def record_cache_read(cache: str, result: str, rows: int = 0, nbytes: int = 0):
+    """Count a cache read, `result` is hit, miss or expired."""
+    REGISTRY.inc("tushare_cache_requests_total", cache=cache, result=result)
+    if rows:
+        REGISTRY.inc("tushare_cache_rows_read_total", rows, cache=cache)
+    if nbytes:
+        REGISTRY.inc("tushare_cache_bytes_read_total", nbytes, cache=cache)
+
+def record_cache_write(cache: str, rows: int = 0, nbytes: int = 0):
+    """Count the rows and bytes written to a cache."""
+    REGISTRY.inc("tushare_cache_rows_written_total", rows, cache=cache)
+    REGISTRY.inc("tushare_cache_bytes_written_total", nbytes, cache=cache)
+
+def start_metrics_server(port: int = 9464, addr: str = "127.0.0.1"):
+    """
+    Serve the package registry in the Prometheus text format at http://addr:port/metrics.
+
+    The server runs in a daemon thread, returns the server so it can be shut down.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="tushare-metrics", daemon=True).start()
+    return server
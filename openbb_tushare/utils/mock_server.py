@@ -0,0 +1,484 @@
+"""
+Local stand-in for the Tushare HTTP API, for offline load and rate-limit tests.
+
+    python -m openbb_tushare.utils.mock_server --port 8765 --latency 0.05 --error-rate 0.01 --quota 500
+    export TUSHARE_API_URL=http://127.0.0.1:8765/dataapi
+
+The server answers `POST {url}/{api_name}` requests in the Tushare format with
+deterministic synthetic data: the same request always returns the same rows and
+overlapping date ranges agree, whatever the order of the requests.
+"""
+import json
+import random
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Trading calendar of the synthetic prices, weekdays only
+CALENDAR_START, CALENDAR_END = "19900101", "20301231"
+# Rows returned per call at most, like the Tushare limits of the endpoints
+ROW_LIMITS = {"daily": 6000, "hk_daily": 5000, "dividend": 6000, "balancesheet": 6000,
+              "income": 6000, "cashflow": 6000, "balancesheet_vip": 6000, "income_vip": 6000,
+              "cashflow_vip": 6000}
+DEFAULT_ROW_LIMIT = 10000
+
+QUOTA_ERROR = (40203, "抱歉，您每分钟最多访问该接口{quota}次，权限的具体详情访问：https://tushare.pro/document/1?doc_id=108。")
+SERVER_ERROR = (-1, "系统内部错误，请稍后重试。")
+TOKEN_ERROR = (40101, "您的token不对，请确认。")
+ENDPOINT_ERROR = (40101, "请指定正确的接口名")
+
+INDUSTRIES = ["银行", "证券", "保险", "白酒", "医药", "半导体", "汽车", "电力", "房地产", "软件"]
+AREAS = ["北京", "上海", "深圳", "广东", "浙江", "江苏", "山东", "四川"]
+
+def _rng(*keys: Any) -> np.random.Generator:
+    return np.random.default_rng(zlib.crc32("|".join(map(str, keys)).encode()))
+
+def _codes(value: Optional[str]) -> List[str]:
+    return [code.strip() for code in str(value or "").split(",") if code.strip()]
+
+class MockData:
+    """Deterministic synthetic tables of a universe of A-share and HK stocks."""
+
+    def __init__(self, universe: int = 500, seed: int = 0):
+        self.universe = universe
+        self.seed = seed
+        half = (universe + 1) // 2
+        self.cn_codes = [f"{600000 + i:06d}.SH" for i in range(half)] + \
+                        [f"{1 + i:06d}.SZ" for i in range(universe - half)]
+        self.hk_codes = [f"{1 + i:05d}.HK" for i in range(max(1, universe // 5))]
+        self.calendar = pd.bdate_range(CALENDAR_START, CALENDAR_END)
+        self.endpoints: Dict[str, Callable[[Dict[str, Any]], pd.DataFrame]] = {
+            "daily": self.daily,
+            "hk_daily": self.daily,
+            "stock_basic": self.stock_basic,
+            "hk_basic": self.hk_basic,
+            "stock_company": self.stock_company,
+            "balancesheet": lambda params: self.statements("balance_sheet", params),
+            "income": lambda params: self.statements("income_statement", params),
+            "cashflow": lambda params: self.statements("cash_flow", params),
+            "balancesheet_vip": lambda params: self.statements("balance_sheet", params),
+            "income_vip": lambda params: self.statements("income_statement", params),
+            "cashflow_vip": lambda params: self.statements("cash_flow", params),
+            "dividend": self.dividend,
+            "index_basic": self.index_basic,
+            "fund_basic": self.fund_basic,
+            "realtime_quote": self.realtime_quote,
+            "rt_hk_k": self.rt_hk_k,
+        }
+
+    def query(self, api_name: str, params: Dict[str, Any]) -> pd.DataFrame:
+        """Rows of an endpoint for the request parameters, raises KeyError for unknown endpoints."""
+        return self.endpoints[api_name](params)
+
+    def _name(self, ts_code: str) -> str:
+        return f"模拟{ts_code[:6]}"
+
+    def _bars(self, ts_code: str) -> Dict[str, np.ndarray]:
+        """Daily bars of a code on the whole calendar, the closes are a random walk."""
+        rng = _rng(self.seed, "daily", ts_code)
+        n = len(self.calendar)
+        close = (rng.uniform(5, 50) * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))).round(2)
+        return {
+            "open": (close * rng.uniform(0.98, 1.02, n)).round(2),
+            "high": (close * 1.02).round(2),
+            "low": (close * 0.97).round(2),
+            "close": close,
+            "pre_close": np.concatenate((close[:1], close[:-1])),
+            "vol": rng.uniform(1e4, 1e6, n).round(0),
+            "amount": rng.uniform(1e5, 1e7, n).round(3),
+        }
+
+    def daily(self, params: Dict[str, Any]) -> pd.DataFrame:
+        """Daily bars, newest first, by ts_code and a date range or by trade_date for all codes."""
+        codes = _codes(params.get("ts_code"))
+        if params.get("trade_date"):
+            start = end = str(params["trade_date"])
+            codes = codes or self.cn_codes
+        else:
+            start = str(params.get("start_date") or CALENDAR_START)
+            end = str(params.get("end_date") or date.today().strftime("%Y%m%d"))
+        lo = self.calendar.searchsorted(pd.Timestamp(start))
+        hi = self.calendar.searchsorted(pd.Timestamp(end), side="right")
+        dates = self.calendar[lo:hi][::-1].strftime("%Y%m%d")
+        frames = []
+        for code in codes:
+            bars = {column: values[lo:hi][::-1] for column, values in self._bars(code).items()}
+            frame = pd.DataFrame({"ts_code": code, "trade_date": dates, **bars})
+            frame.insert(7, "change", (frame["close"] - frame["pre_close"]).round(2))
+            frame.insert(8, "pct_chg", ((frame["close"] / frame["pre_close"] - 1) * 100).round(4))
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def stock_basic(self, params: Dict[str, Any]) -> pd.DataFrame:
+        rows = []
+        for i, code in enumerate(self.cn_codes):
+            rows.append({
+                "ts_code": code, "symbol": code[:6], "name": self._name(code),
+                "area": AREAS[i % len(AREAS)], "industry": INDUSTRIES[i % len(INDUSTRIES)],
+                "fullname": f"{self._name(code)}股份有限公司", "enname": f"Mock {code[:6]} Co., Ltd.",
+                "cnspell": f"mn{code[:6]}", "market": "主板", "exchange": "SSE" if code.endswith(".SH") else "SZSE",
+                "curr_type": "CNY", "list_status": "L", "list_date": f"{2000 + i % 20}0105",
+                "delist_date": None, "is_hs": "N", "act_name": None, "act_ent_type": None,
+            })
+        data = pd.DataFrame(rows)
+        if params.get("exchange"):
+            data = data[data["exchange"] == params["exchange"]]
+        if params.get("list_status"):
+            data = data[data["list_status"] == params["list_status"]]
+        return self._by_code(data, params)
+
+    def hk_basic(self, params: Dict[str, Any]) -> pd.DataFrame:
+        data = pd.DataFrame([{
+            "ts_code": code, "name": self._name(code), "fullname": f"{self._name(code)}有限公司",
+            "enname": f"Mock {code[:5]} Holdings", "cn_spell": f"mn{code[:5]}", "market": "主板",
+            "list_status": "L", "list_date": f"{1995 + i % 25}0610", "delist_date": None,
+            "trade_unit": 500.0, "isin": f"HK000000{i:04d}", "curr_type": "HKD",
+        } for i, code in enumerate(self.hk_codes)])
+        return self._by_code(data, params)
+
+    def stock_company(self, params: Dict[str, Any]) -> pd.DataFrame:
+        data = pd.DataFrame([{
+            "ts_code": code, "com_name": f"{self._name(code)}股份有限公司", "com_id": f"91{i:016d}",
+            "exchange": "SSE" if code.endswith(".SH") else "SZSE", "chairman": "张三", "manager": "李四",
+            "secretary": "王五", "reg_capital": float(10000 + i * 100), "setup_date": f"{1990 + i % 30}0301",
+            "province": AREAS[i % len(AREAS)], "city": AREAS[i % len(AREAS)], "introduction": "模拟公司简介",
+            "website": f"www.mock{code[:6]}.com", "email": f"ir@mock{code[:6]}.com", "office": "模拟办公地址",
+            "employees": 1000 + i, "main_business": "模拟主营业务", "business_scope": "模拟经营范围",
+        } for i, code in enumerate(self.cn_codes)])
+        return self._by_code(data, params)
+
+    @staticmethod
+    def _statement_items(statement: str) -> List[str]:
+        if statement == "balance_sheet":
+            from openbb_tushare.utils.ts_balance_sheet import BALANCE_SHEET_FIELDS as fields
+        elif statement == "income_statement":
+            from openbb_tushare.utils.ts_income_statement import INCOME_STATEMENT_FIELDS as fields
+        else:
+            from openbb_tushare.utils.ts_cash_flow import CASH_FLOW_FIELDS as fields
+        return list(fields)
+
+    @lru_cache(maxsize=4096)
+    def _statement(self, statement: str, ts_code: str) -> pd.DataFrame:
+        """Quarterly reports of a code from 2010 on, newest first."""
+        ends = pd.date_range("2010-03-31", "2024-12-31", freq="QE")[::-1]
+        rng = _rng(self.seed, statement, ts_code)
+        data = pd.DataFrame({
+            "ts_code": ts_code,
+            "ann_date": (ends + pd.to_timedelta(rng.integers(20, 100, len(ends)), unit="D")).strftime("%Y%m%d"),
+            "end_date": ends.strftime("%Y%m%d"),
+            "report_type": "1",
+            "comp_type": "1",
+            "end_type": ((ends.month - 1) // 3 + 1).astype(str),
+            "update_flag": "1",
+        })
+        data.insert(2, "f_ann_date", data["ann_date"])
+        items = self._statement_items(statement)
+        values = rng.uniform(1e6, 1e10, (len(ends), len(items))).round(2)
+        return pd.concat([data, pd.DataFrame(values, columns=items)], axis=1)
+
+    def statements(self, statement: str, params: Dict[str, Any]) -> pd.DataFrame:
+        """Reports by ts_code, or of all codes for a period (the _vip endpoints)."""
+        codes = _codes(params.get("ts_code")) or (self.cn_codes if params.get("period") else [])
+        if not codes:
+            return pd.DataFrame()
+        data = pd.concat([self._statement(statement, code) for code in codes], ignore_index=True)
+        for column in ("period", "ann_date", "end_date"):
+            if params.get(column):
+                data = data[data["end_date" if column == "period" else column] == str(params[column])]
+        return data.reset_index(drop=True)
+
+    @lru_cache(maxsize=1)
+    def _dividends(self) -> pd.DataFrame:
+        """A yearly cash dividend of every A-share code from 2010 to 2024."""
+        rows = []
+        for code in self.cn_codes:
+            rng = _rng(self.seed, "dividend", code)
+            for year in range(2010, 2025):
+                ann = date(year, 3, 20) + timedelta(days=int(rng.integers(0, 40)))
+                imp_ann = ann + timedelta(days=int(rng.integers(30, 60)))
+                record = imp_ann + timedelta(days=int(rng.integers(5, 15)))
+                ex_date = record + timedelta(days=1)
+                while ex_date.weekday() >= 5:
+                    ex_date += timedelta(days=1)
+                cash_div = round(float(rng.uniform(0.05, 2.0)), 3)
+                rows.append({
+                    "ts_code": code, "end_date": f"{year - 1}1231", "ann_date": ann.strftime("%Y%m%d"),
+                    "div_proc": "实施", "stk_div": 0.0, "stk_bo_rate": None, "stk_co_rate": None,
+                    "cash_div": cash_div, "cash_div_tax": cash_div, "record_date": record.strftime("%Y%m%d"),
+                    "ex_date": ex_date.strftime("%Y%m%d"), "pay_date": ex_date.strftime("%Y%m%d"),
+                    "div_listdate": None, "imp_ann_date": imp_ann.strftime("%Y%m%d"),
+                    "base_date": f"{year - 1}1231", "base_share": float(rng.integers(10000, 1000000)),
+                })
+        return pd.DataFrame(rows).sort_values(["ts_code", "end_date"], ascending=[True, False], ignore_index=True)
+
+    def dividend(self, params: Dict[str, Any]) -> pd.DataFrame:
+        data = self._dividends()
+        for column in ("ann_date", "record_date", "ex_date", "imp_ann_date"):
+            if params.get(column):
+                data = data[data[column] == str(params[column])]
+        return self._by_code(data, params)
+
+    def index_basic(self, params: Dict[str, Any]) -> pd.DataFrame:
+        data = pd.DataFrame([{
+            "ts_code": f"{i:06d}.{'SH' if i < 500 else 'SZ'}", "name": f"模拟指数{i}", "market": "SSE" if i < 500 else "SZSE",
+            "publisher": "中证公司", "category": "规模指数", "base_date": "20041231", "base_point": 1000.0,
+            "list_date": "20050408",
+        } for i in range(1, 101)] + [{
+            "ts_code": f"{399000 + i:06d}.SZ", "name": f"模拟深证指数{i}", "market": "SZSE", "publisher": "深交所",
+            "category": "综合指数", "base_date": "19940720", "base_point": 1000.0, "list_date": "19950123",
+        } for i in range(1, 51)])
+        if params.get("market"):
+            data = data[data["market"] == params["market"]]
+        return self._by_code(data, params)
+
+    def fund_basic(self, params: Dict[str, Any]) -> pd.DataFrame:
+        rows = []
+        for i in range(300):
+            exchange_traded = i % 3 != 2
+            code = f"{510000 + i:06d}.SH" if i % 2 == 0 else f"{159000 + i:06d}.SZ"
+            rows.append({
+                "ts_code": code if exchange_traded else f"{i:06d}.OF", "name": f"模拟基金{i}",
+                "management": "模拟基金管理有限公司", "custodian": "模拟银行", "fund_type": "ETF" if i % 3 == 0 else "股票型",
+                "found_date": "20200101", "due_date": None, "list_date": "20200110" if exchange_traded else None,
+                "issue_date": "20191201", "delist_date": None, "issue_amount": 10.0, "m_fee": 0.5, "c_fee": 0.1,
+                "duration_year": None, "p_value": 1.0, "min_amount": 0.1, "exp_return": None,
+                "benchmark": "沪深300指数收益率", "status": "L", "invest_type": "被动指数型", "type": "契约型开放式",
+                "trustee": None, "purc_startdate": "20200115", "redm_startdate": "20200115",
+                "market": "E" if exchange_traded else "O",
+            })
+        data = pd.DataFrame(rows)
+        if params.get("market"):
+            data = data[data["market"] == params["market"]]
+        if params.get("status"):
+            data = data[data["status"] == params["status"]]
+        return self._by_code(data, params)
+
+    def realtime_quote(self, params: Dict[str, Any]) -> pd.DataFrame:
+        """Latest quotes with the upper-case columns of `ts.realtime_quote`."""
+        rows = []
+        for code in _codes(params.get("ts_code")) or self.cn_codes[:1]:
+            close = float(self._bars(code)["close"][self.calendar.searchsorted(pd.Timestamp.today()) - 1])
+            rows.append({
+                "NAME": self._name(code), "TS_CODE": code, "DATE": date.today().strftime("%Y%m%d"),
+                "TIME": "15:00:00", "OPEN": round(close * 0.99, 2), "PRE_CLOSE": round(close * 0.995, 2),
+                "PRICE": close, "HIGH": round(close * 1.01, 2), "LOW": round(close * 0.98, 2),
+                "BID": round(close - 0.01, 2), "ASK": round(close + 0.01, 2), "VOLUME": 1000000,
+                "AMOUNT": round(close * 1000000, 2),
+            })
+        return pd.DataFrame(rows)
+
+    def rt_hk_k(self, params: Dict[str, Any]) -> pd.DataFrame:
+        """Latest HK quotes, as returned by `pro.rt_hk_k`."""
+        quotes = self.realtime_quote(params)
+        return pd.DataFrame({
+            "ts_code": quotes["TS_CODE"], "name": quotes["NAME"], "pre_close": quotes["PRE_CLOSE"],
+            "high": quotes["HIGH"], "open": quotes["OPEN"], "low": quotes["LOW"], "close": quotes["PRICE"],
+            "vol": quotes["VOLUME"], "amount": quotes["AMOUNT"],
+        })
+
+    @staticmethod
+    def _by_code(data: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+        codes = _codes(params.get("ts_code"))
+        if codes:
+            data = data[data["ts_code"].isin(codes)]
+        return data.reset_index(drop=True)
+
+class _HTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections of concurrent clients
+    request_queue_size = 1024
+    daemon_threads = True
+
+class MockTushareServer:
+    """
+    HTTP server answering Tushare API requests with `MockData`.
+
+    Args:
+        host (str): Address to bind.
+        port (int): Port to bind, 0 picks a free port.
+        latency (float): Seconds added to every response.
+        jitter (float): Up to this many seconds added to the latency at random.
+        error_rate (float): Share of the requests answered with a server error.
+        http_error_rate (float): Share of the requests answered with the HTTP
+            status `http_status` instead of a Tushare response.
+        http_status (int): Status of the HTTP errors, e.g. 503 or 429.
+        quota (int): Calls per endpoint and `quota_window`, further calls are
+            rejected with the Tushare rate-limit error. 0 means unlimited.
+        quota_window (float): Window of the quota in seconds.
+        universe (int): Number of synthetic A-share codes.
+        seed (int): Seed of the data and of the injected errors.
+
+    Example:
+        with MockTushareServer(latency=0.01, quota=200) as server:
+            os.environ["TUSHARE_API_URL"] = server.url
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            quota: int = 0,
+            quota_window: float = 60.0,
+            universe: int = 500,
+            seed: int = 0,
+            http_error_rate: float = 0.0,
+            http_status: int = 503
+        ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.http_error_rate = http_error_rate
+        self.http_status = http_status
+        self.quota = quota
+        self.quota_window = quota_window
+        self.data = MockData(universe=universe, seed=seed)
+        self.stats: Dict[str, int] = defaultdict(int)
+        self._random = random.Random(seed)
+        self._calls: Dict[str, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = _HTTPServer((host, port), self._handler())
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/dataapi"
+
+    def start(self) -> "MockTushareServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-tushare", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MockTushareServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _admit(self, api_name: str) -> Optional[tuple]:
+        """The error of a request, if it is throttled or picked for an injected error."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.quota:
+                now = time.monotonic()
+                calls = self._calls[api_name]
+                while calls and calls[0] <= now - self.quota_window:
+                    calls.popleft()
+                if len(calls) >= self.quota:
+                    self.stats["throttled"] += 1
+                    return QUOTA_ERROR[0], QUOTA_ERROR[1].format(quota=self.quota)
+                calls.append(now)
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return SERVER_ERROR
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        return None
+
+    def _http_error(self) -> bool:
+        """Whether a request is picked for an injected HTTP error."""
+        with self._lock:
+            if self.http_error_rate and self._random.random() < self.http_error_rate:
+                self.stats["requests"] += 1
+                self.stats["http_errors"] += 1
+                return True
+        return False
+
+    def respond(self, api_name: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Tushare response body of a request body."""
+        if not request.get("token"):
+            return {"code": TOKEN_ERROR[0], "msg": TOKEN_ERROR[1], "data": None}
+        if api_name not in self.data.endpoints:
+            return {"code": ENDPOINT_ERROR[0], "msg": ENDPOINT_ERROR[1], "data": None}
+        error = self._admit(api_name)
+        if error is not None:
+            return {"code": error[0], "msg": error[1], "data": None}
+
+        params = {k: v for k, v in (request.get("params") or {}).items() if k != "ts_type_name"}
+        data = self.data.query(api_name, params)
+        fields = request.get("fields") or ""
+        fields = [f.strip() for f in fields.split(",") if f.strip()] if isinstance(fields, str) else list(fields)
+        if fields:
+            data = data[[f for f in fields if f in data.columns]]
+        offset = int(params.get("offset") or 0)
+        limit = min(int(params.get("limit") or DEFAULT_ROW_LIMIT), ROW_LIMITS.get(api_name, DEFAULT_ROW_LIMIT))
+        page = data.iloc[offset:offset + limit]
+        items = page.astype(object).where(page.notna(), None).values.tolist()
+        with self._lock:
+            self.stats["rows"] += len(items)
+        return {"code": 0, "msg": "", "data": {"fields": list(page.columns), "items": items,
+                                               "has_more": offset + limit < len(data)}}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.send_error(400, "Invalid JSON")
+                    return
+                if server._http_error():
+                    self.send_error(server.http_status)
+                    return
+                api_name = self.path.rstrip("/").rsplit("/", 1)[-1] or request.get("api_name", "")
+                body = json.dumps(server.respond(api_name, request), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the Tushare HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, up to this many seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with a server error.")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="Share of requests failing with HTTP 503.")
+    parser.add_argument("--quota", type=int, default=0, help="Calls per endpoint and minute, 0 for unlimited.")
+    parser.add_argument("--universe", type=int, default=500, help="Number of synthetic A-share codes.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockTushareServer(args.host, args.port, args.latency, args.jitter, args.error_rate,
+                               args.quota, universe=args.universe, seed=args.seed,
+                               http_error_rate=args.http_error_rate)
+    print(f"Mock Tushare API on {server.url}, set TUSHARE_API_URL={server.url}", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import sqlite3
+import pandas as pd
+from datetime import date as dateType
+from typing import Dict, List, Optional, Union
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.ts_statements import META_COLUMNS
+
+logger = get_logger(__name__)
+
+# Columns identifying one revision of one report
+KEY_COLUMNS = ["ts_code", "end_date", "known_date", "report_type", "update_flag"]
+
+class PointInTimeStore:
+    """
+    Every revision of a financial statement together with the date it became public.
+
+    `known_date` is the actual announcement date (f_ann_date), falling back to
+    ann_date, so a query as of date D only sees what had been published by D.
+    """
+
+    def __init__(self, table_name: str, db_path: Optional[str] = None):
+        self.table_name = table_name
+        if db_path is None:
+            from openbb_tushare.utils import get_cache_path
+            self.db_path = get_cache_path()
+        else:
+            self.db_path = db_path
+        self._ensure_db_exists()
+
+    def _ensure_db_exists(self):
+        """Ensure the table and its as-of indexes exist."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    ts_code TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    known_date TEXT NOT NULL,
+                    ann_date TEXT,
+                    f_ann_date TEXT,
+                    report_type TEXT NOT NULL DEFAULT '',
+                    update_flag TEXT NOT NULL DEFAULT '',
+                    UNIQUE ({', '.join(KEY_COLUMNS)})
+                )
+            ''')
+            conn.execute(f'''
+                CREATE INDEX IF NOT EXISTS {self.table_name}_asof
+                ON {self.table_name} (ts_code, end_date, known_date)
+            ''')
+            conn.execute(f'''
+                CREATE INDEX IF NOT EXISTS {self.table_name}_period
+                ON {self.table_name} (end_date, known_date)
+            ''')
+            conn.commit()
+
+    def _columns(self, conn: sqlite3.Connection) -> List[str]:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({self.table_name})")]
+
+    def columns(self) -> List[str]:
+        """Return the columns currently stored in the table."""
+        with sqlite3.connect(self.db_path) as conn:
+            return self._columns(conn)
+
+    def add_revisions(self, df: pd.DataFrame) -> int:
+        """
+        Store the revisions in `df`, keeping the ones already stored.
+
+        Report items missing from the table are added as new columns.
+
+        Returns:
+            int: Number of rows written.
+        """
+        if df is None or df.empty or "ann_date" not in df.columns:
+            return 0
+
+        df = df.copy()
+        if "f_ann_date" not in df.columns:
+            df["f_ann_date"] = None
+        df["known_date"] = df["f_ann_date"].fillna(df["ann_date"])
+        df = df[df["known_date"].notna()]
+        for col in ("report_type", "update_flag"):
+            df[col] = df[col].fillna("").astype(str) if col in df.columns else ""
+        df = df.drop(columns=["symbol"], errors="ignore")
+
+        columns = list(df.columns)
+        values = df.astype(object).where(df.notna(), None).values.tolist()
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            # Concurrent downloads add the same columns, the write lock is taken
+            # before the columns are read so the migration happens once
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = set(self._columns(conn))
+                for col in columns:
+                    if col not in existing:
+                        dtype = "TEXT" if col in META_COLUMNS else "REAL"
+                        conn.execute(f'ALTER TABLE {self.table_name} ADD COLUMN "{col}" {dtype}')
+                conn.executemany(f'''
+                    INSERT OR REPLACE INTO {self.table_name} ({', '.join(f'"{c}"' for c in columns)})
+                    VALUES ({', '.join(['?'] * len(columns))})
+                ''', values)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        return len(values)
+
+    def as_of(
+            self,
+            as_of: Union[dateType, str],
+            ts_codes: Optional[List[str]] = None,
+            end_date: Optional[str] = None,
+            columns: Optional[List[str]] = None
+        ) -> pd.DataFrame:
+        """
+        Return the latest revision of every report known on `as_of`.
+
+        Args:
+            as_of: Knowledge date, a date or a YYYYMMDD string.
+            ts_codes: Restrict the universe, all stored companies if None.
+            end_date: Restrict to one report period (YYYYMMDD).
+            columns: Report items to read besides the key columns, all if None.
+
+        Returns:
+            pd.DataFrame: One row per (ts_code, end_date).
+        """
+        if isinstance(as_of, dateType):
+            as_of = as_of.strftime("%Y%m%d")
+
+        conditions = ["known_date <= ?"]
+        params: list = [as_of]
+        if ts_codes:
+            conditions.append(f"ts_code IN ({', '.join(['?'] * len(ts_codes))})")
+            params.extend(ts_codes)
+        if end_date:
+            conditions.append("end_date = ?")
+            params.append(end_date)
+
+        selected = "*"
+        if columns is not None:
+            selected = ", ".join(f'"{c}"' for c in dict.fromkeys(KEY_COLUMNS + list(columns)))
+
+        query = f"""
+        SELECT * FROM (
+            SELECT {selected}, ROW_NUMBER() OVER (
+                PARTITION BY ts_code, end_date
+                ORDER BY known_date DESC, update_flag DESC
+            ) AS revision_rank
+            FROM {self.table_name}
+            WHERE {' AND '.join(conditions)}
+        )
+        WHERE revision_rank = 1
+        ORDER BY ts_code ASC, end_date DESC
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+        return df.drop(columns=["revision_rank"])
+
+# Statement -> (PIT table, Tushare bulk endpoint by period)
+STATEMENTS = {
+    "balance_sheet": ("balance_sheet_pit", "balancesheet_vip"),
+    "income_statement": ("income_statement_pit", "income_vip"),
+    "cash_flow": ("cash_flow_pit", "cashflow_vip"),
+}
+
+def get_pit_store(statement: str, db_path: Optional[str] = None) -> PointInTimeStore:
+    """Return the point-in-time store of a statement."""
+    if statement not in STATEMENTS:
+        raise ValueError(f"Invalid statement '{statement}'. Expected one of: {', '.join(STATEMENTS)}.")
+    return PointInTimeStore(STATEMENTS[statement][0], db_path=db_path)
+
+def get_field_mapping(statement: str) -> Dict[str, str]:
+    """Return the Tushare -> OpenBB field mapping of a statement."""
+    # pylint: disable=import-outside-toplevel
+    if statement == "balance_sheet":
+        from openbb_tushare.utils.ts_balance_sheet import BALANCE_SHEET_FIELDS
+        return BALANCE_SHEET_FIELDS
+    if statement == "income_statement":
+        from openbb_tushare.utils.ts_income_statement import INCOME_STATEMENT_FIELDS
+        return INCOME_STATEMENT_FIELDS
+    from openbb_tushare.utils.ts_cash_flow import CASH_FLOW_FIELDS
+    return CASH_FLOW_FIELDS
+
+def ingest_period(statement: str, period: str, api_key: str = "") -> int:
+    """
+    Download one report period for the whole market into the point-in-time store.
+
+    Args:
+        statement (str): "balance_sheet", "income_statement" or "cash_flow".
+        period (str): Report period end date in YYYYMMDD format, e.g. "20241231".
+        api_key (str): Tushare API key.
+
+    Returns:
+        int: Number of revisions stored.
+    """
+    from openbb_tushare.utils.rate_limit import BACKFILL, priority
+    from openbb_tushare.utils.ts_client import get_pro_api
+
+    store = get_pit_store(statement)
+    pro = get_pro_api(api_key)
+    with priority(BACKFILL):
+        data = pro.query(STATEMENTS[statement][1], period=period)
+    logger.info(f"Downloaded {len(data)} {statement} revisions for period {period}.")
+    return store.add_revisions(data)
+
+def get_statements_as_of(
+        statement: str,
+        as_of: Union[dateType, str],
+        symbols: Optional[str] = None,
+        period: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+    """
+    Get statements as they were known on a given date.
+
+    Args:
+        statement (str): "balance_sheet", "income_statement" or "cash_flow".
+        as_of: Knowledge date, a date or a YYYYMMDD string.
+        symbols (str): Comma-separated ts_codes, the whole stored universe if None.
+        period (str): Report period end date in YYYYMMDD format, all periods if None.
+        fields (List[str]): OpenBB names of the report items to return, all if None.
+
+    Returns:
+        pd.DataFrame: One row per company and report period, in OpenBB names.
+    """
+    from openbb_tushare.utils.ts_statements import project_statements
+
+    ts_codes = [s.strip() for s in symbols.split(",") if s.strip()] if symbols else None
+    data = get_pit_store(statement).as_of(as_of, ts_codes=ts_codes, end_date=period)
+    if data.empty:
+        return pd.DataFrame()
+    data = data.assign(symbol=data["ts_code"]).drop(columns=["known_date"])
+    return project_statements(data, get_field_mapping(statement), fields)
@@ -0,0 +1,140 @@
+"""
+Memory-mapped columnar store of daily bars.
+
+Set TUSHARE_PRICE_STORE to 1/true/yes to serve `get_from_cache` from it. The
+bars of a symbol are kept in one file next to the cache database,
+prices/<table>.bin, with every column a contiguous fixed-width array:
+
+    b"TSPX" | version (uint32) | header length (uint32) | JSON header | columns
+
+The JSON header lists the rows and the name, dtype and offset of every column,
+the dates first and ascending. Columns are aligned to 64 bytes.
+
+Reads map the file and slice the date range found by binary search, the
+returned DataFrame wraps the mapped arrays without copying them. Worker
+processes reading the same symbol share the pages of the OS page cache. The
+mapping is private, changing the returned DataFrame never changes the file.
+"""
+import json
+import os
+import struct
+import uuid
+from typing import Optional
+import numpy as np
+import pandas as pd
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+PRICE_STORE_ENV = "TUSHARE_PRICE_STORE"
+MAGIC = b"TSPX"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<4sII")
+
+def use_price_store() -> bool:
+    """Whether the price store is enabled with TUSHARE_PRICE_STORE."""
+    return os.environ.get(PRICE_STORE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+class PriceStore:
+    """
+    Daily bars of the symbols in memory-mapped files.
+
+    Args:
+        db_path (str): Cache database, the files are kept in the prices
+            directory next to it. `get_cache_path()` by default.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            from openbb_tushare.utils import get_cache_path
+            db_path = get_cache_path()
+        self.directory = os.path.join(os.path.dirname(os.path.abspath(db_path)), "prices")
+
+    def path(self, table_name: str) -> str:
+        return os.path.join(self.directory, f"{table_name}.bin")
+
+    def write(self, table_name: str, data: pd.DataFrame) -> bool:
+        """
+        Store the bars of a symbol, replacing the stored ones.
+
+        `data` has a 'date' column and numeric columns otherwise, as cached by
+        `get_from_cache`. Returns False, storing nothing, for other data.
+        """
+        if data.empty or "date" not in data.columns:
+            return False
+        data = data.drop_duplicates(subset="date").sort_values("date", ignore_index=True)
+        columns = {"date": pd.to_datetime(data["date"]).to_numpy()}
+        for name in data.columns:
+            if name == "date":
+                continue
+            if not pd.api.types.is_numeric_dtype(data[name]) or pd.api.types.is_bool_dtype(data[name]):
+                return False
+            columns[name] = data[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        layout, offset = [], 0
+        for name, values in columns.items():
+            layout.append({"name": name, "dtype": values.dtype.str, "offset": offset})
+            offset = _align(offset + values.nbytes)
+        header = json.dumps({"rows": len(data), "columns": layout}).encode()
+        start = _align(_PREFIX.size + len(header))
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(table_name)
+        temp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+                f.write(header)
+                for column, values in zip(layout, columns.values()):
+                    f.seek(start + column["offset"])
+                    f.write(np.ascontiguousarray(values).tobytes())
+            # Readers see the old file or the new one, never a partial one
+            os.replace(temp, path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+        return True
+
+    def read_range(self, table_name: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Bars of a symbol from `start_date` to `end_date`, 'YYYYMMDD', or None when not stored.
+
+        The columns of the DataFrame are views of the mapped file.
+        """
+        path = self.path(table_name)
+        try:
+            mapped = np.memmap(path, dtype=np.uint8, mode="c")
+        except (FileNotFoundError, ValueError):
+            return None
+        magic, version, header_size = _PREFIX.unpack_from(mapped)
+        if magic != MAGIC or version > FORMAT_VERSION:
+            logger.debug(f"Ignoring the price file {path} of version {version}.")
+            return None
+        header = json.loads(bytes(mapped[_PREFIX.size:_PREFIX.size + header_size]))
+        start = _align(_PREFIX.size + header_size)
+        rows = header["rows"]
+
+        columns = {}
+        for column in header["columns"]:
+            dtype = np.dtype(column["dtype"])
+            offset = start + column["offset"]
+            columns[column["name"]] = mapped[offset:offset + rows * dtype.itemsize].view(dtype)
+
+        dates = columns["date"]
+        lo = np.searchsorted(dates, pd.Timestamp(start_date).to_datetime64().astype(dates.dtype), side="left")
+        hi = np.searchsorted(dates, pd.Timestamp(end_date).to_datetime64().astype(dates.dtype), side="right")
+        return pd.DataFrame({name: np.asarray(values[lo:hi]) for name, values in columns.items()}, copy=False)
+
+    def remove(self, table_name: str) -> int:
+        """Remove the bars of a symbol, returns the bytes freed."""
+        path = self.path(table_name)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        return size
@@ -0,0 +1,206 @@
+"""
+Adaptive concurrency of the Tushare calls.
+
+The number of calls in flight follows AIMD, like TCP congestion control: it
+grows by one per window of successful calls and is halved when Tushare
+throttles ("每分钟最多访问该接口N次"), a call fails transiently or the latency
+rises well above the usual latency of its endpoint. Failed calls are retried
+after a jittered exponential backoff, so bulk jobs settle just below the quota
+of the account.
+
+Calls belong to a priority class, set with `priority(...)` around them. Batch
+classes may only fill a share of the limit, the rest of the slots is reserved
+for interactive calls, and freed slots go to the waiting calls of the highest
+class first:
+
+    with priority(BACKFILL):
+        for ts_code in ts_codes:
+            get_from_cache(ts_code, start, end)
+
+`get_from_cache(..., priority=BACKFILL)` does the same for one symbol.
+Ingestion jobs set their class themselves: incremental dividend ingestion
+runs as REFRESH, point-in-time statement ingestion and dividend ingestion
+of a given range as BACKFILL.
+"""
+import contextvars
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from openbb_tushare.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Outcomes of a call
+OK = "ok"
+THROTTLED = "throttled"   # rate limit of Tushare, retried
+TRANSIENT = "transient"   # network or server error, retried
+FATAL = "fatal"           # anything else, e.g. invalid parameters or a used up daily quota
+
+# Priority classes, highest first
+INTERACTIVE = "interactive"
+REFRESH = "refresh"
+BACKFILL = "backfill"
+PRIORITIES = (INTERACTIVE, REFRESH, BACKFILL)
+# Share of the concurrency limit the calls of a class may fill at most
+DEFAULT_SHARES = {INTERACTIVE: 1.0, REFRESH: 0.9, BACKFILL: 0.75}
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("tushare_priority", default=INTERACTIVE)
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run the Tushare calls of the block, and of the threads it maps work to, in a priority class."""
+    if name not in PRIORITIES:
+        raise ValueError(f"Invalid priority '{name}', expected one of {', '.join(PRIORITIES)}.")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+def current_priority() -> str:
+    return _priority.get()
+
+THROTTLE_PATTERN = re.compile(r"每(分钟|小时)最多访问")
+# Server errors of Tushare, HTTP statuses and network errors are classified by their type
+TRANSIENT_PATTERN = re.compile(r"系统内部错误|服务器(繁忙|错误|内部错误)|请稍后重试")
+
+def classify_error(error: BaseException) -> str:
+    """THROTTLED, TRANSIENT or FATAL for an exception raised by a Tushare call."""
+    import requests
+
+    message = str(error)
+    if THROTTLE_PATTERN.search(message):
+        return THROTTLED
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        if status == 429:
+            return THROTTLED
+        return TRANSIENT if status >= 500 else FATAL
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)):
+        return TRANSIENT
+    return TRANSIENT if TRANSIENT_PATTERN.search(message) else FATAL
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Seconds to wait before retry `attempt` (0 for the first), full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class AdaptiveLimiter:
+    """
+    AIMD limit of the calls in flight.
+
+    Args:
+        maximum (int): Calls in flight at most.
+        initial (int): Starting limit, half the maximum by default.
+        minimum (int): Calls in flight at least.
+        decrease (float): Factor of the limit on congestion.
+        latency_factor (float): Latency above this multiple of the latency
+            baseline of the endpoint counts as congestion, 0 to ignore the latency.
+        baseline_decay (float): Share of the distance to a slower latency the
+            baseline of an endpoint moves per call. The baseline drops to any
+            faster latency at once and rises slowly, so a single fast call is
+            forgotten after a few calls.
+        shares (Dict[str, float]): Share of the limit each priority class may
+            fill, decreasing with the priority. DEFAULT_SHARES if None.
+    """
+
+    def __init__(
+            self,
+            maximum: int = 8,
+            initial: Optional[int] = None,
+            minimum: int = 1,
+            decrease: float = 0.5,
+            latency_factor: float = 4.0,
+            baseline_decay: float = 0.1,
+            shares: Optional[Dict[str, float]] = None
+        ):
+        self.maximum = max(minimum, maximum)
+        self.minimum = minimum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.limit = float(min(self.maximum, max(minimum, initial or self.maximum // 2)))
+        self.in_flight = 0
+        self.shares = {**DEFAULT_SHARES, **(shares or {})}
+        self._waiting = {name: 0 for name in PRIORITIES}
+        self.baseline_decay = baseline_decay
+        # Endpoint -> decaying minimum of its latency
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    def capacity(self, name: str) -> int:
+        """
+        Calls in flight up to which a call of the priority class may start.
+
+        Classes with a share below 1 leave at least one slot to the interactive
+        calls, except at a limit of 1 where they would never run.
+        """
+        limit = int(self.limit)
+        capacity = int(limit * self.shares[name])
+        if self.shares[name] < 1:
+            capacity = min(capacity, limit - 1)
+        return max(1, capacity)
+
+    def acquire(self, name: Optional[str] = None) -> float:
+        """Wait for a free slot of the priority class, returns the start time to pass to `release`."""
+        name = name or current_priority()
+        higher = PRIORITIES[:PRIORITIES.index(name)]
+        with self._condition:
+            self._waiting[name] += 1
+            try:
+                while self.in_flight >= self.capacity(name) or any(self._waiting[h] for h in higher):
+                    self._condition.wait()
+            finally:
+                self._waiting[name] -= 1
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started: float, outcome: str, latency: Optional[float] = None, endpoint: str = "") -> None:
+        """Free the slot of a call of `endpoint` started at `started` and adapt the limit to its outcome."""
+        with self._condition:
+            self.in_flight -= 1
+            if outcome == OK and latency is not None:
+                baseline = self._baselines.get(endpoint, latency)
+                congested = self.latency_factor and latency > self.latency_factor * max(baseline, 0.001)
+                self._baselines[endpoint] = latency if latency < baseline else \
+                    baseline + self.baseline_decay * (latency - baseline)
+                if congested:
+                    self._back_off(started, "latency")
+                else:
+                    self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            elif outcome in (THROTTLED, TRANSIENT):
+                self._back_off(started, outcome)
+            self._condition.notify_all()
+
+    def _back_off(self, started: float, reason: str) -> None:
+        # Once per window: calls started before the last decrease saw the old limit
+        if started < self._last_decrease:
+            return
+        self.limit = max(float(self.minimum), self.limit * self.decrease)
+        self._last_decrease = time.monotonic()
+        logger.debug(f"Tushare concurrency reduced to {int(self.limit)} ({reason}).")
+
+    def set_maximum(self, maximum: int) -> None:
+        with self._condition:
+            self.maximum = max(self.minimum, maximum)
+            self.limit = min(self.limit, float(self.maximum))
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, name: Optional[str] = None, endpoint: str = "") -> Iterator[dict]:
+        """
+        Hold a slot of a priority class, the current one by default, for a call of `endpoint`.
+
+        The yielded dict holds the "priority" and the "wait" for the slot in
+        seconds, set its "outcome" and "latency" before leaving.
+        """
+        call = {"outcome": OK, "latency": None, "priority": name or current_priority()}
+        waiting = time.monotonic()
+        started = self.acquire(call["priority"])
+        call["wait"] = started - waiting
+        try:
+            yield call
+        finally:
+            self.release(started, call["outcome"], call["latency"], endpoint)
@@ -3,12 +3,20 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 import pandas as pd
 from datetime import date
+from openbb_tushare.utils.cache_budget import touch
+from openbb_tushare.utils.memory_cache import get_memory_cache
+from openbb_tushare.utils.metrics import record_cache_read, record_cache_write
 
 class TableCache:
     # Extract table schema into a class variable for dynamic modification
 
-    def __init__(self, table_schema: Dict, db_path: Optional[str] = None, table_name: str = "equity_info", primary_key: str = "symbol"):
+    def __init__(self, table_schema: Dict, db_path: Optional[str] = None, table_name: str = "equity_info", primary_key: str = "symbol",
+                 cache_name: Optional[str] = None, evictable: bool = False):
         self.table_name = table_name
+        # Whether the table may be dropped to keep the cache in its disk budget, see `cache_budget`
+        self.evictable = evictable
+        # Name of the cache in the metrics, tables of the same kind share it
+        self.cache_name = cache_name or table_name
         self.conn = None
         self.table_schema = table_schema
         self.primary_key = primary_key
@@ -33,6 +41,31 @@ class TableCache:
             ''')
             conn.commit()
 
+    @property
+    def _namespace(self):
+        return (self.db_path, self.table_name, self.cache_name)
+
+    def _read_memory(self, key) -> Optional[pd.DataFrame]:
+        """Data of a read cached in memory, see `memory_cache`."""
+        memory = get_memory_cache()
+        entry = memory.get(self._namespace, key) if memory is not None else None
+        return entry[0] if entry is not None else None
+
+    def _write_memory(self, key, df: pd.DataFrame):
+        # Empty results are not kept, the next read may find rows written by another process
+        memory = get_memory_cache()
+        if memory is not None and not df.empty:
+            memory.put(self._namespace, key, df)
+
+    def _touch(self):
+        if self.evictable:
+            touch(self.db_path, self.table_name)
+
+    def _invalidate_memory(self):
+        memory = get_memory_cache()
+        if memory is not None:
+            memory.invalidate(self._namespace)
+
     def connect(self):
         """Establish a connection to the SQLite database."""
         if self.conn is None:
@@ -51,14 +84,24 @@ class TableCache:
         """
         with sqlite3.connect(self.db_path) as conn:
             df.to_sql(self.table_name, conn, if_exists='replace', index=False)
+        self._invalidate_memory()
+        self._touch()
+        record_cache_write(self.cache_name, rows=len(df))
+
+    def _record_read(self, df: pd.DataFrame):
+        record_cache_read(self.cache_name, "hit" if not df.empty else "miss", rows=len(df))
 
     def read_dataframe(self) -> pd.DataFrame:
         """
         Read data from the SQLite database and return as a DataFrame.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            query = f"SELECT * FROM {self.table_name}"
-            df = pd.read_sql_query(query, conn)
+        df = self._read_memory(("all",))
+        if df is None:
+            with sqlite3.connect(self.db_path) as conn:
+                query = f"SELECT * FROM {self.table_name}"
+                df = pd.read_sql_query(query, conn)
+            self._write_memory(("all",), df)
+        self._record_read(df)
         return df
 
     def read_rows(self, filters: Dict[str, Any]) -> pd.DataFrame:
@@ -73,6 +116,11 @@ class TableCache:
         """
         if not filters:
             return self.read_dataframe()
+        memory_key = ("rows", tuple(sorted(filters.items())))
+        df = self._read_memory(memory_key)
+        if df is not None:
+            self._record_read(df)
+            return df
         
         # Build WHERE clause dynamically from filters dictionary
         where_conditions = " AND ".join([f"{key} = ?" for key in filters.keys()])
@@ -83,6 +131,8 @@ class TableCache:
         
         with sqlite3.connect(self.db_path) as conn:
             df = pd.read_sql_query(query, conn, params=params)
+        self._write_memory(memory_key, df)
+        self._record_read(df)
         return df
 
     def update_or_insert(self, df: pd.DataFrame):
@@ -103,16 +153,26 @@ class TableCache:
                 '''
                 conn.execute(query, values)
             conn.commit()
+        self._invalidate_memory()
+        self._touch()
+        record_cache_write(self.cache_name, rows=len(df))
 
-    def fetch_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
-        """按日期范围获取数据"""
-        
-        query = f"""
-        SELECT * FROM {self.table_name} 
-        WHERE date BETWEEN ? AND ?
-        ORDER BY date ASC
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql(query, conn, params=(start_date, end_date))
-            df['date'] = pd.to_datetime(df['date'])
-            return df
\ No newline at end of file
+    def fetch_date_range(self, start_date: str, end_date: str, record_metrics: bool = True) -> pd.DataFrame:
+        """按日期范围获取数据, record_metrics=False 时不计入缓存命中统计"""
+
+        memory_key = ("range", start_date, end_date)
+        df = self._read_memory(memory_key)
+        if df is None:
+            query = f"""
+            SELECT * FROM {self.table_name} 
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date ASC
+            """
+            with sqlite3.connect(self.db_path) as conn:
+                df = pd.read_sql(query, conn, params=(start_date, end_date))
+                df['date'] = pd.to_datetime(df['date'])
+            self._write_memory(memory_key, df)
+        self._touch()
+        if record_metrics:
+            self._record_read(df)
+        return df
\ No newline at end of file
@@ -4,38 +4,13 @@ import time
 from datetime import datetime, timedelta, timezone
 import re
 
-# support logging
-import logging
-from logging.handlers import RotatingFileHandler
 from openbb_core.app.utils import get_user_cache_directory
 
-# Configure logging
 def setup_logger():
-    # Create logs directory if it doesn't exist
-    from openbb_tushare.utils import get_log_path
-    log_file = get_log_path()
-
-    # Log format
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    formatter = logging.Formatter(log_format)
-
-    # Log to console
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-
-    # Log to file (with rotation)
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=1024 * 1024,  # 1MB per file
-        backupCount=5,          # Keep 5 backups
-    )
-    file_handler.setFormatter(formatter)
-
-    # Root logger configuration
-    logging.basicConfig(
-        level=logging.INFO,     # Default level
-        handlers=[console_handler, file_handler]
-    )
+    """Configure the package logging, kept for compatibility, see `log.setup_logging`."""
+    from openbb_tushare.utils.log import setup_logging
+
+    setup_logging()
 
 def get_working_days(start_date: str, end_date: str) -> int:
     """Calculate number of working days between two dates"""
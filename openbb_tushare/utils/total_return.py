@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+from datetime import date as dateType
+from typing import Union
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.helpers import MAX_WORKERS
+
+logger = get_logger(__name__)
+
+# Stage of a dividend event that has an ex-date
+IMPLEMENTED = "实施"
+
+def bonus_share_ratio(events: pd.DataFrame) -> pd.Series:
+    """New shares per share, stk_div or else bonus (stk_bo_rate) plus transfer (stk_co_rate) shares."""
+    def column(name: str) -> pd.Series:
+        if name not in events.columns:
+            return pd.Series(np.nan, index=events.index)
+        return pd.to_numeric(events[name], errors="coerce")
+
+    parts = column("stk_bo_rate").fillna(0) + column("stk_co_rate").fillna(0)
+    return column("stk_div").fillna(parts)
+
+def total_return_index(
+        prices: pd.DataFrame,
+        events: pd.DataFrame,
+        base: float = 1.0
+    ) -> pd.DataFrame:
+    """
+    Compute total return indexes for many symbols at once.
+
+    Cash dividends are reinvested at the ex-date close and bonus/transfer
+    shares (stk_div per share) increase the holding on the ex-date, so the
+    daily growth factor of a symbol is
+
+        (close[t] * (1 + stk_div[t]) + cash_div[t]) / close[t-1]
+
+    Prices are aligned into a date x symbol matrix; suspended days carry the
+    last close forward, and events falling on a day the symbol did not trade
+    are applied on its next trading day, against the close before the suspension.
+
+    Args:
+        prices (pd.DataFrame): Unadjusted daily bars with symbol, date and close columns.
+        events (pd.DataFrame): Dividend events with ts_code, ex_date (YYYYMMDD),
+            cash_div_tax and stk_div (or stk_bo_rate/stk_co_rate) columns.
+        base (float): Index value on the first trading day of every symbol.
+
+    Returns:
+        pd.DataFrame: Total return index, indexed by date with one column per symbol.
+    """
+    close = prices.pivot_table(index="date", columns="symbol", values="close", aggfunc="last").sort_index()
+    if close.empty:
+        return close
+    traded = close.notna().to_numpy()
+    filled = close.ffill().to_numpy(dtype=float)
+    dates = close.index.to_numpy()
+    symbols = list(close.columns)
+
+    cash = np.zeros_like(filled)
+    split = np.zeros_like(filled)
+    if events is not None and not events.empty:
+        events = events[events["ts_code"].isin(symbols) & events["ex_date"].notna()]
+        ex_dates = pd.to_datetime(events["ex_date"], format="%Y%m%d").to_numpy()
+        rows = np.searchsorted(dates, ex_dates, side="left")
+        cols = pd.Index(symbols).get_indexer(events["ts_code"])
+        # Next row with a close of the symbol, from every row
+        positions = np.where(traded, np.arange(len(dates))[:, None], len(dates))
+        next_traded = np.vstack([np.minimum.accumulate(positions[::-1], axis=0)[::-1],
+                                 np.full((1, len(symbols)), len(dates))])
+        rows = next_traded[rows, cols]
+        in_range = (ex_dates >= dates[0]) & (rows < len(dates))
+        rows, cols = rows[in_range], cols[in_range]
+        np.add.at(cash, (rows, cols), pd.to_numeric(events["cash_div_tax"], errors="coerce").fillna(0).to_numpy()[in_range])
+        np.add.at(split, (rows, cols), bonus_share_ratio(events).to_numpy()[in_range])
+
+    previous = np.vstack([np.full((1, filled.shape[1]), np.nan), filled[:-1]])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        factor = (filled * (1 + split) + cash) / previous
+    # the first trading day of every symbol starts the index
+    factor[~np.isfinite(factor)] = 1.0
+    index = base * np.cumprod(factor, axis=0)
+    index[np.isnan(filled)] = np.nan
+    return pd.DataFrame(index, index=close.index, columns=close.columns)
+
+def get_total_return(
+        symbols: str,
+        start_date: Union[dateType, str],
+        end_date: Union[dateType, str],
+        api_key: str = "",
+        use_cache: bool = True,
+        base: float = 1.0
+    ) -> pd.DataFrame:
+    """
+    Get dividend-adjusted total return indexes from cached daily bars and dividends.
+
+    Args:
+        symbols (str): Comma-separated symbols.
+        start_date: Start date, a date or a YYYY-MM-DD string.
+        end_date: End date, a date or a YYYY-MM-DD string.
+        api_key (str): Tushare API key.
+        use_cache (bool): Whether to use cached data.
+        base (float): Index value on the first trading day of every symbol.
+
+    Returns:
+        pd.DataFrame: Total return index, indexed by date with one column per ts_code.
+    """
+    from openbb_tushare.utils.helpers import map_concurrently, raise_or_warn
+    from openbb_tushare.utils.tools import normalize_symbol
+    from openbb_tushare.utils.ts_equity_historical import get_from_cache
+    from openbb_tushare.utils.ts_historical_dividends import DividendStore, sync_dividends, to_tushare_date
+
+    ts_codes = list(dict.fromkeys(normalize_symbol(s)[1] for s in symbols.split(",") if s.strip()))
+
+    def load_prices(ts_code: str) -> pd.DataFrame:
+        data = get_from_cache(ts_code, start_date, end_date, api_key=api_key, use_cache=use_cache)
+        return data[["date", "close"]].assign(symbol=ts_code)
+
+    prices, errors = map_concurrently(load_prices, ts_codes, max_workers=MAX_WORKERS)
+    raise_or_warn(errors, bool(prices))
+
+    store = DividendStore()
+    available = sync_dividends(store, list(prices), use_cache=use_cache, api_key=api_key)
+    events = store.read(available, to_tushare_date(start_date), to_tushare_date(end_date))
+    events = events[events["div_proc"] == IMPLEMENTED]
+
+    return total_return_index(pd.concat(prices.values(), ignore_index=True), events, base=base)
@@ -0,0 +1,138 @@
+"""
+Asyncio client of the Tushare pro API.
+
+Speaks the JSON-over-HTTP protocol of `tushare.pro.client.DataApi` directly on
+a pooled aiohttp session, so coroutines of the fetchers do not block the event
+loop. Calls are limited to TUSHARE_MAX_CONCURRENCY in flight per event loop.
+"""
+import asyncio
+import importlib.util
+import os
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+import pandas as pd
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.ts_decode import decode, loads
+from openbb_tushare.utils.helpers import get_api_key
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.ts_client import DEFAULT_MAX_CONCURRENCY, MAX_CONCURRENCY_ENV, get_api_url
+
+logger = get_logger(__name__)
+
+# Official endpoint, as in tushare.pro.client.DataApi
+DEFAULT_API_URL = "http://api.waditu.com/dataapi"
+
+def async_client_available() -> bool:
+    """Whether aiohttp is installed for the async client."""
+    return importlib.util.find_spec("aiohttp") is not None
+
+async def _close_on_shutdown(session: Any, sessions: Dict[asyncio.AbstractEventLoop, Any],
+                             loop: asyncio.AbstractEventLoop):
+    try:
+        yield
+    finally:
+        # The entry holds the loop, it is dropped with the loop's session
+        entry = sessions.get(loop)
+        if entry is not None and entry[0] is session:
+            del sessions[loop]
+        await session.close()
+
+class AsyncTushareClient:
+    """
+    Tushare pro API for coroutines, e.g. `await client.daily(ts_code=...)`.
+
+    Args:
+        token (str): Tushare API token.
+        url (str): Base URL of the API, TUSHARE_API_URL or the official API by default.
+        max_concurrency (int): Calls in flight at most per event loop.
+        timeout (float): Seconds per call.
+    """
+
+    def __init__(self, token: str, url: str = "", max_concurrency: int = 0, timeout: float = 30.0):
+        self.token = token
+        self.url = (url or get_api_url() or DEFAULT_API_URL).rstrip("/")
+        self.max_concurrency = max_concurrency or int(os.environ.get(MAX_CONCURRENCY_ENV, DEFAULT_MAX_CONCURRENCY))
+        self.timeout = timeout
+        # A session and a semaphore belong to the event loop they are created in
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[Any, asyncio.Semaphore, Any]] = {}
+
+    async def _session(self) -> Tuple[Any, asyncio.Semaphore]:
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            # The loop finalizes its async generators on shutdown (asyncio.run does),
+            # which closes the session inside the loop it belongs to
+            keeper = _close_on_shutdown(session, self._sessions, loop)
+            await keeper.__anext__()
+            entry = (session, asyncio.Semaphore(self.max_concurrency), keeper)
+            self._sessions[loop] = entry
+        return entry[0], entry[1]
+
+    async def query(self, api_name: str, fields: str = "", **params) -> pd.DataFrame:
+        """Call an endpoint, raises an Exception with the message of Tushare errors."""
+        return await self.frame(api_name, fields, **params)
+
+    async def frame(
+            self,
+            api_name: str,
+            fields: str = "",
+            rename: Optional[Mapping[str, str]] = None,
+            drop: Iterable[str] = (),
+            types: Optional[Mapping[str, str]] = None,
+            **params
+        ) -> pd.DataFrame:
+        """Call an endpoint and decode the response column-wise, see `ts_decode.decode`."""
+        session, semaphore = await self._session()
+        request = {"api_name": api_name, "token": self.token, "params": params, "fields": fields}
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with session.post(f"{self.url}/{api_name}", json=request) as response:
+                    body = await response.read()
+                    status = response.status
+            except Exception:
+                metrics.inc("tushare_api_requests_total", endpoint=api_name, status="error")
+                raise
+            finally:
+                metrics.observe("tushare_api_latency_seconds", time.perf_counter() - start, endpoint=api_name)
+
+        if status >= 400:
+            # DataApi returns an empty frame for HTTP errors as well
+            logger.warning(f"Tushare {api_name} returned HTTP {status}.")
+            metrics.inc("tushare_api_requests_total", endpoint=api_name, status="error")
+            return pd.DataFrame()
+        result = loads(body)
+        if result["code"] != 0:
+            metrics.inc("tushare_api_requests_total", endpoint=api_name, status="error")
+            raise Exception(result["msg"])
+        data = decode(result["data"], rename, drop, types)
+        metrics.inc("tushare_api_requests_total", endpoint=api_name, status="ok")
+        metrics.inc("tushare_api_rows_total", len(data), endpoint=api_name)
+        return data
+
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return partial(self.query, name)
+
+    async def aclose(self) -> None:
+        """Close the session of the running event loop."""
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].close()
+
+_clients: Dict[Tuple[str, str], AsyncTushareClient] = {}
+
+def get_async_client(api_key: str = "") -> AsyncTushareClient:
+    """Return the shared async client for the key, or the TUSHARE_API_KEY environment variable."""
+    token = get_api_key(api_key)
+    key = (token, get_api_url())
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = AsyncTushareClient(token)
+    return client
@@ -1,9 +1,7 @@
-import logging
-
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
 from openbb_tushare.utils.table_cache import TableCache
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 
 
@@ -24,8 +22,7 @@ TABLE_SCHEMA = {
     "currency": "TEXT"                 # Currency type (货币)
 }
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 def get_available_indices(use_cache: bool = True, api_key : str = "") -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
@@ -34,11 +31,11 @@ def get_available_indices(use_cache: bool = True, api_key : str = "") -> pd.Data
     if use_cache:
         data = cache.read_dataframe()
         if not data.empty:
-            logger.info("Loading indices from cache...")
+            logger.debug("Loading indices from cache...")
             return data
 
     logger.info(f"Generating new indices data...")
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     data = pro.index_basic()
     data["currency"] = "CNY"
     cache.write_dataframe(data)
@@ -1,61 +1,94 @@
-import logging
 import pandas as pd
-import tushare as ts
-from typing import Optional, Literal
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.ts_client import get_pro_api
+from typing import List, Optional, Literal
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 from openbb_tushare.utils.tools import normalize_symbol
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Tushare column -> OpenBB standard name, other report items keep their Tushare name
+BALANCE_SHEET_FIELDS = {
+    "money_cap": "cash_and_cash_equivalents",                    # 货币资金
+    "trad_asset": "short_term_investments",                      # 交易性金融资产
+    "notes_receiv": "notes_receivable",                          # 应收票据
+    "accounts_receiv": "accounts_receivable",                    # 应收账款
+    "oth_receiv": "other_receivables",                           # 其他应收款
+    "prepayment": "prepaid_expenses",                            # 预付款项
+    "inventories": "inventory",                                  # 存货
+    "oth_cur_assets": "other_current_assets",                    # 其他流动资产
+    "total_cur_assets": "total_current_assets",                  # 流动资产合计
+    "lt_eqt_invest": "long_term_investments",                    # 长期股权投资
+    "invest_real_estate": "investment_property",                 # 投资性房地产
+    "fix_assets": "plant_property_equipment_net",                # 固定资产
+    "cip": "construction_in_progress",                           # 在建工程
+    "use_right_assets": "right_of_use_assets",                   # 使用权资产
+    "intan_assets": "intangible_assets",                         # 无形资产
+    "goodwill": "goodwill",                                      # 商誉
+    "defer_tax_assets": "deferred_tax_assets",                   # 递延所得税资产
+    "oth_nca": "other_non_current_assets",                       # 其他非流动资产
+    "total_nca": "total_non_current_assets",                     # 非流动资产合计
+    "total_assets": "total_assets",                              # 资产总计
+    "st_borr": "short_term_debt",                                # 短期借款
+    "notes_payable": "notes_payable",                            # 应付票据
+    "acct_payable": "accounts_payable",                          # 应付账款
+    "adv_receipts": "deferred_revenue",                          # 预收款项
+    "contract_liab": "contract_liabilities",                     # 合同负债
+    "payroll_payable": "accrued_payroll",                        # 应付职工薪酬
+    "taxes_payable": "tax_payables",                             # 应交税费
+    "oth_payable": "other_payables",                             # 其他应付款
+    "non_cur_liab_due_1y": "current_portion_long_term_debt",     # 一年内到期的非流动负债
+    "oth_cur_liab": "other_current_liabilities",                 # 其他流动负债
+    "total_cur_liab": "total_current_liabilities",               # 流动负债合计
+    "lt_borr": "long_term_debt",                                 # 长期借款
+    "bond_payable": "bonds_payable",                             # 应付债券
+    "lease_liab": "lease_liabilities",                           # 租赁负债
+    "defer_tax_liab": "deferred_tax_liabilities_non_current",    # 递延所得税负债
+    "oth_ncl": "other_non_current_liabilities",                  # 其他非流动负债
+    "total_ncl": "total_non_current_liabilities",                # 非流动负债合计
+    "total_liab": "total_liabilities",                           # 负债合计
+    "cap_rese": "additional_paid_in_capital",                    # 资本公积金
+    "surplus_rese": "surplus_reserve",                           # 盈余公积金
+    "undistr_porfit": "retained_earnings",                       # 未分配利润
+    "treasury_share": "treasury_stock",                          # 库存股
+    "oth_comp_income": "accumulated_other_comprehensive_income", # 其他综合收益
+    "minority_int": "minority_interest",                         # 少数股东权益
+    "total_hldr_eqy_exc_min_int": "total_common_equity",         # 股东权益合计(不含少数股东权益)
+    "total_hldr_eqy_inc_min_int": "total_equity_non_controlling_interests",  # 股东权益合计(含少数股东权益)
+    "total_liab_hldr_eqy": "total_liabilities_and_total_equity", # 负债及股东权益总计
+}
 
 def get_balance_sheet(
         symbol: str, 
         period: Literal["annual", "quarter"] = "annual",
         limit: Optional[int] = 5,
         use_cache: bool = True,
-        api_key : Optional[str] = ""
+        api_key : Optional[str] = "",
+        fields: Optional[List[str]] = None
     ) -> pd.DataFrame:
-    from openbb_tushare.utils.blob_cache import BlobCache
-    cache = BlobCache(table_name="balance_sheet")
-    data = cache.load_cached_data(symbol, "quarter", use_cache, get_tushare_data, api_key=api_key)
-    if data is None:
+    from openbb_tushare.utils.ts_statements import filter_statements, load_statements
+    data = load_statements(symbol, "balance_sheet", get_tushare_data, use_cache, api_key=api_key)
+    if data.empty:
         return pd.DataFrame()
     else:
-        if period == "annual":
-            # Filter rows where end_date ends with "1231"
-            data = data[data['end_date'].astype(str).str.endswith('1231')]
-
-        # Apply limit if specified
-        if limit is not None:
-            data = data.head(limit)
-        
-        return processing_data(data)
+        data = filter_statements(data, period, limit)
+        return processing_data(data, fields)
 def get_tushare_data(
         symbol: str,
         period: str = "annual",
         api_key : Optional[str] = ""
     ) -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     _, normalized_ts_code, market = normalize_symbol(symbol)
     if market == 'HK':
         balancesheet_df = pro.hk_balancesheet(ts_code=normalized_ts_code)
     else:
         balancesheet_df = pro.balancesheet(ts_code=normalized_ts_code)
-        balancesheet_df = balancesheet_df.drop_duplicates(subset='end_date', keep='first')
 
     
     return balancesheet_df
 
-def processing_data(balancesheet_df: pd.DataFrame) -> pd.DataFrame:
-    from openbb_tushare.utils.helpers import get_fiscal_period
-    # logger.info("Processing balance sheet data")
-    selected_columns = balancesheet_df[['total_assets', 'total_liab']]
-    selected_columns = selected_columns.rename(columns={'total_liab':'total_liabilities'})
-
-    # Extract year from end_date and create fiscal_year column
-    selected_columns.loc[:, 'fiscal_year'] = pd.to_datetime(balancesheet_df['end_date']).dt.year
-    selected_columns.loc[:, 'period_ending'] = pd.to_datetime(balancesheet_df['end_date'])
-    selected_columns.loc[:, 'fiscal_period'] = balancesheet_df['end_type'].apply(get_fiscal_period)
-    return selected_columns
\ No newline at end of file
+def processing_data(balancesheet_df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
+    from openbb_tushare.utils.ts_statements import project_statements
+    return project_statements(balancesheet_df, BALANCE_SHEET_FIELDS, fields)
@@ -1,62 +1,63 @@
-import logging
 import pandas as pd
-import tushare as ts
-from typing import Optional, Literal
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.ts_client import get_pro_api
+from typing import List, Optional, Literal
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 from openbb_tushare.utils.tools import normalize_symbol
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Tushare column -> OpenBB standard name, other report items keep their Tushare name
+CASH_FLOW_FIELDS = {
+    "net_profit": "net_income",                                  # 净利润
+    "depr_fa_coga_dpba": "depreciation",                         # 固定资产折旧、油气资产折耗、生产性生物资产折旧
+    "amort_intang_assets": "amortization_of_intangible_assets",  # 无形资产摊销
+    "c_fr_sale_sg": "cash_from_sales_of_goods_and_services",     # 销售商品、提供劳务收到的现金
+    "c_paid_for_taxes": "taxes_paid",                            # 支付的各项税费
+    "n_cashflow_act": "net_cash_from_operating_activities",      # 经营活动产生的现金流量净额
+    "c_pay_acq_const_fiolta": "capital_expenditure",             # 购建固定资产、无形资产和其他长期资产支付的现金
+    "n_cashflow_inv_act": "net_cash_from_investing_activities",  # 投资活动产生的现金流量净额
+    "c_recp_borrow": "proceeds_from_borrowings",                 # 取得借款收到的现金
+    "c_prepay_amt_borr": "repayment_of_debt",                    # 偿还债务支付的现金
+    "c_pay_dist_dpcp_int_exp": "dividends_and_interest_paid",    # 分配股利、利润或偿付利息支付的现金
+    "n_cash_flows_fnc_act": "net_cash_from_financing_activities",  # 筹资活动产生的现金流量净额
+    "eff_fx_flu_cash": "effect_of_exchange_rate_changes_on_cash",  # 汇率变动对现金的影响
+    "n_incr_cash_cash_equ": "net_change_in_cash_and_equivalents",  # 现金及现金等价物净增加额
+    "c_cash_equ_beg_period": "cash_at_beginning_of_period",      # 期初现金及现金等价物余额
+    "c_cash_equ_end_period": "cash_at_end_of_period",            # 期末现金及现金等价物余额
+    "free_cashflow": "free_cash_flow",                           # 企业自由现金流量
+}
 
 def get_cash_flow(
         symbol: str, 
         period: Literal["annual", "quarter"] = "annual",
         limit: Optional[int] = 5,
         use_cache: bool = True,
-        api_key : Optional[str] = ""
+        api_key : Optional[str] = "",
+        fields: Optional[List[str]] = None
     ) -> pd.DataFrame:
-    from openbb_tushare.utils.blob_cache import BlobCache
-    cache = BlobCache(table_name="cash_flow")
-    data = cache.load_cached_data(symbol, "quarter", use_cache, get_tushare_data, api_key=api_key)
-    if data is None:
+    from openbb_tushare.utils.ts_statements import filter_statements, load_statements
+    data = load_statements(symbol, "cash_flow", get_tushare_data, use_cache, api_key=api_key)
+    if data.empty:
         return pd.DataFrame()
     else:
-        if period == "annual":
-            # Filter rows where end_date ends with "1231"
-            data = data[data['end_date'].astype(str).str.endswith('1231')]
-
-        # Apply limit if specified
-        if limit is not None:
-            data = data.head(limit)
-        
-        return processing_data(data)
+        data = filter_statements(data, period, limit)
+        return processing_data(data, fields)
 def get_tushare_data(
         symbol: str,
         period: str = "annual",
         api_key : Optional[str] = ""
     ) -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     _, normalized_ts_code, market = normalize_symbol(symbol)
     if market == 'HK':
         cash_flow_df = pro.hk_cashflow(ts_code=normalized_ts_code)
     else:
         cash_flow_df = pro.cashflow(ts_code=normalized_ts_code)
-        cash_flow_df = cash_flow_df.drop_duplicates(subset='end_date', keep='first')
     
     return cash_flow_df
 
-def processing_data(cash_flow_df: pd.DataFrame) -> pd.DataFrame:
-    from openbb_tushare.utils.helpers import get_fiscal_period
-    # logger.info("Processing cash flow data")
-    selected_columns = cash_flow_df[['n_cashflow_act', 'n_cashflow_inv_act', 'n_cash_flows_fnc_act']]
-    selected_columns = selected_columns.rename(columns={'n_cashflow_act':'net_cash_from_operating_activities', 
-                                                        'n_cashflow_inv_act':'net_cash_from_investing_activities',
-                                                        'n_cash_flows_fnc_act':'net_cash_from_financing_activities'})
-
-    # Extract year from end_date and create fiscal_year column
-    selected_columns.loc[:, 'fiscal_year'] = pd.to_datetime(cash_flow_df['end_date']).dt.year
-    selected_columns.loc[:, 'period_ending'] = pd.to_datetime(cash_flow_df['end_date'])
-    selected_columns.loc[:, 'fiscal_period'] = cash_flow_df['end_type'].apply(get_fiscal_period)
-    return selected_columns
\ No newline at end of file
+def processing_data(cash_flow_df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
+    from openbb_tushare.utils.ts_statements import project_statements
+    return project_statements(cash_flow_df, CASH_FLOW_FIELDS, fields)
@@ -0,0 +1,171 @@
+import os
+import time
+import pandas as pd
+import tushare as ts
+from typing import Any, Callable, Iterable, Mapping, Optional
+from openbb_tushare.utils.helpers import get_api_key
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.rate_limit import FATAL, OK, THROTTLED, AdaptiveLimiter, backoff_delay, classify_error
+
+logger = get_logger(__name__)
+
+# Base URL of the Tushare HTTP API to use instead of the official one,
+# e.g. the local mock server "http://127.0.0.1:8765/dataapi".
+API_URL_ENV = "TUSHARE_API_URL"
+
+# Tushare calls in flight at most, over all threads of the process. The limit
+# adapts below this ceiling to the throttling and latency of Tushare.
+MAX_CONCURRENCY_ENV = "TUSHARE_MAX_CONCURRENCY"
+DEFAULT_MAX_CONCURRENCY = 8
+# Retries of throttled and transiently failed calls
+MAX_RETRIES_ENV = "TUSHARE_MAX_RETRIES"
+DEFAULT_MAX_RETRIES = 4
+# Backoff of the retries, seconds
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+limiter = AdaptiveLimiter(maximum=int(os.environ.get(MAX_CONCURRENCY_ENV, DEFAULT_MAX_CONCURRENCY)))
+
+def set_max_concurrency(limit: int) -> None:
+    """Change the number of Tushare calls in flight at most."""
+    limiter.set_maximum(limit)
+
+def get_api_url() -> str:
+    """The Tushare API URL set in TUSHARE_API_URL, empty for the official API."""
+    return os.environ.get(API_URL_ENV, "").rstrip("/")
+
+def call_api(endpoint: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Call a Tushare function and record its latency, status and returned rows.
+
+    Calls run in the slots of the adaptive `limiter`, in the priority class set
+    with `rate_limit.priority`. Throttled and transiently
+    failed calls are retried up to TUSHARE_MAX_RETRIES times after a jittered
+    exponential backoff, other errors are raised at once.
+
+    Args:
+        endpoint (str): Name of the endpoint in the metrics, e.g. "daily".
+        func (Callable): The Tushare function.
+
+    Returns:
+        The result of the function.
+    """
+    retries = int(os.environ.get(MAX_RETRIES_ENV, DEFAULT_MAX_RETRIES))
+    attempt = 0
+    while True:
+        with limiter.slot(endpoint=endpoint) as call:
+            metrics.observe("tushare_api_wait_seconds", call["wait"], priority=call["priority"])
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                error = None
+            except Exception as e:
+                error = e
+                call["outcome"] = classify_error(e)
+            call["latency"] = time.perf_counter() - start
+        metrics.observe("tushare_api_latency_seconds", call["latency"], endpoint=endpoint)
+        if error is None:
+            break
+        status = "throttled" if call["outcome"] == THROTTLED else "error"
+        metrics.inc("tushare_api_requests_total", endpoint=endpoint, status=status)
+        if call["outcome"] == FATAL or attempt >= retries:
+            raise error
+        delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+        logger.debug(f"Retrying {endpoint} in {delay:.2f}s after {call['outcome']} error: {error}")
+        metrics.inc("tushare_api_retries_total", endpoint=endpoint)
+        time.sleep(delay)
+        attempt += 1
+
+    metrics.inc("tushare_api_requests_total", endpoint=endpoint, status=OK)
+    if result is not None and hasattr(result, "__len__"):
+        metrics.inc("tushare_api_rows_total", len(result), endpoint=endpoint)
+    return result
+
+class InstrumentedApi:
+    """Tushare pro API recording metrics of every endpoint call, e.g. `api.daily(ts_code=...)`."""
+
+    def __init__(self, pro: Any):
+        self._pro = pro
+
+    def query(self, api_name: str, fields: str = "", **kwargs) -> Any:
+        from tushare.pro.client import DataApi
+
+        if isinstance(self._pro, DataApi):
+            # DataApi returns an empty DataFrame for HTTP errors, they must be retried instead
+            def request():
+                data = post_query(self._pro, api_name, fields, kwargs)
+                return pd.DataFrame(data["items"], columns=data["fields"])
+            return call_api(api_name, request)
+        return call_api(api_name, self._pro.query, api_name, fields=fields, **kwargs)
+
+    def frame(
+            self,
+            api_name: str,
+            fields: str = "",
+            rename: Optional[Mapping[str, str]] = None,
+            drop: Iterable[str] = (),
+            types: Optional[Mapping[str, str]] = None,
+            **params
+        ) -> Any:
+        """
+        Call an endpoint and decode the response column-wise, see `ts_decode.decode`.
+
+        With the tushare DataApi the response is decoded straight from the JSON
+        rows, other clients' DataFrames get the same mappings applied.
+        """
+        from tushare.pro.client import DataApi
+        from openbb_tushare.utils.ts_decode import decode, decode_frame
+
+        if isinstance(self._pro, DataApi):
+            def request():
+                return decode(post_query(self._pro, api_name, fields, params), rename, drop, types)
+            return call_api(api_name, request)
+        method = getattr(self._pro, api_name)
+        data = call_api(api_name, method, fields=fields, **params) if fields else call_api(api_name, method, **params)
+        return decode_frame(data, rename, drop, types)
+
+    def __getattr__(self, name: str) -> Callable:
+        from tushare.pro.client import DataApi
+
+        method = getattr(self._pro, name)
+        if name.startswith("_") or not callable(method):
+            return method
+        if isinstance(self._pro, DataApi) and not hasattr(DataApi, name):
+            # Endpoints of DataApi are partials of its query
+            return lambda fields="", **kwargs: self.query(name, fields, **kwargs)
+
+        def endpoint(*args, **kwargs):
+            return call_api(name, method, *args, **kwargs)
+        return endpoint
+
+def post_query(pro: Any, api_name: str, fields: str = "", params: Optional[dict] = None) -> dict:
+    """
+    Post a query like `DataApi.query` and return the `data` of the response.
+
+    Raises `requests.HTTPError` for HTTP errors, where DataApi returns an empty
+    DataFrame, so `call_api` retries 5xx and 429 responses, and an Exception
+    with the message of Tushare errors.
+    """
+    import requests
+    from openbb_tushare.utils.ts_decode import loads
+
+    # DataApi keeps its settings in name-mangled attributes
+    url = pro._DataApi__http_url
+    params = {"ts_type_name": url, **(params or {})}
+    request = {"api_name": api_name, "token": pro._DataApi__token, "params": params, "fields": fields}
+    response = requests.post(f"{url}/{api_name}", json=request, timeout=pro._DataApi__timeout)
+    response.raise_for_status()
+    result = loads(response.content)
+    if result["code"] != 0:
+        raise Exception(result["msg"])
+    return result["data"]
+
+def get_pro_api(api_key: str = "") -> InstrumentedApi:
+    """Return the Tushare pro API for the key, or the TUSHARE_API_KEY environment variable."""
+    pro = ts.pro_api(get_api_key(api_key))
+    url = get_api_url()
+    if url:
+        # DataApi keeps the URL in a name-mangled attribute and has no setter
+        pro._DataApi__http_url = url
+    return InstrumentedApi(pro)
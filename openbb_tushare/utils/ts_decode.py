@@ -0,0 +1,140 @@
+"""
+Columnar decoding of Tushare responses.
+
+Responses arrive as {"fields": [...], "items": [[...], ...]}. Instead of
+building a DataFrame from the row lists and renaming, dropping and converting
+its columns afterwards, `decode` converts every kept column once into a typed
+NumPy array under its final name.
+"""
+import gc
+import json
+from typing import Any, Dict, Iterable, Mapping, Optional
+import numpy as np
+import pandas as pd
+
+# Column types of `decode`
+DATE = "date"            # datetime64 from 'YYYYMMDD'
+YYYYMMDD = "yyyymmdd"    # int32 like 20240131, 0 when missing
+FLOAT = "float"          # float64, NaN when missing
+INT = "int"              # int64, or nullable Int64 when values are missing
+STR = "str"
+CATEGORY = "category"
+
+# Types of well-known Tushare columns, the others are inferred from their values
+DEFAULT_TYPES = {
+    "ts_code": CATEGORY,
+    "exchange": CATEGORY,
+    "market": CATEGORY,
+    "curr_type": CATEGORY,
+    "list_status": CATEGORY,
+}
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
+def loads(body: bytes) -> Any:
+    """
+    Parse a response body, with orjson when installed.
+
+    The cyclic garbage collector is paused while parsing, the millions of
+    small row lists would otherwise trigger it over and over.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _loads(body)
+    finally:
+        if enabled:
+            gc.enable()
+
+def _infer(column: np.ndarray) -> str:
+    for value in column:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return ""
+        if isinstance(value, (int, float)):
+            return FLOAT
+        return STR if isinstance(value, str) else ""
+    return ""
+
+def _convert(column: np.ndarray, kind: str) -> Any:
+    """The column as `kind`, or as it is when a value does not convert, e.g. '-' in a numeric column."""
+    try:
+        return _typed(column, kind)
+    except (ValueError, TypeError):
+        return column
+
+def _typed(column: np.ndarray, kind: str) -> Any:
+    if kind == FLOAT:
+        return column.astype(np.float64)
+    if kind == INT:
+        values = column.astype(np.float64)
+        return values.astype(np.int64) if not np.isnan(values).any() else pd.array(column, dtype="Int64")
+    if kind == DATE:
+        return pd.to_datetime(column, format="%Y%m%d", errors="coerce")
+    if kind == YYYYMMDD:
+        return np.array([int(v) if v else 0 for v in column], dtype=np.int32)
+    if kind == CATEGORY:
+        return pd.Categorical(column)
+    return column
+
+def decode(
+        data: Optional[Mapping[str, Any]],
+        rename: Optional[Mapping[str, str]] = None,
+        drop: Iterable[str] = (),
+        types: Optional[Mapping[str, str]] = None
+    ) -> pd.DataFrame:
+    """
+    Decode the `data` of a Tushare response into a DataFrame.
+
+    Args:
+        data (Mapping): {"fields": [...], "items": [[...], ...]}, None for no data.
+        rename (Mapping[str, str]): Tushare column -> column name in the result.
+        drop (Iterable[str]): Tushare columns to leave out.
+        types (Mapping[str, str]): Tushare column -> DATE, YYYYMMDD, FLOAT, INT, STR
+            or CATEGORY, on top of DEFAULT_TYPES. Other numeric columns become
+            float64 and text columns strings. Columns with values that do not
+            convert are kept as objects.
+
+    Returns:
+        pd.DataFrame: The kept columns in the order of the response.
+    """
+    if not data:
+        return pd.DataFrame()
+    rename = rename or {}
+    types = {**DEFAULT_TYPES, **(types or {})}
+    dropped = set(drop)
+    fields = [(i, field) for i, field in enumerate(data["fields"]) if field not in dropped]
+    items = data["items"]
+    if len(items) == 0:
+        return pd.DataFrame(columns=[rename.get(field, field) for _, field in fields])
+
+    rows = np.array(items, dtype=object)
+    columns: Dict[str, Any] = {}
+    for i, field in fields:
+        column = rows[:, i]
+        columns[rename.get(field, field)] = _convert(column, types.get(field) or _infer(column))
+    return pd.DataFrame(columns, copy=False)
+
+def decode_frame(
+        data: pd.DataFrame,
+        rename: Optional[Mapping[str, str]] = None,
+        drop: Iterable[str] = (),
+        types: Optional[Mapping[str, str]] = None
+    ) -> pd.DataFrame:
+    """Apply the column mappings of `decode` to a DataFrame returned by the tushare library."""
+    if data is None:
+        return pd.DataFrame()
+    rename = rename or {}
+    types = {**DEFAULT_TYPES, **(types or {})}
+    data = data.drop(columns=[c for c in drop if c in data.columns])
+    if not data.empty:
+        converted = {c: _convert(data[c].to_numpy(dtype=object), types[c]) for c in data.columns if c in types}
+        if converted:
+            data = data.assign(**converted)
+    return data.rename(columns=rename)
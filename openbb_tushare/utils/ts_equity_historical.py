@@ -1,17 +1,16 @@
-import logging
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
 from datetime import (
     date as dateType,
     datetime,
+    timedelta,
 )
-from typing import Optional, Union
-from openbb_tushare.utils.tools import setup_logger
-from openbb_tushare.utils.helpers import get_api_key
+from typing import Callable, List, Optional, Tuple, Union
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.helpers import MAX_WORKERS, get_api_key, map_concurrently
 from openbb_tushare.utils.tools import normalize_symbol
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 EQUITY_HISTORY_SCHEMA = {
     "date": "TEXT PRIMARY KEY",
@@ -26,6 +25,12 @@ EQUITY_HISTORY_SCHEMA = {
     "amount": "REAL"
 }
 
+# Rows returned per call at most by the Tushare endpoints
+ROW_LIMITS = {"daily": 6000, "hk_daily": 5000}
+
+# Tushare columns of the daily bars renamed to the cached columns while decoding
+HISTORY_COLUMNS = {'trade_date': 'date', 'vol': 'volume', 'pct_chg': 'change_percent'}
+
 def get_from_cache(
         ts_code: str,
         start_date: Union[dateType, str],
@@ -33,10 +38,14 @@ def get_from_cache(
         api_key : str = "",
         period: str = "daily",
         use_cache: bool = True,
-        adjust: str = ""
+        adjust: str = "",
+        priority: str = ""
     ) -> pd.DataFrame:
     """
     Retrieves historical equity data from a cache or downloads it from a remote source.
+
+    With TUSHARE_PRICE_STORE enabled the bars are read from memory-mapped files
+    of the `price_store` first, without copying them.
     
     Parameters:
         symbol (str): Stock symbol to fetch data for.
@@ -44,15 +53,23 @@ def get_from_cache(
         end_date (str): End date for fetching data in 'YYYYMMDD' format.
         period (str): Data frequency, e.g., "daily", "weekly", "monthly".
         adjust (str): Adjustment type, e.g., "qfq" for forward split, "hfq" for backward split.
+        priority (str): Priority class of the downloads, see `rate_limit`, e.g.
+            BACKFILL for batch jobs. The current class by default.
 
     Returns:
         DataFrame: DataFrame containing historical equity data.
     """
+    from openbb_tushare.utils import get_cache_path
+    from openbb_tushare.utils.cache_budget import touch
+    from openbb_tushare.utils.cache_lock import cache_lock
+    from openbb_tushare.utils.metrics import record_cache_read
+    from openbb_tushare.utils.price_store import PriceStore, use_price_store
+    from openbb_tushare.utils.rate_limit import current_priority, priority as priority_class
     from openbb_tushare.utils.table_cache import TableCache
 
     # Retrieve data from cache first
     symbol_b, symbol_f, market = normalize_symbol(ts_code)
-    cache = TableCache(EQUITY_HISTORY_SCHEMA, table_name=f"{market}{symbol_b}", primary_key="date")
+    table_name = f"{market}{symbol_b}"
     start_dt = datetime.now().date()
     if isinstance(start_date, str):
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -71,16 +88,82 @@ def get_from_cache(
 
     start = start_dt.strftime("%Y%m%d")
     end = end_dt.strftime("%Y%m%d")
+    store = PriceStore() if use_price_store() else None
+    if store is not None:
+        data_from_store = store.read_range(table_name, start, end)
+        if data_from_store is not None and not data_from_store.empty:
+            logger.debug(f"Getting equity {ts_code} historical data from the price store...")
+            touch(get_cache_path(), table_name)
+            record_cache_read("equity_history", "hit", rows=len(data_from_store))
+            return data_from_store
+
+    cache = TableCache(EQUITY_HISTORY_SCHEMA, table_name=table_name, primary_key="date",
+                       cache_name="equity_history", evictable=True)
     data_from_cache = cache.fetch_date_range(start, end)
     if not data_from_cache.empty:
-        logger.info(f"Getting equity {ts_code} historical data from cache...")
+        logger.debug(f"Getting equity {ts_code} historical data from cache...")
+        if store is not None:
+            # Bars cached before the price store was enabled
+            store.write(table_name, cache.read_dataframe())
         return data_from_cache
 
-    # If not in cache, download data from Tushare API
-    data_util_today_df = get_one(ts_code, period=period,api_key=api_key, start_date=start_dt, end_date=end_dt)
-    cache.write_dataframe(data_util_today_df)
+    # If not in cache, one process downloads data from Tushare API, the others wait for it
+    with cache_lock(f"equity_history:{table_name}", cache.db_path):
+        data_from_cache = cache.fetch_date_range(start, end, record_metrics=False)
+        if not data_from_cache.empty:
+            logger.debug(f"Getting equity {ts_code} historical data downloaded by another process...")
+            return data_from_cache
+        with priority_class(priority or current_priority()):
+            data_util_today_df = get_one(ts_code, period=period,api_key=api_key, start_date=start_dt, end_date=end_dt)
+        cache.write_dataframe(data_util_today_df)
+        if store is not None:
+            store.write(table_name, data_util_today_df)
     
-    return cache.fetch_date_range(start, end)
+    return cache.fetch_date_range(start, end, record_metrics=False)
+
+def split_date_range(start_date: str, end_date: str, max_rows: int) -> List[Tuple[str, str]]:
+    """
+    Split a date range into chunks of at most `max_rows` weekdays.
+
+    Trading days are weekdays, so the bars of a chunk never exceed the row limit.
+
+    Args:
+        start_date (str): First day, 'YYYYMMDD'.
+        end_date (str): Last day, 'YYYYMMDD'.
+        max_rows (int): Weekdays per chunk at most.
+
+    Returns:
+        List[Tuple[str, str]]: (start, end) of the chunks in 'YYYYMMDD', oldest first.
+    """
+    days = pd.bdate_range(start_date, end_date)
+    return [(days[i].strftime("%Y%m%d"), days[min(i + max_rows, len(days)) - 1].strftime("%Y%m%d"))
+            for i in range(0, len(days), max_rows)]
+
+def download_range(
+        fetch: Callable[..., pd.DataFrame],
+        start_date: str,
+        end_date: str,
+        max_rows: int
+    ) -> pd.DataFrame:
+    """
+    Download the bars of a range, following up while responses come back full.
+
+    Tushare returns the newest bars first and cuts the response at the row
+    limit, a full response is continued before its oldest bar. `fetch`
+    returns the bars with a 'date' column in 'YYYYMMDD'.
+    """
+    frames = []
+    end = end_date
+    while True:
+        data = fetch(start_date=start_date, end_date=end)
+        frames.append(data)
+        if len(data) < max_rows or 'date' not in data.columns:
+            break
+        oldest = datetime.strptime(str(data['date'].min()), "%Y%m%d")
+        end = (oldest - timedelta(days=1)).strftime("%Y%m%d")
+        if end < start_date:
+            break
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
 
 def get_one(
         ts_code : str, 
@@ -88,11 +171,18 @@ def get_one(
         end_date: dateType,
         period: str = "daily",
         use_cache: bool = True, 
-        api_key : str = ""
+        api_key : str = "",
+        max_workers: int = MAX_WORKERS
         ) -> pd.DataFrame:
+    """
+    Download the daily bars of a symbol.
+
+    Ranges longer than the row limit of the endpoint are split into chunks,
+    downloaded in parallel, merged and deduplicated by date.
+    """
     tushare_api_key = get_api_key(api_key)
 
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     _, normalized_ts_code, market = normalize_symbol(ts_code)
     
     # Convert dates to tushare format (YYYYMMDD)
@@ -105,16 +195,26 @@ def get_one(
         end_date_str = end_date.strftime("%Y%m%d")
     else:
         end_date_str = end_date
-    
-    df_data = pd.DataFrame()
-    if market == 'HK':
-        df_data = pro.hk_daily(ts_code=normalized_ts_code, start_date=start_date_str, end_date=end_date_str)
-        logger.info(f"Downloaded historical data (HK) {normalized_ts_code}: {len(df_data)} rows from {start_date_str} to {end_date_str}.")
-    else:
-        df_data = pro.daily(ts_code=normalized_ts_code, start_date=start_date_str, end_date=end_date_str)
-        logger.info(f"Downloaded historical data {normalized_ts_code}: {len(df_data)} rows from {start_date_str} to {end_date_str}.")
 
-    df_data = df_data.rename(columns={'trade_date':'date', 'vol':'volume', "pct_chg":"change_percent"})
-    if 'ts_code' in df_data.columns:
-        df_data.drop(columns=['ts_code'], inplace=True)
-    return df_data
\ No newline at end of file
+    endpoint = 'hk_daily' if market == 'HK' else 'daily'
+    max_rows = ROW_LIMITS[endpoint]
+
+    def fetch(start_date: str, end_date: str) -> pd.DataFrame:
+        return pro.frame(endpoint, rename=HISTORY_COLUMNS, drop=['ts_code'],
+                         ts_code=normalized_ts_code, start_date=start_date, end_date=end_date)
+
+    chunks = split_date_range(start_date_str, end_date_str, max_rows) or [(start_date_str, end_date_str)]
+    if len(chunks) == 1:
+        df_data = download_range(fetch, chunks[0][0], chunks[0][1], max_rows)
+    else:
+        results, errors = map_concurrently(lambda chunk: download_range(fetch, chunk[0], chunk[1], max_rows),
+                                           chunks, max_workers=max_workers)
+        if errors:
+            # A partial history must not be cached as complete
+            raise next(iter(errors.values()))
+        df_data = pd.concat(list(results.values()), ignore_index=True)
+    if len(chunks) > 1 and 'date' in df_data.columns:
+        df_data = df_data.drop_duplicates(subset='date').sort_values('date', ascending=False, ignore_index=True)
+    market_label = " (HK)" if market == 'HK' else ""
+    logger.info(f"Downloaded historical data{market_label} {normalized_ts_code}: {len(df_data)} rows from {start_date_str} to {end_date_str} in {len(chunks)} chunk(s).")
+    return df_data
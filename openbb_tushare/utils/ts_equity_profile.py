@@ -1,22 +1,21 @@
-import logging
+import sqlite3
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
 from datetime import (
     date as dateType,
     datetime,
 )
 from typing import Optional, Union
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 from openbb_tushare.utils.tools import normalize_symbol
 from openbb_tushare.utils.table_cache import TableCache
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 EQUITY_INFO_SCHEMA = {
     "ts_code": "TEXT PRIMARY KEY",        # 证券代码 (Security ID)
-    "com_name": "TEXT",          # 公司常用名称 (Common Name)
+    "name": "TEXT",              # 公司常用名称 (Common Name)
     "isin": "TEXT",                # 国际证券识别号码 (ISIN Code)
     "exchange": "TEXT",          # 证券交易所 (Exchange)
     "introduction": "TEXT",               # 公司描述 (Description)
@@ -46,7 +45,36 @@ EQUITY_INFO_SCHEMA = {
     "curr_type": "TEXT"          # 货币代码 (Currency)
 }
 
+PROFILE_TABLE = "equity_profile"
+
+SS_FIELDS = "ts_code,com_name,com_id,exchange,chairman,manager,secretary,reg_capital,setup_date,province,city,introduction,website,email,office,employees,main_business,business_scope"
+
+_migrated = set()
+
+def get_profile_cache() -> TableCache:
+    """
+    The cache table of the equity profiles.
+
+    Tables created before the common name column was renamed from com_name
+    to name get the column renamed, writes would fail on them otherwise.
+    """
+    cache = TableCache(EQUITY_INFO_SCHEMA, table_name=PROFILE_TABLE, primary_key="ts_code")
+    if cache.db_path not in _migrated:
+        with sqlite3.connect(cache.db_path) as conn:
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({PROFILE_TABLE})")}
+            if "com_name" in columns and "name" not in columns:
+                logger.info("Renaming the com_name column of the cached equity profiles to name.")
+                conn.execute(f"ALTER TABLE {PROFILE_TABLE} RENAME COLUMN com_name TO name")
+        _migrated.add(cache.db_path)
+    return cache
+
 def get_hk_data(ts_code: str, pro, cache: TableCache) -> pd.DataFrame:
+    return build_hk_profile(ts_code, pro.hk_basic(ts_code=ts_code), cache)
+
+def get_ss_data(ts_code: str, pro, cache: TableCache) -> pd.DataFrame:
+    return build_ss_profile(ts_code, pro.stock_company(ts_code=ts_code, fields=SS_FIELDS), cache)
+
+def build_hk_profile(ts_code: str, data_hk: pd.DataFrame, cache: TableCache) -> pd.DataFrame:
     a_fields = {
         'ts_code': ts_code,
         'com_id': '',
@@ -67,7 +95,6 @@ def get_hk_data(ts_code: str, pro, cache: TableCache) -> pd.DataFrame:
         'business_scope': ''
     }
 
-    data_hk = pro.hk_basic(ts_code=ts_code)
     if data_hk.empty:
         logger.warning(f"No equity profile data found for HK stock {ts_code}.")
         return pd.DataFrame()
@@ -77,9 +104,7 @@ def get_hk_data(ts_code: str, pro, cache: TableCache) -> pd.DataFrame:
     cache.update_or_insert(combined_data)
     return combined_data
 
-def get_ss_data(ts_code: str, pro, cache: TableCache) -> pd.DataFrame:
-    csv_fields = "ts_code,com_name,com_id,exchange,chairman,manager,secretary,reg_capital,setup_date,province,city,introduction,website,email,office,employees,main_business,business_scope"
-    data = pro.stock_company(ts_code=ts_code, fields=csv_fields)
+def build_ss_profile(ts_code: str, data: pd.DataFrame, cache: TableCache) -> pd.DataFrame:
     if data.empty:
         logger.warning(f"No equity profile data found for HK stock {ts_code}.")
         return data
@@ -117,18 +142,18 @@ def get_equity_profile(ts_code: str, api_key: str = "", use_cache: bool = True)
         DataFrame: DataFrame containing equity profile data.
     """
 
-    cache = TableCache(EQUITY_INFO_SCHEMA, table_name="equity_profile", primary_key="ts_code")
+    cache = get_profile_cache()
     _, normalized_ts_code, market = normalize_symbol(ts_code)
     if use_cache:
         filters = {'ts_code': normalized_ts_code}
         data = cache.read_rows(filters)
 
         if not data.empty:
-            logger.info(f"Loading equity profile {normalized_ts_code} from cache...")
+            logger.debug(f"Loading equity profile {normalized_ts_code} from cache...")
             return data
 
     tushare_api_key = get_api_key(api_key)
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     df_data = pd.DataFrame()
     if market == 'HK':
         df_data = get_hk_data(normalized_ts_code, pro, cache)
@@ -137,4 +162,26 @@ def get_equity_profile(ts_code: str, api_key: str = "", use_cache: bool = True)
 
     return df_data
 
-    
\ No newline at end of file
+    
+
+async def aget_equity_profile(ts_code: str, api_key: str = "", use_cache: bool = True) -> pd.DataFrame:
+    """`get_equity_profile` for coroutines, downloading with the async client."""
+    import asyncio
+    from openbb_tushare.utils.ts_async import async_client_available, get_async_client
+
+    if not async_client_available():
+        return await asyncio.to_thread(get_equity_profile, ts_code, api_key, use_cache)
+
+    cache = get_profile_cache()
+    _, normalized_ts_code, market = normalize_symbol(ts_code)
+    if use_cache:
+        data = cache.read_rows({'ts_code': normalized_ts_code})
+        if not data.empty:
+            logger.debug(f"Loading equity profile {normalized_ts_code} from cache...")
+            return data
+
+    client = get_async_client(api_key)
+    if market == 'HK':
+        return build_hk_profile(normalized_ts_code, await client.hk_basic(ts_code=normalized_ts_code), cache)
+    data = await client.stock_company(ts_code=normalized_ts_code, fields=SS_FIELDS)
+    return build_ss_profile(normalized_ts_code, data, cache)
@@ -1,9 +1,7 @@
-import logging
-
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
 from openbb_tushare.utils.table_cache import TableCache
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 
 TABLE_SCHEMA = {
@@ -28,8 +26,9 @@ TABLE_SCHEMA = {
     "isin": "TEXT",                 # International Securities Identification Number
 }
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+CN_FIELDS = 'ts_code,symbol,name,area,industry,fullname,enname,cnspell,market,exchange,curr_type,list_status,list_date,delist_date,is_hs,act_name,act_ent_type'
 
 def get_symbols(use_cache: bool = True, api_key : str = "") -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
@@ -38,15 +37,42 @@ def get_symbols(use_cache: bool = True, api_key : str = "") -> pd.DataFrame:
     if use_cache:
         data = cache.read_dataframe()
         if not data.empty:
-            logger.info("Loading symbols from cache...")
+            logger.debug("Loading symbols from cache...")
             return data
 
     logger.info(f"Generating symbols ...")
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     df_hk = pro.hk_basic()
+    df_cn = pro.stock_basic(exchange='', list_status='L', fields=CN_FIELDS)
+    return cache_symbols(df_cn, df_hk, cache)
+
+async def aget_symbols(use_cache: bool = True, api_key : str = "") -> pd.DataFrame:
+    """`get_symbols` for coroutines, both lists are downloaded concurrently with the async client."""
+    import asyncio
+    from openbb_tushare.utils.ts_async import async_client_available, get_async_client
+
+    if not async_client_available():
+        return await asyncio.to_thread(get_symbols, use_cache, api_key)
+
+    cache = TableCache(TABLE_SCHEMA, table_name="symbols", primary_key="ts_code")
+    if use_cache:
+        data = cache.read_dataframe()
+        if not data.empty:
+            logger.debug("Loading symbols from cache...")
+            return data
+
+    logger.info("Generating symbols ...")
+    client = get_async_client(api_key)
+    df_hk, df_cn = await asyncio.gather(
+        client.hk_basic(),
+        client.stock_basic(exchange='', list_status='L', fields=CN_FIELDS),
+    )
+    return cache_symbols(df_cn, df_hk, cache)
+
+def cache_symbols(df_cn: pd.DataFrame, df_hk: pd.DataFrame, cache: TableCache) -> pd.DataFrame:
+    """Combine the A-share and HK lists and write them to the cache."""
     df_hk['symbol'] = df_hk['ts_code'].str.replace('.HK', '', regex=False)
     df_hk['exchange'] = 'HKEX'
-    df_cn = pro.stock_basic(exchange='', list_status='L', fields='ts_code,symbol,name,area,industry,fullname,enname,cnspell,market,exchange,curr_type,list_status,list_date,delist_date,is_hs,act_name,act_ent_type')
     df_all = pd.concat([df_cn, df_hk], ignore_index=True)
     cache.write_dataframe(df_all)
     return df_all
\ No newline at end of file
@@ -1,9 +1,7 @@
-import logging
-
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
 from openbb_tushare.utils.table_cache import TableCache
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 
 TABLE_SCHEMA = {
@@ -33,8 +31,7 @@ TABLE_SCHEMA = {
     "market": "TEXT",               # Market (E/O)
 }
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 def get_etf_symbols(use_cache: bool = True, api_key: str = "") -> pd.DataFrame:
     """Get ETF symbols from Tushare API.
@@ -52,11 +49,11 @@ def get_etf_symbols(use_cache: bool = True, api_key: str = "") -> pd.DataFrame:
     if use_cache:
         data = cache.read_dataframe()
         if not data.empty:
-            logger.info("Loading ETF symbols from cache...")
+            logger.debug("Loading ETF symbols from cache...")
             return data
 
     logger.info("Fetching ETF symbols from Tushare API...")
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     
     # Get all funds and filter for ETFs
     # market='E' means E-market (ETF market)
@@ -1,42 +1,300 @@
-import logging
+import sqlite3
+import time
 import pandas as pd
-import tushare as ts
+from openbb_tushare.utils.ts_client import get_pro_api
+from openbb_tushare.utils.rate_limit import BACKFILL, REFRESH, priority
 from datetime import (
     date as dateType,
     datetime,
+    timedelta,
 )
-from typing import Optional, Union
-from openbb_tushare.utils.tools import setup_logger
-from openbb_tushare.utils.helpers import get_api_key
+from typing import List, Optional, Union
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.helpers import MAX_WORKERS, get_api_key, map_concurrently, raise_or_warn
 from openbb_tushare.utils.tools import normalize_symbol
-from openbb_tushare.utils.table_cache import TableCache
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+DIVIDEND_SCHEMA = {
+    "ts_code": "TEXT NOT NULL",     # TS代码
+    "end_date": "TEXT NOT NULL",    # 分红年度
+    "ann_date": "TEXT NOT NULL",    # 预案公告日
+    "div_proc": "TEXT NOT NULL",    # 实施进度
+    "stk_div": "REAL",              # 每股送转
+    "stk_bo_rate": "REAL",          # 每股送股比例
+    "stk_co_rate": "REAL",          # 每股转增比例
+    "cash_div": "REAL",             # 每股分红（税后）
+    "cash_div_tax": "REAL",         # 每股分红（税前）
+    "record_date": "TEXT",          # 股权登记日
+    "ex_date": "TEXT",              # 除权除息日
+    "pay_date": "TEXT",             # 派息日
+    "div_listdate": "TEXT",         # 红股上市日
+    "imp_ann_date": "TEXT",         # 实施公告日
+    "base_date": "TEXT",            # 基准日
+    "base_share": "REAL",           # 基准股本（万）
+}
+
+# One dividend event goes through several stages (预案, 股东大会通过, 实施)
+KEY_COLUMNS = ["ts_code", "end_date", "ann_date", "div_proc"]
+
+# Sync state key of the market-wide ingestion, other keys are ts_codes
+MARKET_KEY = "market"
+
+def to_tushare_date(value: Union[dateType, str]) -> str:
+    """Return a date as YYYYMMDD string."""
+    if isinstance(value, dateType):
+        return value.strftime("%Y%m%d")
+    return str(value).replace("-", "")
+
+def shift_date(value: str, days: int) -> str:
+    """Shift a YYYYMMDD date by a number of days."""
+    return (datetime.strptime(value, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+class DividendStore:
+    """Dividend events of all companies, indexed by (ts_code, ex_date)."""
+
+    def __init__(self, db_path: Optional[str] = None, table_name: str = "dividends"):
+        self.table_name = table_name
+        self.sync_table = f"{table_name}_sync"
+        if db_path is None:
+            from openbb_tushare.utils import get_cache_path
+            self.db_path = get_cache_path()
+        else:
+            self.db_path = db_path
+        self._ensure_db_exists()
+
+    def _ensure_db_exists(self):
+        """Ensure the dividend and sync state tables exist."""
+        with sqlite3.connect(self.db_path) as conn:
+            columns_definition = ", ".join([f"{col} {dtype}" for col, dtype in DIVIDEND_SCHEMA.items()])
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    {columns_definition},
+                    UNIQUE ({', '.join(KEY_COLUMNS)})
+                )
+            ''')
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table_name}_code_ex ON {self.table_name} (ts_code, ex_date)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table_name}_ex ON {self.table_name} (ex_date)")
+            # Market rows hold the ingested ex-date range, symbol rows the last full download
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.sync_table} (
+                    key TEXT PRIMARY KEY,
+                    start_date TEXT,
+                    end_date TEXT,
+                    timestamp REAL
+                )
+            ''')
+            conn.commit()
+
+    def upsert(self, df: pd.DataFrame) -> int:
+        """Insert or replace dividend events, returns the number of rows written."""
+        if df is None or df.empty:
+            return 0
+        columns = [col for col in DIVIDEND_SCHEMA if col in df.columns]
+        df = df[columns].copy()
+        # NULLs are distinct in UNIQUE constraints, store empty keys instead
+        for col in KEY_COLUMNS:
+            df[col] = df[col].fillna("") if col in df.columns else ""
+        columns = list(df.columns)
+        values = df.astype(object).where(df.notna(), None).values.tolist()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(f'''
+                INSERT OR REPLACE INTO {self.table_name} ({', '.join(columns)})
+                VALUES ({', '.join(['?'] * len(columns))})
+            ''', values)
+            conn.commit()
+        return len(values)
+
+    def read(
+            self,
+            ts_codes: Optional[List[str]] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None
+        ) -> pd.DataFrame:
+        """
+        Read dividend events, filtered by company and ex-date range.
+
+        Args:
+            ts_codes: Companies to read, all if None.
+            start_date: First ex-date (YYYYMMDD), unbounded if None.
+            end_date: Last ex-date (YYYYMMDD), unbounded if None.
+
+        Returns:
+            pd.DataFrame: Matching events ordered by ts_code and ex_date.
+        """
+        conditions = []
+        params: list = []
+        if ts_codes:
+            conditions.append(f"ts_code IN ({', '.join(['?'] * len(ts_codes))})")
+            params.extend(ts_codes)
+        if start_date:
+            conditions.append("ex_date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("ex_date <= ?")
+            params.append(end_date)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT * FROM {self.table_name} {where} ORDER BY ts_code ASC, ex_date DESC"
+        with sqlite3.connect(self.db_path) as conn:
+            return pd.read_sql_query(query, conn, params=params)
+
+    def get_sync(self, key: str) -> Optional[tuple]:
+        """Return (start_date, end_date, timestamp) of a sync state entry."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                f"SELECT start_date, end_date, timestamp FROM {self.sync_table} WHERE key=?", (key,)
+            ).fetchone()
+
+    def set_sync(self, key: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """Record that `key` has been synchronized up to now."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f'''
+                INSERT OR REPLACE INTO {self.sync_table} (key, start_date, end_date, timestamp)
+                VALUES (?, ?, ?, ?)
+            ''', (key, start_date, end_date, time.time()))
+            conn.commit()
+
+    def is_symbol_fresh(self, ts_code: str) -> bool:
+        """Whether the full history of a symbol was downloaded this year."""
+        from openbb_tushare.utils.blob_cache import calculate_cache_ttl, get_next_year_start
+        state = self.get_sync(ts_code)
+        if state is None:
+            return False
+        expired_date = calculate_cache_ttl(get_next_year_start, now=datetime.fromtimestamp(state[2]))
+        return time.time() < expired_date.timestamp()
+
+    def market_covers(self, start_date: Optional[str], end_date: Optional[str]) -> bool:
+        """Whether market-wide ingestion covers the ex-date range."""
+        state = self.get_sync(MARKET_KEY)
+        if state is None or start_date is None or end_date is None:
+            return False
+        return state[0] <= start_date and end_date <= state[1]
+
+def ingest_dividends(
+        start_date: Optional[Union[dateType, str]] = None,
+        end_date: Optional[Union[dateType, str]] = None,
+        api_key: str = "",
+        store: Optional[DividendStore] = None
+    ) -> int:
+    """
+    Incrementally ingest dividend events of the whole market, day by day.
+
+    For every weekday, events going ex on that day and implementations
+    announced on that day (with their upcoming ex-date) are stored. The
+    market watermark is advanced after each day, so an interrupted run
+    resumes where it stopped. Runs from the watermark keep the store current
+    and call Tushare as REFRESH, runs of a given range as BACKFILL.
+
+    Args:
+        start_date: First day to ingest. Defaults to the day after the
+            watermark, or today on the first run.
+        end_date: Last day to ingest, defaults to today.
+        api_key (str): Tushare API key.
+        store (DividendStore): Target store, the default cache if None.
+
+    Returns:
+        int: Number of events written.
+    """
+    store = store or DividendStore()
+    state = store.get_sync(MARKET_KEY)
+    end = to_tushare_date(end_date or datetime.now().date())
+    if start_date is not None:
+        start = to_tushare_date(start_date)
+    elif state is not None:
+        start = shift_date(state[1], 1)
+    else:
+        start = end
+
+    # Coverage is one contiguous range, it is only merged with the new one when they touch
+    previous = state if state is not None and start <= shift_date(state[1], 1) and end >= shift_date(state[0], -1) else None
+
+    pro = get_pro_api(api_key)
+    priority_class = BACKFILL if start_date is not None else REFRESH
+    written = 0
+    day = datetime.strptime(start, "%Y%m%d")
+    while day.strftime("%Y%m%d") <= end:
+        day_str = day.strftime("%Y%m%d")
+        if day.weekday() < 5:
+            for params in ({"ex_date": day_str}, {"imp_ann_date": day_str}):
+                with priority(priority_class):
+                    written += store.upsert(pro.dividend(**params))
+        if previous is None:
+            store.set_sync(MARKET_KEY, start, day_str)
+        elif day_str >= shift_date(previous[0], -1):
+            store.set_sync(MARKET_KEY, min(previous[0], start), max(previous[1], day_str))
+        day += timedelta(days=1)
+
+    logger.info(f"Ingested {written} dividend events from {start} to {end}.")
+    return written
+
+def get_dividend_calendar(
+        start_date: Union[dateType, str],
+        end_date: Union[dateType, str],
+        store: Optional[DividendStore] = None
+    ) -> pd.DataFrame:
+    """Return the cash dividends of all companies going ex between two dates."""
+    store = store or DividendStore()
+    return processing_data(store.read(None, to_tushare_date(start_date), to_tushare_date(end_date)))
 
 def get_dividends(
-        symbol: str, 
+        symbol: str,
         start_date: Optional[dateType] = None,
         end_date: Optional[dateType] = None,
         use_cache: bool = True,
-        api_key : str = ""
+        api_key : str = "",
+        max_workers: int = MAX_WORKERS
     ) -> pd.DataFrame:
     """
-    Get dividend history for a given symbol.
+    Get dividend history for one or more symbols.
+
+    Symbols without fresh local data are downloaded concurrently, the
+    ex-date range is then read with one indexed query over all symbols.
+
     Args:
-        symbol (str): The stock symbol to query.
+        symbol (str): The stock symbol to query, or a comma-separated list.
         start_date (dateType): The start date for the query in YYYY-MM-DD format.
         end_date (dateType): The end date for the query in YYYY-MM-DD format.
         use_cache (bool): Whether to use cached data.
         api_key (str): Tushare API key.
+        max_workers (int): Maximum number of concurrent downloads.
+    """
+    store = DividendStore()
+    ts_codes = list(dict.fromkeys(normalize_symbol(s)[1] for s in symbol.split(",") if s.strip()))
+    start = to_tushare_date(start_date) if start_date else None
+    end = to_tushare_date(end_date) if end_date else None
+
+    available = sync_dividends(store, ts_codes, start, end, use_cache, api_key, max_workers)
+    return processing_data(store.read(available, start, end))
+
+def sync_dividends(
+        store: DividendStore,
+        ts_codes: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        use_cache: bool = True,
+        api_key: str = "",
+        max_workers: int = MAX_WORKERS
+    ) -> List[str]:
+    """
+    Make sure the store holds the dividends of `ts_codes` between two ex-dates.
+
+    Returns:
+        List[str]: The ts_codes whose dividends are available.
     """
-    from openbb_tushare.utils.blob_cache import BlobCache
-    cache = BlobCache(table_name="historical_dividends")
-    data = cache.load_cached_data(symbol, "annual", use_cache, get_tushare_data, api_key=api_key)
-    if start_date is None or end_date is None:
-        return data
+    def download(ts_code: str) -> None:
+        store.upsert(get_tushare_data(ts_code, api_key=api_key))
+        store.set_sync(ts_code)
+
+    if use_cache and store.market_covers(start, end):
+        misses = []
     else:
-        return data[(data['ex_dividend_date'] >= start_date.strftime('%Y%m%d')) & (data['ex_dividend_date'] <= end_date.strftime('%Y%m%d'))].reset_index(drop=True)
+        misses = [code for code in ts_codes if not use_cache or not store.is_symbol_fresh(code)]
+    if len(misses) < len(ts_codes):
+        logger.debug(f"Loading dividends of {len(ts_codes) - len(misses)} symbols from cache...")
+    _, errors = map_concurrently(download, misses, max_workers=max_workers)
+    available = [code for code in ts_codes if code not in errors]
+    raise_or_warn(errors, bool(available))
+    return available
 
 def get_tushare_data(
         symbol: str,
@@ -44,10 +302,12 @@ def get_tushare_data(
         api_key : Optional[str] = ""
     ) -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     _, normalized_ts_code, _ = normalize_symbol(symbol)
-    div_df = pro.dividend(ts_code=normalized_ts_code)
-    div_df = div_df[div_df['cash_div'] != 0].reset_index(drop=True)
+    return pro.dividend(ts_code=normalized_ts_code)
+
+def processing_data(div_df: pd.DataFrame) -> pd.DataFrame:
+    div_df = div_df[(div_df['cash_div'] != 0) & div_df['cash_div'].notna() & div_df['ex_date'].notna()].reset_index(drop=True)
     div_df = div_df.rename(columns={'cash_div':'amount', 'ex_date':'ex_dividend_date'})
     div_df['ex_dividend_date'] = pd.to_datetime(div_df['ex_dividend_date'], format='%Y%m%d')
     return div_df
@@ -1,60 +1,73 @@
-import logging
 import pandas as pd
-import tushare as ts
-from typing import Optional, Literal
-from openbb_tushare.utils.tools import setup_logger
+from openbb_tushare.utils.ts_client import get_pro_api
+from typing import List, Optional, Literal
+from openbb_tushare.utils.log import get_logger
 from openbb_tushare.utils.helpers import get_api_key
 from openbb_tushare.utils.tools import normalize_symbol
 
-setup_logger()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Tushare column -> OpenBB standard name, other report items keep their Tushare name
+INCOME_STATEMENT_FIELDS = {
+    "basic_eps": "basic_earnings_per_share",                     # 基本每股收益
+    "diluted_eps": "diluted_earnings_per_share",                 # 稀释每股收益
+    "total_revenue": "total_revenue",                            # 营业总收入
+    "revenue": "revenue",                                        # 营业收入
+    "int_income": "interest_income",                             # 利息收入
+    "total_cogs": "cost_and_expenses",                           # 营业总成本
+    "oper_cost": "cost_of_revenue",                              # 减:营业成本
+    "int_exp": "interest_expense",                               # 减:利息支出
+    "biz_tax_surchg": "taxes_and_surcharges",                    # 减:营业税金及附加
+    "sell_exp": "selling_and_marketing_expense",                 # 减:销售费用
+    "admin_exp": "general_and_admin_expense",                    # 减:管理费用
+    "fin_exp": "financial_expense",                              # 减:财务费用
+    "rd_exp": "research_and_development_expense",                # 研发费用
+    "assets_impair_loss": "asset_impairment_loss",               # 减:资产减值损失
+    "invest_income": "investment_income",                        # 加:投资净收益
+    "operate_profit": "operating_income",                        # 营业利润
+    "non_oper_income": "non_operating_income",                   # 加:营业外收入
+    "non_oper_exp": "non_operating_expense",                     # 减:营业外支出
+    "total_profit": "income_before_tax",                         # 利润总额
+    "income_tax": "income_tax_expense",                          # 所得税费用
+    "n_income": "net_income",                                    # 净利润(含少数股东损益)
+    "n_income_attr_p": "net_income_attributable_to_common_shareholders",  # 净利润(不含少数股东损益)
+    "minority_gain": "net_income_attributable_to_noncontrolling_interest", # 少数股东损益
+    "oth_compr_income": "other_comprehensive_income",            # 其他综合收益
+    "t_compr_income": "total_comprehensive_income",              # 综合收益总额
+    "ebit": "ebit",                                              # 息税前利润
+    "ebitda": "ebitda",                                          # 息税折旧摊销前利润
+}
 
 def get_income_statement(
         symbol: str, 
         period: Literal["annual", "quarter"] = "annual",
         limit: Optional[int] = 5,
         use_cache: bool = True,
-        api_key : Optional[str] = ""
+        api_key : Optional[str] = "",
+        fields: Optional[List[str]] = None
     ) -> pd.DataFrame:
-    from openbb_tushare.utils.blob_cache import BlobCache
-    cache = BlobCache(table_name="income_statement")
-    data = cache.load_cached_data(symbol, "quarter", use_cache, get_tushare_data, api_key=api_key)
-    if data is None:
+    from openbb_tushare.utils.ts_statements import filter_statements, load_statements
+    data = load_statements(symbol, "income_statement", get_tushare_data, use_cache, api_key=api_key)
+    if data.empty:
         return pd.DataFrame()
     else:
-        if period == "annual":
-            # Filter rows where end_date ends with "1231"
-            data = data[data['end_date'].astype(str).str.endswith('1231')]
-
-        # Apply limit if specified
-        if limit is not None:
-            data = data.head(limit)
-        
-        return processing_data(data)
+        data = filter_statements(data, period, limit)
+        return processing_data(data, fields)
 def get_tushare_data(
         symbol: str,
         period: str = "annual",
         api_key : Optional[str] = ""
     ) -> pd.DataFrame:
     tushare_api_key = get_api_key(api_key)
-    pro = ts.pro_api(tushare_api_key)
+    pro = get_pro_api(tushare_api_key)
     _, normalized_ts_code, market = normalize_symbol(symbol)
     if market == 'HK':
         income_statement_df = pro.hk_income(ts_code=normalized_ts_code)
     else:
         income_statement_df = pro.income(ts_code=normalized_ts_code)
-        income_statement_df = income_statement_df.drop_duplicates(subset='end_date', keep='first')
     
     return income_statement_df
 
-def processing_data(income_statement_df: pd.DataFrame) -> pd.DataFrame:
-    from openbb_tushare.utils.helpers import get_fiscal_period
-    # logger.info("Processing income statement data")
-    selected_columns = income_statement_df[['total_revenue', 'n_income']]
-    selected_columns = selected_columns.rename(columns={'n_income':'net_income'})
-
-    # Extract year from end_date and create fiscal_year column
-    selected_columns.loc[:, 'fiscal_year'] = pd.to_datetime(income_statement_df['end_date']).dt.year
-    selected_columns.loc[:, 'period_ending'] = pd.to_datetime(income_statement_df['end_date'])
-    selected_columns.loc[:, 'fiscal_period'] = income_statement_df['end_type'].apply(get_fiscal_period)
-    return selected_columns
\ No newline at end of file
+def processing_data(income_statement_df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
+    from openbb_tushare.utils.ts_statements import project_statements
+    return project_statements(income_statement_df, INCOME_STATEMENT_FIELDS, fields)
@@ -0,0 +1,169 @@
+import sqlite3
+import pandas as pd
+from typing import Callable, Dict, List, Optional
+from openbb_tushare.utils.log import get_logger
+from openbb_tushare.utils.helpers import MAX_WORKERS, map_concurrently, raise_or_warn
+
+logger = get_logger(__name__)
+
+def load_statements(
+        symbols: str,
+        table_name: str,
+        get_data: Callable,
+        use_cache: bool = True,
+        api_key : Optional[str] = "",
+        max_workers: int = MAX_WORKERS,
+        record_revisions: bool = True
+    ) -> pd.DataFrame:
+    """
+    Load raw statement data for a comma-separated list of symbols.
+
+    Cache hits are served directly from the blob cache, only the misses are
+    downloaded, concurrently and with at most `max_workers` calls in flight.
+    A miss is downloaded by one process at a time, see `BlobCache.lock`.
+
+    Args:
+        symbols (str): Comma-separated Tushare ts_codes, e.g. "600036.SH,000001.SZ".
+        table_name (str): Blob cache table of the statement.
+        get_data (Callable): Downloader with the `BlobCache.load_cached_data` signature.
+        use_cache (bool): Whether to use cached data.
+        api_key (str): Tushare API key.
+        max_workers (int): Maximum number of concurrent downloads.
+        record_revisions (bool): Whether to record downloaded revisions in the
+            point-in-time store of the statement.
+
+    Returns:
+        pd.DataFrame: Raw statements of all symbols with a `symbol` column.
+    """
+    from openbb_tushare.utils.blob_cache import BlobCache
+    from openbb_tushare.utils.pit_store import PointInTimeStore
+
+    cache = BlobCache(table_name=table_name)
+    pit_store = PointInTimeStore(f"{table_name}_pit") if record_revisions else None
+    codes = list(dict.fromkeys(s.strip() for s in symbols.split(",") if s.strip()))
+
+    frames = {}
+    if use_cache:
+        for code in codes:
+            data = cache.read_cached(code, "quarter")
+            if data is not None:
+                frames[code] = data
+
+    def download(code: str) -> pd.DataFrame:
+        with cache.lock(code, "quarter"):
+            # Another process may have downloaded it while this one waited
+            data = cache.read_cached(code, "quarter", record_metrics=False) if use_cache else None
+            if data is not None:
+                return data
+            logger.info(f"Generating new {table_name} data for {code}...")
+            data = get_data(code, "quarter", api_key=api_key)
+            cache.write_cached(code, "quarter", data)
+        if pit_store is not None:
+            try:
+                pit_store.add_revisions(data)
+            except sqlite3.Error as e:
+                # The statements are cached already, the point-in-time history is best effort
+                logger.warning(f"Failed to record the {table_name} revisions of {code}: {e}")
+        return data
+
+    misses = [code for code in codes if code not in frames]
+    downloaded, errors = map_concurrently(download, misses, max_workers=max_workers)
+    frames.update(downloaded)
+
+    raise_or_warn(errors, bool(frames))
+
+    results = [
+        frames[code].assign(symbol=code)
+        for code in codes
+        if code in frames and frames[code] is not None and not frames[code].empty
+    ]
+    if not results:
+        return pd.DataFrame()
+    return pd.concat(results, ignore_index=True)
+
+def latest_revisions(data: pd.DataFrame) -> pd.DataFrame:
+    """Keep the most recently announced revision of every report."""
+    if 'f_ann_date' not in data.columns:
+        return data
+    known_date = data['f_ann_date'].fillna(data['ann_date']) if 'ann_date' in data.columns else data['f_ann_date']
+    update_flag = data['update_flag'] if 'update_flag' in data.columns else pd.Series('', index=data.index)
+    ranked = data.assign(_known_date=known_date.fillna('').astype(str), _update_flag=update_flag.fillna('').astype(str))
+    ranked = ranked.sort_values(['_known_date', '_update_flag'], ascending=False, kind='stable')
+    latest = ranked[~ranked.duplicated(subset=['symbol', 'end_date'], keep='first')]
+    # restore the original row order, i.e. requested symbols, newest period first
+    return latest.sort_index().drop(columns=['_known_date', '_update_flag'])
+
+def filter_statements(
+        data: pd.DataFrame,
+        period: str = "annual",
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+    """Keep the latest revisions, the annual reports if requested and apply `limit` per symbol."""
+    data = latest_revisions(data)
+    if period == "annual":
+        # Filter rows where end_date ends with "1231"
+        data = data[data['end_date'].astype(str).str.endswith('1231')]
+
+    # Apply limit if specified
+    if limit is not None:
+        data = data.groupby('symbol', sort=False).head(limit)
+    return data
+
+# Report metadata returned by every statement endpoint, these are not report items
+META_COLUMNS = ["ts_code", "symbol", "ann_date", "f_ann_date", "end_date", "report_type", "comp_type", "end_type", "update_flag"]
+
+def project_statements(
+        data: pd.DataFrame,
+        field_mapping: Dict[str, str],
+        fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+    """
+    Map raw statement columns to OpenBB names and keep only the requested fields.
+
+    Projection happens before any conversion, so only the selected report
+    items are converted to numbers and later validated.
+
+    Args:
+        data (pd.DataFrame): Raw statements as returned by `load_statements`.
+        field_mapping (Dict[str, str]): Tushare column -> OpenBB name, columns
+            without a standard name keep their Tushare name.
+        fields (List[str]): OpenBB names of the report items to keep, all if None.
+
+    Returns:
+        pd.DataFrame: symbol, period_ending, fiscal_year, fiscal_period, filing
+            dates and the selected report items.
+
+    Raises:
+        ValueError: Two columns are mapped to the same OpenBB name, or a
+            requested field is not available.
+    """
+    from openbb_tushare.utils.helpers import get_fiscal_period
+
+    columns: Dict[str, str] = {}
+    for col in data.columns:
+        if col in META_COLUMNS:
+            continue
+        name = field_mapping.get(col, col)
+        if name in columns:
+            raise ValueError(f"Columns '{columns[name]}' and '{col}' are both mapped to '{name}'.")
+        columns[name] = col
+    if fields:
+        unknown = [field for field in fields if field not in columns]
+        if unknown:
+            raise ValueError(f"Invalid 'fields': {', '.join(unknown)}. Available fields: {', '.join(columns)}.")
+        columns = {field: columns[field] for field in fields}
+
+    period_ending = pd.to_datetime(data['end_date'].astype(str), format='%Y%m%d')
+    result = pd.DataFrame({
+        'symbol': data['symbol'],
+        'period_ending': period_ending,
+        'fiscal_year': period_ending.dt.year,
+        'fiscal_period': data['end_type'].apply(get_fiscal_period),
+    }, index=data.index)
+    for name, col in (("announcement_date", "ann_date"), ("filing_date", "f_ann_date")):
+        if col in data.columns:
+            dates = pd.to_datetime(data[col], format='%Y%m%d', errors='coerce')
+            result[name] = dates.dt.date.astype(object).where(dates.notna(), None)
+
+    items = pd.DataFrame({name: pd.to_numeric(data[col], errors='coerce') for name, col in columns.items()}, index=data.index)
+    return pd.concat([result, items], axis=1).reset_index(drop=True)
@@ -0,0 +1,34 @@
+import pytest
+
+# The package is imported in the fixtures: importing it here would configure its
+# logging before pytest installs its log handlers.
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    import openbb_tushare.utils as tushare_utils
+
+    db_path = str(tmp_path / "equity.db")
+    monkeypatch.setattr(tushare_utils, "get_cache_path", lambda: db_path)
+    return db_path
+
+@pytest.fixture
+def start_server(cache_path, monkeypatch):
+    """Start a MockTushareServer with the given options and point the clients at it."""
+    from openbb_tushare.utils.mock_server import MockTushareServer
+    from openbb_tushare.utils.ts_client import API_URL_ENV
+
+    servers = []
+
+    def start(**kwargs) -> MockTushareServer:
+        server = MockTushareServer(**kwargs).start()
+        servers.append(server)
+        monkeypatch.setenv(API_URL_ENV, server.url)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+@pytest.fixture
+def server(start_server):
+    return start_server(universe=20)
@@ -0,0 +1,60 @@
+import pickle
+import sqlite3
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_tushare.utils import blob_codec
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.blob_codec import LZ4, NONE, ZLIB, ZSTD, UnsupportedBlobError, decode, encode
+
+def statements() -> pd.DataFrame:
+    """Quarterly statements of a symbol, mostly empty items and repeated dates."""
+    items = {f"item_{i}": np.where(np.arange(80) % (i % 7 + 1) == 0, np.arange(80) * 1e6, np.nan) for i in range(150)}
+    return pd.DataFrame({"ts_code": "600000.SH", "ann_date": "20240430", **items})
+
+@pytest.mark.parametrize("codec", [NONE, ZLIB, ZSTD, LZ4])
+def test_round_trip(codec):
+    if not blob_codec.codec_available(codec):
+        pytest.skip(f"{codec} is not installed")
+    data = statements()
+    blob = encode(data, codec)
+    assert blob[:5] == b"TSB" + bytes((1, blob_codec.CODEC_IDS[codec]))
+    pd.testing.assert_frame_equal(decode(blob), data)
+
+def test_compression_and_fallback(monkeypatch):
+    data = statements()
+    assert len(encode(data, ZLIB)) * 5 < len(pickle.dumps(data))
+
+    monkeypatch.setattr(blob_codec, "codec_available", lambda codec: codec in (NONE, ZLIB))
+    monkeypatch.setattr(blob_codec, "_warned", set())
+    warnings = []
+    monkeypatch.setattr(blob_codec.logger, "warning", warnings.append)
+    assert blob_codec.resolve_codec() == ZLIB
+    assert not warnings
+    assert blob_codec.resolve_codec("zstd") == ZLIB
+    assert blob_codec.resolve_codec("zstd") == ZLIB
+    assert len(warnings) == 1 and "zstd" in warnings[0]
+    monkeypatch.setenv("TUSHARE_BLOB_CODEC", "none")
+    assert blob_codec.resolve_codec() == NONE
+    with pytest.raises(ValueError):
+        blob_codec.resolve_codec("brotli")
+
+def test_legacy_and_unsupported_blobs(tmp_path, monkeypatch):
+    data = statements()
+    assert decode(pickle.dumps(data)).equals(data)
+    with pytest.raises(UnsupportedBlobError):
+        decode(b"TSB\x02\x01" + b"payload")
+    with pytest.raises(UnsupportedBlobError):
+        decode(b"TSB\x01\x09" + b"payload")
+
+    # Read from SQLite, not from the memory tier
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "0")
+    cache = BlobCache(table_name="income", db_path=str(tmp_path), codec=ZLIB)
+    cache.write_cached("600000.SH", "quarter", data)
+    assert cache.read_cached("600000.SH", "quarter").equals(data)
+    with sqlite3.connect(cache.db_path) as conn:
+        conn.execute("UPDATE income SET data=?", (pickle.dumps(data),))
+    assert cache.read_cached("600000.SH", "quarter").equals(data)
+    with sqlite3.connect(cache.db_path) as conn:
+        conn.execute("UPDATE income SET data=?", (b"TSB\x02\x01" + b"payload",))
+    assert cache.read_cached("600000.SH", "quarter") is None
@@ -0,0 +1,105 @@
+import os
+import shutil
+import sqlite3
+import time
+import pandas as pd
+import pytest
+from openbb_tushare.utils import cache_budget, memory_cache
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.cache_budget import ACCESS_TABLE, create_database, maintain_cache, used_bytes
+from openbb_tushare.utils.table_cache import TableCache
+
+HISTORY_SCHEMA = {"date": "TEXT PRIMARY KEY", "close": "REAL"}
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_budget, "MIN_IDLE", 0)
+    monkeypatch.setattr(cache_budget, "_touched", {})
+    monkeypatch.setenv("TUSHARE_CACHE_MAINTENANCE_INTERVAL", "0")
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "0")
+    return str(tmp_path / "equity.db")
+
+def write_history(db_path: str, table_name: str, rows: int = 2000):
+    cache = TableCache(HISTORY_SCHEMA, db_path=db_path, table_name=table_name, primary_key="date",
+                       cache_name="equity_history", evictable=True)
+    dates = pd.bdate_range("2000-01-01", periods=rows).strftime("%Y%m%d")
+    cache.write_dataframe(pd.DataFrame({"date": dates, "close": 1.0}))
+    return cache
+
+def set_accessed(db_path: str, table_name: str, accessed: float, key: str = ""):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"UPDATE {ACCESS_TABLE} SET accessed=? WHERE table_name=? AND key=?", (accessed, table_name, key))
+
+def tables(db_path: str):
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+def test_least_recently_used_tables_are_evicted_to_the_budget(db_path):
+    for i, table_name in enumerate(["SH600000", "SH600036", "SZ000001"]):
+        write_history(db_path, table_name)
+        set_accessed(db_path, table_name, time.time() - 100 + i)
+    TableCache({"ts_code": "TEXT PRIMARY KEY"}, db_path=db_path, table_name="symbols", primary_key="ts_code")
+    size = os.path.getsize(db_path)
+
+    evicted = maintain_cache(db_path, max_bytes=int(size * 0.8), max_idle=0)
+
+    assert evicted == {"expired": 0, "idle": 0, "budget": 2}
+    assert {"SZ000001", "symbols"} <= tables(db_path)
+    assert not {"SH600000", "SH600036"} & tables(db_path)
+    # The freed pages are returned to the file system
+    assert os.path.getsize(db_path) < size * 0.6
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert used_bytes(conn) == os.path.getsize(db_path)
+
+def test_idle_and_expired_entries_are_evicted(db_path, tmp_path):
+    write_history(db_path, "SH600000")
+    set_accessed(db_path, "SH600000", time.time() - 100 * 86400)
+    write_history(db_path, "SH600036")
+    statements = BlobCache(table_name="income", db_path=str(tmp_path))
+    statements.write_cached("600000.SH", "quarter", pd.DataFrame({"revenue": [1.0]}))
+    statements.write_cached("600036.SH", "quarter", pd.DataFrame({"revenue": [1.0]}))
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE income SET timestamp=? WHERE key='SH600000quarter'", (time.time() - 200 * 86400,))
+
+    evicted = maintain_cache(db_path, max_bytes=0, max_idle=90 * 86400)
+
+    assert evicted == {"expired": 1, "idle": 1, "budget": 0}
+    assert "SH600036" in tables(db_path) and "SH600000" not in tables(db_path)
+    assert statements.read_cached("600000.SH", "quarter") is None
+    assert statements.read_cached("600036.SH", "quarter") is not None
+
+def test_untracked_tables_are_registered(db_path):
+    with sqlite3.connect(db_path) as conn:
+        pd.DataFrame({"date": ["20240102"], "close": [1.0]}).to_sql("HK00700", conn, index=False)
+    maintain_cache(db_path, max_bytes=0, max_idle=0)
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute(f"SELECT table_name FROM {ACCESS_TABLE}").fetchall() == [("HK00700",)]
+
+def test_full_vacuum_needs_free_disk_space(db_path, monkeypatch):
+    write_history(db_path, "SH600000")
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: shutil._ntuple_diskusage(1 << 30, 1 << 30, 1024))
+    maintain_cache(db_path, max_bytes=0, max_idle=0)
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+    # New databases need no full vacuum
+    new_path = os.path.join(os.path.dirname(db_path), "new.db")
+    create_database(new_path)
+    write_history(new_path, "SH600000")
+    with sqlite3.connect(new_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+def test_eviction_invalidates_the_memory_tier(db_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(memory_cache, "_memory_cache", None)
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "16")
+    history = write_history(db_path, "SH600000")
+    assert len(history.fetch_date_range("20000101", "20301231")) == 2000
+    statements = BlobCache(table_name="income", db_path=str(tmp_path))
+    statements.write_cached("600000.SH", "quarter", pd.DataFrame({"revenue": [1.0]}))
+    assert memory_cache.get_memory_cache().stats()["entries"] == 2
+
+    maintain_cache(db_path, max_bytes=1, max_idle=0)
+
+    assert memory_cache.get_memory_cache().stats()["entries"] == 0
+    assert statements.read_cached("600000.SH", "quarter") is None
@@ -0,0 +1,64 @@
+import multiprocessing
+import os
+import time
+import pandas as pd
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.cache_lock import DEFAULT_LEASE, DEFAULT_LOCK_WAIT, cache_lock, try_acquire
+
+def slow_download(symbol, report_type, api_key=""):
+    # Every download leaves a file behind, the test counts them
+    with open(os.path.join(os.environ["DOWNLOADS_DIR"], f"{os.getpid()}.txt"), "w"):
+        pass
+    time.sleep(0.5)
+    return pd.DataFrame({"symbol": [symbol], "value": [1.0]})
+
+def load(cache_dir: str, results):
+    cache = BlobCache(table_name="income", db_path=cache_dir)
+    results.put(len(cache.load_cached_data("600000.SH", "quarter", True, slow_download)))
+
+def test_one_process_downloads_a_missed_entry(tmp_path, monkeypatch):
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    monkeypatch.setenv("DOWNLOADS_DIR", str(downloads))
+    BlobCache(table_name="income", db_path=str(tmp_path))
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    workers = [context.Process(target=load, args=(str(tmp_path), results)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+
+    assert [results.get(timeout=1) for _ in workers] == [1, 1, 1, 1]
+    assert len(list(downloads.iterdir())) == 1
+
+def test_lock_waits_times_out_and_expires(tmp_path):
+    db_path = str(tmp_path / "equity.db")
+    with cache_lock("income:SH600000", db_path) as held:
+        assert held
+        assert not try_acquire("income:SH600000", "other", db_path)
+        with cache_lock("income:SH600000", db_path, wait=0.1) as waited:
+            assert not waited
+        with cache_lock("income:SZ000001", db_path, wait=0) as other:
+            assert other
+    assert try_acquire("income:SH600000", "other", db_path, lease=0)
+    # The lease of a crashed holder ran out
+    assert try_acquire("income:SH600000", "next", db_path)
+
+def test_holder_renews_its_lease(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "equity.db")
+    with cache_lock("equity_history:SH600000", db_path, lease=0.3) as held:
+        assert held
+        # Well past the lease, the heartbeat keeps the lock
+        time.sleep(1.0)
+        assert not try_acquire("equity_history:SH600000", "other", db_path)
+    assert try_acquire("equity_history:SH600000", "other", db_path)
+
+    # Waiters wait at least the lease by default
+    monkeypatch.setenv("TUSHARE_CACHE_LOCK_WAIT", "0.1")
+    start = time.monotonic()
+    with cache_lock("equity_history:SH600000", db_path, lease=0.5) as waited:
+        assert not waited
+    assert time.monotonic() - start >= 0.5
+    assert DEFAULT_LOCK_WAIT >= DEFAULT_LEASE
@@ -145,7 +145,7 @@ def test_get_etf_symbols_field_extraction():
         'market': ['E', 'E'],
     })
     
-    with patch('openbb_tushare.utils.ts_etf_search.ts') as mock_ts:
+    with patch('openbb_tushare.utils.ts_client.ts') as mock_ts:
         with patch('openbb_tushare.utils.ts_etf_search.TableCache') as mock_cache_class:
             mock_pro = Mock()
             mock_pro.fund_basic.return_value = mock_data
@@ -179,7 +179,7 @@ def test_get_etf_symbols_name_field_mapping():
         'market': ['E'],
     })
     
-    with patch('openbb_tushare.utils.ts_etf_search.ts') as mock_ts:
+    with patch('openbb_tushare.utils.ts_client.ts') as mock_ts:
         with patch('openbb_tushare.utils.ts_etf_search.TableCache') as mock_cache_class:
             mock_pro = Mock()
             mock_pro.fund_basic.return_value = mock_data
@@ -207,7 +207,7 @@ def test_get_etf_symbols_exchange_mapping():
         'market': ['E', 'E'],
     })
     
-    with patch('openbb_tushare.utils.ts_etf_search.ts') as mock_ts:
+    with patch('openbb_tushare.utils.ts_client.ts') as mock_ts:
         with patch('openbb_tushare.utils.ts_etf_search.TableCache') as mock_cache_class:
             mock_pro = Mock()
             mock_pro.fund_basic.return_value = mock_data
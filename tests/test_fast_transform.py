@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import pandas as pd
+from openbb_tushare.models.equity_historical import TushareEquityHistoricalData
+from openbb_tushare.models.historical_dividends import TushareHistoricalDividendsData
+from openbb_tushare.utils.fast_transform import FAST_TRANSFORM_ENV, construct_models, transform_records
+
+def make_bars(rows=3):
+    return pd.DataFrame({
+        'date': pd.date_range('2024-07-08', periods=rows, freq='D'),
+        'open': np.arange(rows, dtype=float) + 10,
+        'high': np.arange(rows, dtype=float) + 11,
+        'low': np.arange(rows, dtype=float) + 9,
+        'close': np.arange(rows, dtype=float) + 10.5,
+        'volume': np.arange(rows, dtype=float) * 1000,
+        'amount': [1.5, np.nan, 2.5][:rows],
+        'ts_code': '600036.SH',
+    })
+
+def test_construct_models_matches_validated_models():
+    bars = make_bars()
+    fast = construct_models(TushareEquityHistoricalData, bars)
+    slow = [TushareEquityHistoricalData.model_validate(d) for d in bars.to_dict(orient="records")]
+    for f, s in zip(fast, slow):
+        expected = s.model_dump()
+        expected['amount'] = None if pd.isna(expected['amount']) else expected['amount']
+        assert f.model_dump() == expected
+    # the extra columns are kept
+    assert fast[0].model_dump()['ts_code'] == '600036.SH'
+
+def test_construct_models_renames_aliases():
+    events = pd.DataFrame({'ts_code': ['600036.SH'], 'ex_dividend_date': [pd.Timestamp('2024-07-11')], 'amount': [1.97]})
+    model, = construct_models(TushareHistoricalDividendsData, events)
+    assert model.symbol == '600036.SH'
+    assert model.ex_dividend_date == pd.Timestamp('2024-07-11').date()
+
+def test_transform_records_falls_back_on_invalid_frame(monkeypatch):
+    monkeypatch.setenv(FAST_TRANSFORM_ENV, "1")
+    records = make_bars().to_dict(orient="records")
+    records[1]['open'] = 'n/a'
+    with pytest.raises(ValueError, match="open"):
+        construct_models(TushareEquityHistoricalData, pd.DataFrame(records))
+    # the validated path reports the bad row
+    with pytest.raises(ValueError):
+        transform_records(TushareEquityHistoricalData, records)
+
+def test_models_with_other_validators_are_validated_per_record(monkeypatch):
+    from pydantic import field_validator
+
+    class RoundedData(TushareEquityHistoricalData):
+        @field_validator("close", mode="before")
+        @classmethod
+        def round_close(cls, v):
+            return round(v)
+
+    bars = make_bars()
+    with pytest.raises(ValueError, match="round_close"):
+        construct_models(RoundedData, bars)
+    monkeypatch.setenv(FAST_TRANSFORM_ENV, "1")
+    assert [model.close for model in transform_records(RoundedData, bars)] == [10, 12, 12]
+    assert len(construct_models(TushareEquityHistoricalData, bars)) == 3
+
+def test_columnar_results_keep_the_frame(monkeypatch):
+    from openbb_core.app.model.obbject import OBBject
+    from openbb_tushare.models.equity_historical import TushareEquityHistoricalFetcher
+    from openbb_tushare.utils.fast_transform import COLUMNAR_RESULTS_ENV
+
+    bars = make_bars()
+    monkeypatch.setenv(COLUMNAR_RESULTS_ENV, "1")
+    result = TushareEquityHistoricalFetcher.transform_data(None, bars)
+    assert isinstance(result, pd.DataFrame)
+    assert result['close'].dtype == float
+    assert result['date'].dtype.kind == 'M'
+    assert OBBject(results=result).to_df() is result
+
+    monkeypatch.delenv(COLUMNAR_RESULTS_ENV)
+    models = TushareEquityHistoricalFetcher.transform_data(None, bars)
+    assert [m.close for m in models] == bars['close'].tolist()
+
+def test_validators_are_matched_by_function_not_name():
+    from datetime import date
+    from pydantic import field_validator
+
+    class ShiftedData(TushareEquityHistoricalData):
+        @field_validator("date", mode="before", check_fields=False)
+        @classmethod
+        def date_validate(cls, v):
+            return date(2000, 1, 1)
+
+    with pytest.raises(ValueError, match="date_validate"):
+        construct_models(ShiftedData, make_bars())
@@ -0,0 +1,98 @@
+import pytest
+import pandas as pd
+from openbb_tushare.utils.pit_store import get_pit_store
+from openbb_tushare.utils.fundamentals import get_fundamentals_snapshot, get_ttm_metrics, parse_report_period
+
+def make_report(ts_codes, end_date, ann_date, **items):
+    return pd.DataFrame({
+        'ts_code': ts_codes,
+        'ann_date': [ann_date] * len(ts_codes),
+        'f_ann_date': [ann_date] * len(ts_codes),
+        'end_date': [end_date] * len(ts_codes),
+        'report_type': ['1'] * len(ts_codes),
+        'end_type': ['4'] * len(ts_codes),
+        'update_flag': ['0'] * len(ts_codes),
+        **items,
+    })
+
+@pytest.fixture
+def statements(cache_path):
+    codes = ['600036.SH', '000001.SZ', '600519.SH']
+    get_pit_store("income_statement").add_revisions(
+        make_report(codes, '20241231', '20250320', total_revenue=[10.0, 20.0, 30.0], n_income=[1.0, 2.0, 3.0]))
+    get_pit_store("balance_sheet").add_revisions(
+        make_report(codes[:2], '20241231', '20250320', total_assets=[100.0, 200.0]))
+    get_pit_store("cash_flow").add_revisions(
+        make_report(codes, '20241231', '20250320', net_profit=[9.0, 9.0, 9.0], n_cashflow_act=[5.0, 6.0, 7.0]))
+    get_pit_store("income_statement").add_revisions(
+        make_report(codes, '20240930', '20241030', total_revenue=[7.0, 14.0, 21.0], n_income=[0.5, 1.0, 1.5]))
+
+@pytest.mark.parametrize("period,expected", [
+    ("2024Q4", "20241231"), ("2024q1", "20240331"), ("2024", "20241231"), ("2024FY", "20241231"), ("20240630", "20240630"),
+])
+def test_parse_report_period(period, expected):
+    assert parse_report_period(period) == expected
+
+def test_parse_report_period_rejects_invalid():
+    with pytest.raises(ValueError, match="Invalid 'period'"):
+        parse_report_period("2024-12")
+
+def test_snapshot_joins_statements(statements):
+    snapshot = get_fundamentals_snapshot("2024Q4", ["total_revenue", "net_income", "total_assets"])
+    assert list(snapshot.columns) == ["symbol", "period_ending", "total_revenue", "net_income", "total_assets"]
+    assert snapshot['symbol'].tolist() == ['000001.SZ', '600036.SH', '600519.SH']
+    # net_income comes from the income statement, not the cash flow statement
+    assert snapshot['net_income'].tolist() == [2.0, 1.0, 3.0]
+    assert snapshot['total_assets'].isna().tolist() == [False, False, True]
+
+def test_snapshot_filters_symbols_and_knowledge_date(statements):
+    snapshot = get_fundamentals_snapshot("2024Q3", ["total_revenue"], symbols="600519.SH")
+    assert snapshot[['symbol', 'total_revenue']].values.tolist() == [['600519.SH', 21.0]]
+    assert get_fundamentals_snapshot("2024Q4", ["total_revenue"], as_of="20250101").empty
+
+def test_snapshot_rejects_unknown_fields(statements):
+    with pytest.raises(ValueError, match="Invalid 'fields': unknown_item"):
+        get_fundamentals_snapshot("2024Q4", ["unknown_item"])
+
+def make_quarters(ts_code, ytd_by_end_date, column):
+    end_dates = list(ytd_by_end_date)
+    return pd.DataFrame({
+        'ts_code': [ts_code] * len(end_dates),
+        'ann_date': [f"{int(d[:4]) + 1}0101" for d in end_dates],
+        'f_ann_date': [f"{int(d[:4]) + 1}0101" for d in end_dates],
+        'end_date': end_dates,
+        'report_type': ['1'] * len(end_dates),
+        'end_type': ['1'] * len(end_dates),
+        'update_flag': ['0'] * len(end_dates),
+        column: list(ytd_by_end_date.values()),
+    })
+
+def test_ttm_metrics_from_cumulative_reports(cache_path):
+    revenue = {'20230331': 10.0, '20230630': 25.0, '20230930': 45.0, '20231231': 70.0,
+               '20240331': 12.0, '20240630': 30.0}
+    get_pit_store("income_statement").add_revisions(make_quarters('600036.SH', revenue, 'total_revenue'))
+    get_pit_store("income_statement").add_revisions(make_quarters('000001.SZ', {'20240331': 5.0}, 'total_revenue'))
+    get_pit_store("cash_flow").add_revisions(
+        make_quarters('600036.SH', {'20231231': 8.0, '20240331': 0.0, '20240630': 3.0}, 'n_cashflow_act'))
+
+    metrics = get_ttm_metrics(["total_revenue", "net_cash_from_operating_activities"])
+    bank = metrics[metrics['symbol'] == '600036.SH']
+    assert bank['total_revenue_quarter'].tolist() == [10.0, 15.0, 20.0, 25.0, 12.0, 18.0]
+    assert bank['total_revenue_ttm'].tolist()[3:] == [70.0, 72.0, 75.0]
+    assert bank['total_revenue_ttm'].isna().tolist()[:3] == [True, True, True]
+    assert bank['total_revenue_qoq'].tolist()[4] == pytest.approx(-0.52)
+    assert bank['total_revenue_yoy'].tolist()[5] == pytest.approx(0.2)
+    # growth against a zero quarter is undefined
+    assert pd.isna(bank['net_cash_from_operating_activities_qoq'].tolist()[-1])
+
+    other = metrics[metrics['symbol'] == '000001.SZ']
+    assert other['total_revenue_quarter'].tolist() == [5.0]
+    assert other['total_revenue_ttm'].isna().all()
+
+    recent = get_ttm_metrics(["total_revenue"], symbols="600036.SH", start_period="2024Q1")
+    assert recent['period_ending'].astype(str).tolist() == ['2024-03-31', '2024-06-30']
+
+def test_ttm_metrics_rejects_balance_sheet_fields(cache_path):
+    get_pit_store("balance_sheet").add_revisions(make_quarters('600036.SH', {'20240331': 1.0}, 'total_assets'))
+    with pytest.raises(ValueError, match="Invalid 'fields': total_assets"):
+        get_ttm_metrics(["total_assets"])
@@ -0,0 +1,51 @@
+from datetime import date
+import pandas as pd
+import pytest
+import openbb_tushare.utils.mock_server as mock_server
+import openbb_tushare.utils.ts_equity_historical as historical
+from openbb_tushare.utils.ts_client import get_pro_api
+
+@pytest.fixture
+def server(start_server):
+    return start_server(universe=4)
+
+def test_split_date_range():
+    chunks = historical.split_date_range("20240101", "20240131", 10)
+
+    assert chunks == [("20240101", "20240112"), ("20240115", "20240126"), ("20240129", "20240131")]
+    assert historical.split_date_range("20240106", "20240107", 10) == []
+
+def test_long_range_is_downloaded_in_chunks(server):
+    data = historical.get_one("600000.SH", date(1995, 1, 1), date(2024, 12, 31), api_key="test")
+
+    weekdays = pd.bdate_range("1995-01-01", "2024-12-31")
+    assert len(data) == len(weekdays)
+    assert data["date"].is_unique
+    assert data["date"].iloc[0] == "20241231"
+    assert data["date"].iloc[-1] == "19950102"
+    assert server.stats["requests"] == 2
+
+def test_full_response_is_followed_up(server, monkeypatch):
+    monkeypatch.setitem(mock_server.ROW_LIMITS, "daily", 40)
+    pro = get_pro_api("test")
+
+    def fetch(start_date, end_date):
+        return pro.frame("daily", rename=historical.HISTORY_COLUMNS, ts_code="600000.SH",
+                         start_date=start_date, end_date=end_date)
+
+    data = historical.download_range(fetch, "20240101", "20240517", 40)
+
+    assert len(data) == len(pd.bdate_range("2024-01-01", "2024-05-17")) == 100
+    assert data["date"].is_unique
+    assert server.stats["requests"] == 3
+
+def test_backfills_download_in_their_priority_class(server):
+    from openbb_tushare.utils import metrics
+    from openbb_tushare.utils.rate_limit import BACKFILL
+
+    metrics.reset()
+    historical.get_from_cache("600000.SH", date(1995, 1, 1), date(2024, 12, 31), api_key="test", priority=BACKFILL)
+
+    waits = metrics.snapshot()["histograms"]["tushare_api_wait_seconds"]
+    assert [(wait["labels"], wait["count"]) for wait in waits] == [({"priority": "backfill"}, 2)]
+    metrics.reset()
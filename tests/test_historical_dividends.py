@@ -0,0 +1,100 @@
+import pytest
+import pandas as pd
+from datetime import date
+import openbb_tushare.utils.ts_client as ts_client
+import openbb_tushare.utils.ts_historical_dividends as ts_dividends
+from openbb_tushare.utils.ts_historical_dividends import (
+    DividendStore,
+    get_dividend_calendar,
+    get_dividends,
+    ingest_dividends,
+)
+
+EVENTS = pd.DataFrame({
+    'ts_code': ['600036.SH', '600036.SH', '000001.SZ', '000001.SZ'],
+    'end_date': ['20231231', '20231231', '20231231', '20221231'],
+    'ann_date': ['20240326', '20240326', '20240315', '20230310'],
+    'div_proc': ['预案', '实施', '实施', '实施'],
+    'cash_div': [1.97, 1.97, 0.72, 0.285],
+    'cash_div_tax': [1.97, 1.97, 0.72, 0.285],
+    'ex_date': [None, '20240711', '20240614', '20230614'],
+    'imp_ann_date': [None, '20240704', '20240607', '20230607'],
+})
+
+class FakePro:
+    """Stand-in for the Tushare pro API answering dividend queries from EVENTS."""
+
+    def __init__(self):
+        self.calls = []
+        self.priorities = set()
+
+    def dividend(self, **params):
+        from openbb_tushare.utils.rate_limit import current_priority
+
+        self.calls.append(params)
+        self.priorities.add(current_priority())
+        (column, value), = params.items()
+        return EVENTS[EVENTS[column] == value].reset_index(drop=True)
+
+@pytest.fixture
+def pro(cache_path, monkeypatch):
+    fake = FakePro()
+    monkeypatch.setattr(ts_client.ts, "pro_api", lambda token: fake)
+    return fake
+
+def test_ingest_dividends_day_by_day(pro):
+    written = ingest_dividends("20240603", "20240716", api_key="token")
+    assert written == 4  # both events, once by ex_date and once by imp_ann_date
+    # weekends are skipped
+    assert {"ex_date": "20240608"} not in pro.calls
+    assert DividendStore().get_sync("market")[:2] == ("20240603", "20240716")
+
+    calendar = get_dividend_calendar(date(2024, 6, 1), date(2024, 7, 31))
+    assert calendar['ts_code'].tolist() == ['000001.SZ', '600036.SH']
+    assert calendar['amount'].tolist() == [0.72, 1.97]
+
+def test_ingest_dividends_resumes_from_watermark(pro):
+    ingest_dividends("20240603", "20240610", api_key="token")
+    assert pro.priorities == {"backfill"}
+    pro.calls.clear()
+    pro.priorities.clear()
+    ingest_dividends(end_date="20240612", api_key="token")
+    assert pro.calls[0] == {"ex_date": "20240611"}
+    # Incremental runs keep the store current
+    assert pro.priorities == {"refresh"}
+    assert DividendStore().get_sync("market")[:2] == ("20240603", "20240612")
+
+def test_get_dividends_served_from_market_ingestion(pro):
+    ingest_dividends("20240603", "20240716", api_key="token")
+    pro.calls.clear()
+    data = get_dividends("000001.SZ", date(2024, 6, 3), date(2024, 7, 16), api_key="token")
+    assert pro.calls == []
+    assert data['amount'].tolist() == [0.72]
+
+def test_get_dividends_downloads_symbol_once(pro):
+    data = get_dividends("000001", api_key="token")
+    assert pro.calls == [{"ts_code": "000001.SZ"}]
+    assert data['ex_dividend_date'].dt.strftime('%Y%m%d').tolist() == ['20240614', '20230614']
+
+    get_dividends("000001.SZ", api_key="token")
+    assert len(pro.calls) == 1
+
+def test_get_dividends_multiple_symbols_with_date_range(pro):
+    get_dividends("000001.SZ", api_key="token")
+    pro.calls.clear()
+
+    data = get_dividends("600036.SH,000001.SZ", date(2024, 1, 1), date(2024, 12, 31), api_key="token")
+    # only the symbol missing from the cache is downloaded
+    assert pro.calls == [{"ts_code": "600036.SH"}]
+    assert data[['ts_code', 'amount']].values.tolist() == [['000001.SZ', 0.72], ['600036.SH', 1.97]]
+
+def test_get_dividends_warns_on_partial_failure(pro, monkeypatch):
+    def get_tushare_data(symbol, period="annual", api_key=""):
+        if symbol == "600036.SH":
+            raise RuntimeError("quota exceeded")
+        return EVENTS[EVENTS['ts_code'] == symbol]
+    monkeypatch.setattr(ts_dividends, "get_tushare_data", get_tushare_data)
+
+    with pytest.warns(UserWarning, match="600036.SH"):
+        data = get_dividends("600036.SH,000001.SZ", api_key="token")
+    assert set(data['ts_code']) == {'000001.SZ'}
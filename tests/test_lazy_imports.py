@@ -0,0 +1,10 @@
+import subprocess
+import sys
+
+def test_provider_registers_without_heavy_imports():
+    check = (
+        "import sys, openbb_tushare.provider, openbb_tushare.openbb; "
+        "print(','.join(m for m in ['pandas', 'tushare', 'openbb_tushare.utils'] if m in sys.modules))"
+    )
+    completed = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == ""
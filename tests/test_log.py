@@ -0,0 +1,52 @@
+import logging
+import pytest
+import openbb_tushare.utils as tushare_utils
+from logging.handlers import QueueHandler
+from openbb_tushare.utils.log import (
+    LOG_LEVELS_ENV,
+    get_logger,
+    parse_levels,
+    setup_logging,
+    shutdown_logging,
+)
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "openbb_tushare.log")
+    monkeypatch.setattr(tushare_utils, "get_log_path", lambda: path)
+    shutdown_logging()
+    yield path
+    shutdown_logging()
+
+def test_parse_levels():
+    assert parse_levels("utils.blob_cache=DEBUG, openbb_tushare.models=warning") == {
+        "openbb_tushare.utils.blob_cache": logging.DEBUG,
+        "openbb_tushare.models": logging.WARNING,
+    }
+    with pytest.raises(ValueError, match="LOUD"):
+        parse_levels("utils=LOUD")
+
+def test_setup_logging_once_writes_through_queue(log_path, monkeypatch):
+    monkeypatch.setenv(LOG_LEVELS_ENV, "utils.blob_cache=WARNING")
+    # an application without logging configuration, the pytest handlers are added after the fixtures
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    setup_logging()
+    setup_logging()
+    package_logger = logging.getLogger("openbb_tushare")
+    assert len([h for h in package_logger.handlers if isinstance(h, QueueHandler)]) == 1
+
+    get_logger("openbb_tushare.utils.blob_cache").info("cache hit")
+    get_logger("openbb_tushare.utils.ts_statements").info("downloaded")
+    shutdown_logging()
+
+    with open(log_path) as f:
+        content = f.read()
+    assert "downloaded" in content
+    assert "cache hit" not in content
+    logging.getLogger("openbb_tushare.utils.blob_cache").setLevel(logging.NOTSET)
+
+def test_setup_logging_defers_to_configured_application(log_path, monkeypatch):
+    monkeypatch.setattr(logging.getLogger(), "handlers", [logging.NullHandler()])
+    setup_logging()
+    assert logging.getLogger("openbb_tushare").propagate
+    assert not logging.getLogger("openbb_tushare").handlers
@@ -0,0 +1,72 @@
+import sqlite3
+import pandas as pd
+import pytest
+from openbb_tushare.utils import memory_cache
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.memory_cache import MemoryCache, frame_size
+from openbb_tushare.utils.table_cache import TableCache
+
+NAMESPACE = ("equity.db", "SH600000", "equity_history")
+
+def frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"close": [float(i) for i in range(rows)]})
+
+@pytest.fixture
+def memory(monkeypatch):
+    monkeypatch.setattr(memory_cache, "_memory_cache", None)
+    cache = memory_cache.get_memory_cache()
+    yield cache
+    cache.clear()
+
+def test_lru_is_bounded_by_bytes():
+    size = frame_size(frame(100))
+    cache = MemoryCache(max_bytes=2 * size)
+    cache.put(NAMESPACE, "a", frame(100))
+    cache.put(NAMESPACE, "b", frame(100))
+    assert cache.get(NAMESPACE, "a") is not None
+    cache.put(NAMESPACE, "c", frame(100))
+    # b was used least recently
+    assert cache.get(NAMESPACE, "b") is None
+    cache.put(NAMESPACE, "huge", frame(1000))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] == 2 * size
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+
+def test_cached_frames_are_copies():
+    cache = MemoryCache(max_bytes=1 << 20)
+    data = frame(3)
+    cache.put(NAMESPACE, "a", data)
+    data.loc[0, "close"] = -1.0
+    cached, _ = cache.get(NAMESPACE, "a")
+    cached.loc[1, "close"] = -1.0
+    assert list(cache.get(NAMESPACE, "a")[0]["close"]) == [0.0, 1.0, 2.0]
+
+def test_table_reads_are_served_from_memory_until_written(tmp_path, memory):
+    db_path = str(tmp_path / "equity.db")
+    cache = TableCache({"date": "TEXT PRIMARY KEY", "close": "REAL"}, db_path=db_path,
+                       table_name="SH600000", primary_key="date", cache_name="equity_history")
+    cache.write_dataframe(pd.DataFrame({"date": ["20240102", "20240103"], "close": [1.0, 2.0]}))
+    assert len(cache.fetch_date_range("20240101", "20240131")) == 2
+
+    # Changes behind the cache's back are not seen, its own writes are
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM SH600000")
+    assert len(cache.fetch_date_range("20240101", "20240131")) == 2
+    cache.update_or_insert(pd.DataFrame({"date": ["20240104"], "close": [3.0]}))
+    assert len(cache.fetch_date_range("20240101", "20240131")) == 1
+    assert memory.stats()["hits"] == 1
+
+def test_blob_reads_are_served_from_memory_while_fresh(tmp_path, memory, monkeypatch):
+    cache = BlobCache(table_name="income", db_path=str(tmp_path))
+    cache.write_cached("600000.SH", "quarter", frame(3))
+    monkeypatch.setattr("pickle.loads", lambda blob: pytest.fail("unpickled a cached entry"))
+    assert len(cache.read_cached("600000.SH", "quarter")) == 3
+
+    monkeypatch.setattr(cache, "_is_fresh", lambda report_type, timestamp, now: False)
+    assert cache.read_cached("600000.SH", "quarter") is None
+
+def test_disabled(monkeypatch):
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "0")
+    assert memory_cache.get_memory_cache() is None
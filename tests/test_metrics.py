@@ -0,0 +1,87 @@
+import urllib.request
+import pytest
+import pandas as pd
+import openbb_tushare.utils.ts_client as ts_client
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.table_cache import TableCache
+
+@pytest.fixture(autouse=True)
+def registry(cache_path):
+    metrics.reset()
+    yield metrics.REGISTRY
+    metrics.reset()
+
+def counter(name, **labels):
+    for item in metrics.snapshot()["counters"].get(name, []):
+        if item["labels"] == labels:
+            return item["value"]
+    return 0
+
+def test_histogram_and_prometheus_text():
+    metrics.observe("tushare_api_latency_seconds", 0.02, endpoint="daily")
+    metrics.observe("tushare_api_latency_seconds", 3.0, endpoint="daily")
+    metrics.inc("tushare_api_requests_total", endpoint="daily", status="ok")
+
+    histogram, = metrics.snapshot()["histograms"]["tushare_api_latency_seconds"]
+    assert histogram["count"] == 2
+    assert histogram["buckets"]["0.025"] == 1
+    assert histogram["buckets"]["+Inf"] == 2
+
+    text = metrics.prometheus_text()
+    assert 'tushare_api_requests_total{endpoint="daily",status="ok"} 1.0' in text
+    assert 'tushare_api_latency_seconds_bucket{endpoint="daily",le="5.0"} 2' in text
+    assert 'tushare_api_latency_seconds_count{endpoint="daily"} 2' in text
+
+def test_cache_hits_misses_and_bytes(monkeypatch):
+    # Bytes are read from SQLite, not from the memory tier
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "0")
+    cache = BlobCache(table_name="balance_sheet")
+    assert cache.read_cached("600036.SH", "annual") is None
+    cache.write_cached("600036.SH", "annual", pd.DataFrame({"total_assets": [1.0, 2.0]}))
+    cache.read_cached("600036.SH", "annual")
+
+    assert counter("tushare_cache_requests_total", cache="balance_sheet", result="miss") == 1
+    assert counter("tushare_cache_requests_total", cache="balance_sheet", result="hit") == 1
+    assert counter("tushare_cache_rows_read_total", cache="balance_sheet") == 2
+    assert counter("tushare_cache_bytes_read_total", cache="balance_sheet") == \
+        counter("tushare_cache_bytes_written_total", cache="balance_sheet") > 0
+
+    history = TableCache({"date": "TEXT PRIMARY KEY", "close": "REAL"}, table_name="SH600036",
+                         primary_key="date", cache_name="equity_history")
+    history.fetch_date_range("20240101", "20241231")
+    assert counter("tushare_cache_requests_total", cache="equity_history", result="miss") == 1
+
+def test_api_calls_are_timed_per_endpoint(monkeypatch):
+    class FakePro:
+        def daily(self, **params):
+            return pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+
+        def income(self, **params):
+            raise RuntimeError("quota exceeded")
+
+    monkeypatch.setattr(ts_client.ts, "pro_api", lambda token: FakePro())
+    pro = ts_client.get_pro_api("token")
+    pro.daily(ts_code="600036.SH")
+    with pytest.raises(RuntimeError):
+        pro.income(ts_code="600036.SH")
+
+    assert counter("tushare_api_requests_total", endpoint="daily", status="ok") == 1
+    assert counter("tushare_api_requests_total", endpoint="income", status="error") == 1
+    assert counter("tushare_api_rows_total", endpoint="daily") == 3
+    endpoints = {h["labels"]["endpoint"] for h in metrics.snapshot()["histograms"]["tushare_api_latency_seconds"]}
+    assert endpoints == {"daily", "income"}
+
+def test_metrics_server_and_dump(tmp_path):
+    metrics.inc("tushare_api_requests_total", endpoint="daily", status="ok")
+    server = metrics.start_metrics_server(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            assert "tushare_api_requests_total" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    path = tmp_path / "metrics.json"
+    metrics.dump_snapshot(str(path))
+    assert "tushare_api_requests_total" in path.read_text()
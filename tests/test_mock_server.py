@@ -0,0 +1,78 @@
+from datetime import date
+import pytest
+import requests
+from openbb_tushare.utils.mock_server import MockTushareServer
+from openbb_tushare.utils.ts_client import get_pro_api
+
+def test_client_is_pointed_at_the_server(server):
+    from openbb_tushare.utils.ts_equity_historical import get_from_cache
+
+    data = get_from_cache("600000.SH", date(2024, 1, 1), date(2024, 1, 31), api_key="test")
+
+    assert len(data) == 23
+    assert server.stats["requests"] == 1
+
+def test_data_is_deterministic_across_ranges(server):
+    pro = get_pro_api("test")
+
+    month = pro.daily(ts_code="600000.SH", start_date="20240101", end_date="20240131")
+    week = pro.daily(ts_code="600000.SH", start_date="20240108", end_date="20240112")
+
+    assert list(month["trade_date"][:2]) == ["20240131", "20240130"]
+    expected = month[month["trade_date"].between("20240108", "20240112")].reset_index(drop=True)
+    assert week.equals(expected)
+
+def test_fields_limit_and_row_cap(server):
+    pro = get_pro_api("test")
+
+    basic = pro.stock_basic(fields="ts_code,name")
+    assert list(basic.columns) == ["ts_code", "name"]
+    assert len(basic) == 20
+    assert len(pro.stock_basic(limit=5, offset=18)) == 2
+    assert len(pro.daily(ts_code="600000.SH", start_date="19900101", end_date="20241231")) == 6000
+
+def test_quota_throttling(monkeypatch):
+    monkeypatch.setenv("TUSHARE_MAX_RETRIES", "0")
+    with MockTushareServer(quota=2) as server:
+        pro = get_pro_api("test")
+        pro._pro._DataApi__http_url = server.url
+        pro.index_basic()
+        pro.index_basic()
+        with pytest.raises(Exception, match="每分钟最多访问该接口2次"):
+            pro.index_basic()
+        pro.fund_basic()
+    assert server.stats["throttled"] == 1
+
+def test_injected_errors_and_unknown_endpoints(monkeypatch):
+    monkeypatch.setenv("TUSHARE_MAX_RETRIES", "0")
+    with MockTushareServer(error_rate=1.0) as server:
+        pro = get_pro_api("test")
+        pro._pro._DataApi__http_url = server.url
+        with pytest.raises(Exception, match="系统内部错误"):
+            pro.daily(ts_code="600000.SH")
+        with pytest.raises(Exception, match="接口名"):
+            pro.query("no_such_api")
+    assert server.stats["errors"] == 1
+
+@pytest.mark.parametrize("status", [503, 429])
+def test_http_errors_are_raised_and_retried(monkeypatch, status):
+    from openbb_tushare.utils import ts_client
+
+    monkeypatch.setenv("TUSHARE_MAX_RETRIES", "0")
+    with MockTushareServer(http_error_rate=1.0, http_status=status) as server:
+        pro = get_pro_api("test")
+        pro._pro._DataApi__http_url = server.url
+        # Not an empty frame, which would be cached as the data
+        with pytest.raises(requests.HTTPError):
+            pro.daily(ts_code="600000.SH")
+        with pytest.raises(requests.HTTPError):
+            pro.frame("daily", ts_code="600000.SH")
+
+    monkeypatch.setenv("TUSHARE_MAX_RETRIES", "10")
+    monkeypatch.setattr(ts_client, "RETRY_BASE_DELAY", 0.01)
+    with MockTushareServer(http_error_rate=0.5, http_status=status) as server:
+        pro = get_pro_api("test")
+        pro._pro._DataApi__http_url = server.url
+        for _ in range(5):
+            assert len(pro.daily(ts_code="600000.SH", start_date="20240101", end_date="20240131")) == 23
+    assert server.stats["http_errors"] > 0
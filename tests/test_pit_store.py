@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+from openbb_tushare.utils.pit_store import PointInTimeStore, get_statements_as_of
+
+def make_revisions():
+    # 600036.SH restated its 2023 annual report on 2024-06-01
+    return pd.DataFrame({
+        'ts_code': ['600036.SH', '600036.SH', '600036.SH', '000001.SZ'],
+        'ann_date': ['20240325', '20240325', '20231030', '20240315'],
+        'f_ann_date': ['20240325', '20240601', '20231030', '20240315'],
+        'end_date': ['20231231', '20231231', '20230930', '20231231'],
+        'report_type': ['1', '1', '1', '1'],
+        'end_type': ['4', '4', '3', '4'],
+        'update_flag': ['0', '1', '0', '0'],
+        'total_assets': [100.0, 110.0, 90.0, 50.0],
+    })
+
+def test_add_revisions_keeps_every_revision(cache_path):
+    store = PointInTimeStore("balance_sheet_pit")
+    assert store.add_revisions(make_revisions()) == 4
+    # writing the same revisions again does not duplicate them
+    store.add_revisions(make_revisions())
+    assert len(store.as_of("20991231", end_date="20231231")) == 2
+    assert len(store.as_of("20991231")) == 3
+
+def test_as_of_excludes_later_announcements(cache_path):
+    store = PointInTimeStore("balance_sheet_pit")
+    store.add_revisions(make_revisions())
+
+    before = store.as_of("20240331", ts_codes=["600036.SH"])
+    assert before[['end_date', 'total_assets']].values.tolist() == [['20231231', 100.0], ['20230930', 90.0]]
+
+    after = store.as_of("20240601", ts_codes=["600036.SH"], end_date="20231231")
+    assert after['total_assets'].tolist() == [110.0]
+
+    # nothing about 2023 annual reports is known before they are published
+    assert store.as_of("20240301", end_date="20231231").empty
+
+def test_get_statements_as_of_returns_openbb_names(cache_path):
+    PointInTimeStore("balance_sheet_pit").add_revisions(make_revisions())
+    data = get_statements_as_of("balance_sheet", "20240320", period="20231231")
+    assert data['symbol'].tolist() == ["000001.SZ"]
+    assert data['total_assets'].tolist() == [50.0]
+    assert data['filing_date'].tolist()[0].isoformat() == "2024-03-15"
+
+    with pytest.raises(ValueError, match="Invalid statement"):
+        get_statements_as_of("balance", "20240320")
+
+def test_concurrent_cold_downloads_record_every_symbol(start_server):
+    from openbb_tushare.utils.ts_client import get_pro_api
+    from openbb_tushare.utils.ts_income_statement import get_income_statement
+
+    start_server(universe=8)
+    codes = list(get_pro_api("test").stock_basic(fields="ts_code")["ts_code"])
+    data = get_income_statement(",".join(codes), period="quarter", limit=1, api_key="test")
+
+    assert sorted(data["symbol"].unique()) == sorted(codes)
+    known = get_statements_as_of("income_statement", "20991231", period="20241231")
+    assert sorted(known["symbol"]) == sorted(codes)
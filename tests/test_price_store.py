@@ -0,0 +1,57 @@
+from datetime import date
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_tushare.utils.price_store import PriceStore
+from openbb_tushare.utils.ts_equity_historical import get_from_cache
+
+@pytest.fixture
+def server(start_server, monkeypatch):
+    monkeypatch.setenv("TUSHARE_MEMORY_CACHE_MB", "0")
+    return start_server(universe=4)
+
+def is_mapped(values: np.ndarray) -> bool:
+    while values is not None and not isinstance(values, np.memmap):
+        values = values.base
+    return values is not None
+
+def bars() -> pd.DataFrame:
+    dates = pd.bdate_range("2024-01-01", "2024-03-29")
+    return pd.DataFrame({"date": dates.strftime("%Y%m%d")[::-1], "close": np.arange(len(dates), dtype=float)[::-1],
+                         "volume": np.arange(len(dates))[::-1]})
+
+def test_range_reads_are_views_of_the_file(tmp_path):
+    store = PriceStore(str(tmp_path / "equity.db"))
+    assert store.read_range("SH600000", "20240101", "20240131") is None
+    assert store.write("SH600000", bars())
+
+    data = store.read_range("SH600000", "20240105", "20240110")
+    assert list(data["date"].dt.strftime("%Y%m%d")) == ["20240105", "20240108", "20240109", "20240110"]
+    assert list(data["close"]) == [4.0, 5.0, 6.0, 7.0]
+    assert data["volume"].dtype == np.float64
+    assert is_mapped(data["close"].to_numpy())
+    assert store.read_range("SH600000", "20250101", "20250131").empty
+
+    # The mapping is private
+    data.loc[0, "close"] = -1.0
+    assert store.read_range("SH600000", "20240105", "20240105")["close"].iloc[0] == 4.0
+    assert not store.write("SH600000", bars().assign(name="浦发银行"))
+    assert store.remove("SH600000") > 0
+    assert not os.path.exists(store.path("SH600000"))
+
+def test_get_from_cache_reads_the_store(server, monkeypatch):
+    expected = get_from_cache("600000.SH", date(2024, 1, 1), date(2024, 6, 30), api_key="test")
+    store = PriceStore()
+    assert not os.path.exists(store.path("SH600000"))
+
+    monkeypatch.setenv("TUSHARE_PRICE_STORE", "1")
+    # Bars cached before the store was enabled are copied into it
+    pd.testing.assert_frame_equal(get_from_cache("600000.SH", date(2024, 1, 1), date(2024, 6, 30)), expected)
+    pd.testing.assert_frame_equal(store.read_range("SH600000", "20240101", "20240630"), expected)
+    data = get_from_cache("600000.SH", date(2024, 2, 1), date(2024, 2, 29))
+    assert is_mapped(data["close"].to_numpy())
+    assert server.stats["requests"] == 1
+
+    get_from_cache("600036.SH", date(2024, 1, 1), date(2024, 1, 31), api_key="test")
+    assert os.path.exists(store.path("SH600036"))
@@ -0,0 +1,172 @@
+import threading
+import pytest
+import requests
+import openbb_tushare.utils.ts_client as ts_client
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.mock_server import MockTushareServer
+from openbb_tushare.utils.helpers import map_concurrently
+from openbb_tushare.utils.rate_limit import (
+    BACKFILL, FATAL, INTERACTIVE, OK, REFRESH, THROTTLED, TRANSIENT,
+    AdaptiveLimiter, backoff_delay, classify_error, current_priority, priority,
+)
+
+def test_classify_error():
+    assert classify_error(Exception("抱歉，您每分钟最多访问该接口500次")) == THROTTLED
+    assert classify_error(Exception("系统内部错误，请稍后重试。")) == TRANSIENT
+    assert classify_error(requests.ConnectionError("reset")) == TRANSIENT
+    assert classify_error(Exception("抱歉，您每天最多访问该接口10000次")) == FATAL
+    assert classify_error(Exception("请指定正确的接口名")) == FATAL
+    assert classify_error(Exception("ts_code 600502.SH 不存在")) == FATAL
+    assert classify_error(Exception("Connection settings of the account are invalid")) == FATAL
+    assert classify_error(TimeoutError("timed out")) == TRANSIENT
+
+    def http_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.HTTPError(f"{status} Error", response=response)
+    assert classify_error(http_error(429)) == THROTTLED
+    assert classify_error(http_error(500)) == TRANSIENT
+    assert classify_error(http_error(404)) == FATAL
+
+def test_backoff_delay_is_jittered_and_capped():
+    delays = [backoff_delay(attempt, base=1.0, cap=5.0) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= delay <= 5.0 for delay in delays)
+    assert len(set(delays)) > 100
+
+def test_aimd_limit():
+    limiter = AdaptiveLimiter(maximum=10, initial=4, latency_factor=0)
+
+    for _ in range(4):
+        limiter.release(limiter.acquire(), OK, 0.1)
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+
+    started = limiter.acquire()
+    earlier = limiter.acquire()
+    limiter.release(started, THROTTLED)
+    limiter.release(earlier, THROTTLED)
+    # One decrease per window, the second call started before it
+    assert limiter.limit == pytest.approx(2.5, abs=0.1)
+
+    for _ in range(1000):
+        limiter.release(limiter.acquire(), OK, 0.1)
+    assert limiter.limit == 10
+
+def test_latency_counts_as_congestion():
+    limiter = AdaptiveLimiter(maximum=8, initial=8, latency_factor=4)
+
+    limiter.release(limiter.acquire(), OK, 0.05)
+    limiter.release(limiter.acquire(), OK, 0.5)
+
+    assert limiter.limit < 5
+
+def test_latency_baseline_is_kept_per_endpoint_and_decays():
+    def run(calls):
+        limiter = AdaptiveLimiter(maximum=16, initial=4, latency_factor=4)
+        for endpoint, latency in calls:
+            limiter.release(limiter.acquire(), OK, latency, endpoint)
+        return limiter.limit
+
+    slow = [("daily", 0.5)] * 40
+    expected = run(slow)
+    assert expected > 9
+    # A fast endpoint does not make the slow one look congested
+    assert run([("stock_basic", 0.05)] + slow) >= expected
+    # A fast outlier of the endpoint itself is forgotten after a few calls
+    assert run([("daily", 0.05)] + slow) > expected / 2
+
+def test_backfill_leaves_slots_to_interactive_calls():
+    limiter = AdaptiveLimiter(maximum=8, initial=8, latency_factor=0)
+    backfill = [limiter.acquire(BACKFILL) for _ in range(6)]
+    blocked = threading.Thread(target=limiter.acquire, args=(BACKFILL,), daemon=True)
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+
+    # The reserved quarter of the limit is left to interactive calls
+    interactive = [limiter.acquire(INTERACTIVE) for _ in range(2)]
+    assert limiter.in_flight == 8
+
+    for started in backfill + interactive:
+        limiter.release(started, OK, 0.1)
+    blocked.join(1)
+    assert not blocked.is_alive()
+
+def test_interactive_calls_keep_a_slot_at_low_limits():
+    limiter = AdaptiveLimiter(maximum=2, initial=2, latency_factor=0)
+    assert limiter.capacity(INTERACTIVE) == 2
+    assert limiter.capacity(REFRESH) == limiter.capacity(BACKFILL) == 1
+
+    started = limiter.acquire(BACKFILL)
+    blocked = threading.Thread(target=limiter.acquire, args=(BACKFILL,), daemon=True)
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+    limiter.release(limiter.acquire(INTERACTIVE), OK, 0.1)
+    limiter.release(started, OK, 0.1)
+    blocked.join(1)
+    assert not blocked.is_alive()
+
+    # A single slot is shared, lower classes would otherwise never run
+    limiter = AdaptiveLimiter(maximum=1, initial=1, latency_factor=0)
+    assert limiter.capacity(BACKFILL) == 1
+
+def test_waiting_calls_are_served_by_priority():
+    limiter = AdaptiveLimiter(maximum=1, initial=1, latency_factor=0)
+    started = limiter.acquire(INTERACTIVE)
+    served = []
+
+    def call(name):
+        limiter.release(limiter.acquire(name), OK, 0.1)
+        served.append(name)
+
+    threads = []
+    for name in (BACKFILL, REFRESH, INTERACTIVE):
+        threads.append(threading.Thread(target=call, args=(name,)))
+        threads[-1].start()
+        while limiter._waiting[name] == 0:
+            pass
+    limiter.release(started, OK, 0.1)
+    for thread in threads:
+        thread.join(1)
+
+    assert served == [INTERACTIVE, REFRESH, BACKFILL]
+
+def test_priority_follows_mapped_work():
+    assert current_priority() == INTERACTIVE
+    with priority(BACKFILL):
+        results, _ = map_concurrently(lambda item: current_priority(), ["a", "b"])
+    assert results == {"a": BACKFILL, "b": BACKFILL}
+    assert current_priority() == INTERACTIVE
+    with pytest.raises(ValueError):
+        with priority("urgent"):
+            pass
+
+def test_bulk_calls_converge_below_the_quota(monkeypatch):
+    monkeypatch.setattr(ts_client, "limiter", AdaptiveLimiter(maximum=16, initial=16))
+    monkeypatch.setattr(ts_client, "RETRY_BASE_DELAY", 0.05)
+    monkeypatch.setenv("TUSHARE_MAX_RETRIES", "10")
+    metrics.reset()
+
+    with MockTushareServer(latency=0.01, quota=30, quota_window=0.5, universe=5) as server:
+        pro = ts_client.get_pro_api("test")
+        pro._pro._DataApi__http_url = server.url
+        errors = []
+
+        def worker():
+            for _ in range(10):
+                try:
+                    pro.index_basic()
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert not errors
+    assert server.stats["throttled"] > 0
+    assert server.stats["requests"] - server.stats["throttled"] == 160
+    assert ts_client.limiter.limit < 16
+    metrics.reset()
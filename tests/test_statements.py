@@ -0,0 +1,106 @@
+import pytest
+import pandas as pd
+from openbb_tushare.utils.blob_cache import BlobCache
+from openbb_tushare.utils.ts_statements import filter_statements, load_statements
+
+def make_statement(ts_code):
+    return pd.DataFrame({
+        'ts_code': [ts_code] * 3,
+        'end_date': ['20241231', '20240930', '20231231'],
+        'end_type': ['4', '3', '4'],
+        'total_assets': [3.0, 2.0, 1.0],
+    })
+
+def test_load_statements_fetches_only_misses(cache_path):
+    BlobCache(table_name="balance_sheet").write_cached("600036.SH", "quarter", make_statement("600036.SH"))
+    calls = []
+
+    def get_data(symbol, period, api_key=""):
+        calls.append(symbol)
+        return make_statement(symbol)
+
+    data = load_statements("600036.SH,000001.SZ,600519.SH", "balance_sheet", get_data)
+
+    assert sorted(calls) == ["000001.SZ", "600519.SH"]
+    assert list(data['symbol'].unique()) == ["600036.SH", "000001.SZ", "600519.SH"]
+    assert len(data) == 9
+
+    # The downloaded symbols are now served from cache.
+    calls.clear()
+    load_statements("000001.SZ,600519.SH", "balance_sheet", get_data)
+    assert calls == []
+
+def test_load_statements_tolerates_partial_failures(cache_path):
+    def get_data(symbol, period, api_key=""):
+        if symbol == "000001.SZ":
+            raise RuntimeError("boom")
+        return make_statement(symbol)
+
+    with pytest.warns(UserWarning, match="000001.SZ"):
+        data = load_statements("600036.SH,000001.SZ", "balance_sheet", get_data, use_cache=False)
+    assert list(data['symbol'].unique()) == ["600036.SH"]
+
+def test_filter_statements_limits_per_symbol(cache_path):
+    data = pd.concat([make_statement("600036.SH").assign(symbol="600036.SH"),
+                      make_statement("000001.SZ").assign(symbol="000001.SZ")], ignore_index=True)
+    annual = filter_statements(data, "annual", limit=1)
+    assert list(annual['symbol']) == ["600036.SH", "000001.SZ"]
+    assert list(annual['end_date']) == ['20241231', '20241231']
+
+def make_raw_balance_sheet():
+    return pd.DataFrame({
+        'ts_code': ['600036.SH', '600036.SH'],
+        'symbol': ['600036.SH', '600036.SH'],
+        'ann_date': ['20250325', '20241030'],
+        'f_ann_date': ['20250325', None],
+        'end_date': ['20241231', '20240930'],
+        'end_type': ['4', '3'],
+        'total_assets': [3.0, 2.0],
+        'total_liab': [1.5, None],
+        'money_cap': [0.5, 0.4],
+        'cip': ['7', '8'],
+    })
+
+def test_processing_data_maps_full_field_set():
+    from openbb_tushare.utils.ts_balance_sheet import processing_data
+    result = processing_data(make_raw_balance_sheet())
+    for column in ['symbol', 'period_ending', 'fiscal_year', 'fiscal_period', 'announcement_date', 'filing_date',
+                   'total_assets', 'total_liabilities', 'cash_and_cash_equivalents', 'construction_in_progress']:
+        assert column in result.columns
+    assert 'total_liab' not in result.columns
+    assert result['construction_in_progress'].tolist() == [7.0, 8.0]
+    assert result['filing_date'].tolist()[1] is None
+    assert result['fiscal_period'].tolist() == ['FY', 'Q3']
+
+def test_processing_data_projects_requested_fields():
+    from openbb_tushare.utils.ts_balance_sheet import processing_data
+    result = processing_data(make_raw_balance_sheet(), fields=['total_liabilities'])
+    assert list(result.columns) == ['symbol', 'period_ending', 'fiscal_year', 'fiscal_period',
+                                    'announcement_date', 'filing_date', 'total_liabilities']
+
+    with pytest.raises(ValueError, match="Invalid 'fields': total_liab"):
+        processing_data(make_raw_balance_sheet(), fields=['total_liab'])
+
+def test_processing_data_rejects_columns_mapped_to_one_name():
+    from openbb_tushare.utils.ts_balance_sheet import processing_data
+    raw = make_raw_balance_sheet().assign(total_liabilities=[1.0, 2.0])
+    with pytest.raises(ValueError, match="'total_liab' and 'total_liabilities' are both mapped to 'total_liabilities'"):
+        processing_data(raw)
+
+def test_statement_query_accepts_fields_and_long_history():
+    from openbb_tushare.models.balance_sheet import TushareBalanceSheetQueryParams
+    query = TushareBalanceSheetQueryParams(symbol="600036.SS", fields="total_assets,total_liabilities", limit=40)
+    assert query.limit == 40
+    assert query.fields == "total_assets,total_liabilities"
+
+def test_filter_statements_keeps_latest_revision():
+    data = pd.DataFrame({
+        'symbol': ['600036.SH'] * 3,
+        'ann_date': ['20240325', '20240325', '20231030'],
+        'f_ann_date': ['20240325', '20240601', '20231030'],
+        'end_date': ['20231231', '20231231', '20230930'],
+        'update_flag': ['0', '1', '0'],
+        'total_assets': [100.0, 110.0, 90.0],
+    })
+    result = filter_statements(data, "quarter")
+    assert result['total_assets'].tolist() == [110.0, 90.0]
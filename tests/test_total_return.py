@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+import pandas as pd
+from openbb_tushare.utils.total_return import total_return_index
+
+def make_prices(symbol, closes):
+    dates = pd.to_datetime(list(closes))
+    return pd.DataFrame({'symbol': symbol, 'date': dates, 'close': list(closes.values())})
+
+def test_total_return_reinvests_cash_dividends():
+    prices = make_prices('600036.SH', {'2024-07-09': 10.0, '2024-07-10': 10.0, '2024-07-11': 9.0, '2024-07-12': 9.9})
+    events = pd.DataFrame({'ts_code': ['600036.SH'], 'ex_date': ['20240711'], 'cash_div_tax': [1.0], 'stk_div': [0.0]})
+    result = total_return_index(prices, events)
+    assert result['600036.SH'].tolist() == pytest.approx([1.0, 1.0, 1.0, 1.1])
+
+def test_total_return_applies_bonus_shares_and_suspensions():
+    prices = pd.concat([
+        make_prices('600036.SH', {'2024-07-09': 10.0, '2024-07-10': 11.0, '2024-07-11': 11.0, '2024-07-12': 11.0}),
+        # suspended on 07-10, the bonus shares go ex on that day
+        make_prices('000001.SZ', {'2024-07-09': 10.0, '2024-07-11': 5.0, '2024-07-12': 6.0}),
+    ], ignore_index=True)
+    events = pd.DataFrame({
+        'ts_code': ['000001.SZ', '600036.SH'],
+        'ex_date': ['20240710', '20240101'],
+        'cash_div_tax': [0.0, 5.0],
+        'stk_div': [1.0, 0.0],
+    })
+    result = total_return_index(prices, events, base=100.0)
+    assert result['600036.SH'].tolist() == pytest.approx([100.0, 110.0, 110.0, 110.0])
+    # the bonus shares apply when trading resumes, against the close before the suspension
+    assert result['000001.SZ'].tolist() == pytest.approx([100.0, 100.0, 100.0, 120.0])
+
+def test_total_return_starts_at_listing_date():
+    prices = pd.concat([
+        make_prices('600036.SH', {'2024-07-09': 10.0, '2024-07-10': 10.5}),
+        make_prices('000001.SZ', {'2024-07-10': 8.0}),
+    ], ignore_index=True)
+    result = total_return_index(prices, pd.DataFrame())
+    assert np.isnan(result.loc['2024-07-09', '000001.SZ'])
+    assert result.loc['2024-07-10', '000001.SZ'] == 1.0
+
+def test_total_return_uses_bonus_and_transfer_rates():
+    prices = make_prices('600036.SH', {'2024-07-10': 10.0, '2024-07-11': 4.0})
+    events = pd.DataFrame({'ts_code': ['600036.SH'], 'ex_date': ['20240711'], 'cash_div_tax': [None],
+                           'stk_div': [None], 'stk_bo_rate': [1.0], 'stk_co_rate': [0.5]})
+    result = total_return_index(prices, events)
+    assert result['600036.SH'].tolist() == pytest.approx([1.0, 1.0])
@@ -0,0 +1,67 @@
+import asyncio
+import time
+import pytest
+from openbb_tushare.utils import metrics
+from openbb_tushare.utils.ts_async import AsyncTushareClient
+
+@pytest.fixture
+def server(start_server, monkeypatch):
+    monkeypatch.setenv("TUSHARE_API_KEY", "test")
+    metrics.reset()
+    return start_server(universe=20, latency=0.1)
+
+def test_concurrent_queries_and_errors(server):
+    client = AsyncTushareClient("test", max_concurrency=8)
+
+    async def run():
+        start = time.perf_counter()
+        frames = await asyncio.gather(*[client.daily(ts_code=f"{600000 + i}.SH", start_date="20240101",
+                                                     end_date="20240131") for i in range(8)])
+        elapsed = time.perf_counter() - start
+        with pytest.raises(Exception, match="接口名"):
+            await client.no_such_api()
+        await client.aclose()
+        return frames, elapsed
+
+    frames, elapsed = asyncio.run(run())
+
+    assert [len(frame) for frame in frames] == [23] * 8
+    assert elapsed < 0.5
+    counters = metrics.snapshot()["counters"]["tushare_api_requests_total"]
+    assert {"labels": {"endpoint": "daily", "status": "ok"}, "value": 8.0} in counters
+
+def test_sessions_are_dropped_with_their_loop(server):
+    client = AsyncTushareClient("test")
+    for _ in range(5):
+        assert len(asyncio.run(client.index_basic())) > 0
+    # Every call of the sync interface of OpenBB runs in a new loop
+    assert client._sessions == {}
+
+def test_fetchers_use_the_async_client(server):
+    from openbb_tushare.models.equity_profile import TushareEquityProfileFetcher
+    from openbb_tushare.models.equity_search import TushareEquitySearchFetcher
+
+    profile_query = TushareEquityProfileFetcher.transform_query({"symbol": "600000.SH,600001.SH,00001.HK"})
+    search_query = TushareEquitySearchFetcher.transform_query({})
+
+    profiles = asyncio.run(TushareEquityProfileFetcher.aextract_data(profile_query, None))
+    symbols = asyncio.run(TushareEquitySearchFetcher.aextract_data(search_query, None))
+
+    assert sorted(row["ts_code"] for row in profiles) == ["00001.HK", "600000.SH", "600001.SH"]
+    assert len(symbols) == 24
+    assert server.stats["requests"] == 5
+
+def test_profiles_are_cached_in_tables_of_the_old_schema(server, cache_path):
+    import sqlite3
+    from openbb_tushare.utils.ts_equity_profile import EQUITY_INFO_SCHEMA, get_equity_profile
+
+    columns = ", ".join(f"{'com_name' if c == 'name' else c} {t}" for c, t in EQUITY_INFO_SCHEMA.items())
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute(f"CREATE TABLE equity_profile ({columns})")
+
+    data = get_equity_profile("600000.SH")
+    assert data["name"].notna().all()
+    with sqlite3.connect(cache_path) as conn:
+        assert conn.execute("SELECT ts_code, name FROM equity_profile").fetchall() == \
+            [("600000.SH", data["name"].iloc[0])]
+    assert get_equity_profile("600000.SH")["name"].tolist() == data["name"].tolist()
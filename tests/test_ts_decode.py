@@ -0,0 +1,47 @@
+import pandas as pd
+from openbb_tushare.utils.ts_decode import DATE, INT, YYYYMMDD, decode, decode_frame, loads
+
+RESPONSE = {
+    "fields": ["ts_code", "trade_date", "close", "vol", "name"],
+    "items": [["600000.SH", "20240103", 10.5, None, "浦发银行"], ["600000.SH", "20240102", 10, 2000, "浦发银行"]],
+}
+
+def test_decode_types_and_mappings():
+    data = decode(RESPONSE, rename={"trade_date": "date", "vol": "volume"}, drop=["name"])
+
+    assert list(data.columns) == ["ts_code", "date", "close", "volume"]
+    assert isinstance(data["ts_code"].dtype, pd.CategoricalDtype)
+    assert data["close"].dtype == "float64"
+    assert data["close"].tolist() == [10.5, 10.0]
+    assert data["volume"].isna().tolist() == [True, False]
+    assert data["date"].tolist() == ["20240103", "20240102"]
+
+def test_decode_dates_and_integers():
+    data = decode(RESPONSE, types={"trade_date": DATE, "vol": INT, "close": YYYYMMDD})
+
+    assert data["trade_date"].tolist() == [pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-02")]
+    assert str(data["vol"].dtype) == "Int64"
+    assert data["close"].dtype == "int32"
+
+def test_columns_that_do_not_convert_are_kept():
+    response = {"fields": ["ts_code", "close", "vol"],
+                "items": [["600000.SH", 10.5, "-"], ["600000.SH", "-", 2000]]}
+    data = decode(response, types={"vol": INT})
+
+    assert data["close"].dtype == object
+    assert data["close"].tolist() == [10.5, "-"]
+    assert data["vol"].tolist() == ["-", 2000]
+    frame = pd.DataFrame(response["items"], columns=response["fields"])
+    assert decode_frame(frame, types={"vol": INT})["vol"].tolist() == ["-", 2000]
+
+def test_empty_responses():
+    assert decode(None).empty
+    assert list(decode({"fields": ["ts_code", "name"], "items": []}, drop=["name"]).columns) == ["ts_code"]
+
+def test_decode_frame_matches_decode():
+    frame = pd.DataFrame(RESPONSE["items"], columns=RESPONSE["fields"])
+    mappings = {"rename": {"trade_date": "date"}, "drop": ["name"]}
+
+    expected = decode(RESPONSE, **mappings)
+    pd.testing.assert_frame_equal(decode_frame(frame, **mappings), expected, check_dtype=False)
+    assert loads(b'{"code": 0}') == {"code": 0}